@@ -0,0 +1,99 @@
+"""
+Latency of the project construction without Github (deferred authentication).
+
+A local server stands in for the Github API with a configurable latency. The script measures:
+
+- the construction of projects without Github settings (the client is never created);
+- the same constructions with an authentication per project, like the constructor did before;
+- projects with Github settings, which authenticate only once per process.
+
+Usage: python benchmarks/github_auth.py [--projects N] [--latency SECONDS]
+"""
+import argparse
+import functools
+import http.server
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class GithubAPIHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.1
+    requests = 0
+
+    def do_GET(self):
+        type(self).requests += 1
+        time.sleep(self.latency)
+        body = json.dumps({"login": "octocat", "id": 1}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.1,
+                        help="latency of the stand-in Github API in seconds (0.1 by default)")
+    args = parser.parse_args()
+
+    GithubAPIHandler.latency = args.latency
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), GithubAPIHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    parent = tempfile.mkdtemp()
+
+    start = time.perf_counter()
+    from project_automation.projects.c import CProject
+    import_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for index in range(args.projects):
+        CProject(parent, f"project{index}", allow_install=False)
+    deferred_time = time.perf_counter() - start
+    print(f"import of CProject: {import_time * 1000:.1f} ms (github loaded: {'github' in sys.modules})")
+    print(f"{args.projects} projects without Github: {deferred_time * 1000:.1f} ms, "
+          f"{GithubAPIHandler.requests} request(s)")
+
+    import github
+    # the credentials of the environment use the deprecated arguments of the client
+    warnings.simplefilter("ignore", DeprecationWarning)
+    Github = functools.partial(
+        github.Github, base_url=f"http://127.0.0.1:{server.server_port}")
+
+    # previous behaviour: authentication in the constructor of each project
+    start = time.perf_counter()
+    for index in range(args.projects):
+        CProject(parent, f"project{index}", allow_install=False)
+        Github("token").get_user().login
+    eager_time = time.perf_counter() - start
+    print(f"{args.projects} projects authenticating in their constructor: {eager_time * 1000:.1f} ms, "
+          f"{GithubAPIHandler.requests} request(s)")
+
+    GithubAPIHandler.requests = 0
+    github.Github = Github
+    start = time.perf_counter()
+    logins = {CProject(parent, f"project{index}", allow_install=False,
+                       github_settings={"public": False}).user.login
+              for index in range(args.projects)}
+    shared_time = time.perf_counter() - start
+    print(f"{args.projects} projects with Github: {shared_time * 1000:.1f} ms, "
+          f"{GithubAPIHandler.requests} request(s) (users: {', '.join(sorted(logins))})")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Download of the `.gitignore` templates.
+
+A local server stands in for github/gitignore with a configurable latency. The script compares
+the previous sequential download (one ``requests.get`` per template) with `GitIgnoreFetcher`
+(concurrent downloads over a pooled session), then with its cache (fresh templates, no request).
+The cache is created in a temporary folder.
+
+Usage: python benchmarks/gitignore_fetch.py [--latency SECONDS] [--repeat N]
+"""
+import argparse
+import http.server
+import os
+import sys
+import tempfile
+import threading
+import time
+
+os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests  # noqa: E402
+
+from project_automation.gitignore import GitIgnoreCache, GitIgnoreCatalog, GitIgnoreFetcher  # noqa: E402
+
+
+# Languages of some generated projects
+LANGUAGES = [
+    ["Java", "Maven"],
+    ["Node", "Python", "C", "C++"],
+    ["Python", "Go", "Haskell", "Dart", "Java", "Node"],
+]
+
+
+class TemplateHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.1
+    requests = 0
+
+    def do_GET(self):
+        type(self).requests += 1
+        time.sleep(self.latency)
+        name = self.path.rsplit("/", 1)[-1].split(".")[0]
+        if name == "catalog":
+            body = b""
+            self.send_response(404)
+        else:
+            body = (f"# {name}\n" + "*.tmp\n" * 200).encode()
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def sequential(url: str, languages: list) -> str:
+    content = ""
+    for language in languages:
+        response = requests.get(url.format(name=language))
+        if response.status_code == 200:
+            content += response.content.decode("utf-8")
+    return content
+
+
+def concurrent(languages: list) -> str:
+    return "".join(GitIgnoreFetcher.get().fetch_all(languages).values())
+
+
+def mean_time(function, repeat: int, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1,
+                        help="latency of the stand-in server in seconds (0.1 by default)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    TemplateHandler.latency = args.latency
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TemplateHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/{{name}}.gitignore"
+    GitIgnoreFetcher.CONFIG['url'] = url
+    GitIgnoreCatalog.CONFIG['url'] = url.format(name="catalog")
+
+    for languages in LANGUAGES:
+        if sequential(url, languages) != concurrent(languages):
+            raise SystemExit(f"{languages}: the contents are different")
+        before = mean_time(sequential, args.repeat, url, languages)
+        # every template is downloaded again
+        GitIgnoreCache.CONFIG['ttl'] = 0
+        after = mean_time(concurrent, args.repeat, languages)
+        GitIgnoreCache.CONFIG['ttl'] = 24 * 60 * 60
+        concurrent(languages)
+        TemplateHandler.requests = 0
+        cached = mean_time(concurrent, args.repeat, languages)
+        print(f"{', '.join(languages)}: sequential {before * 1000:.0f} ms -> concurrent {after * 1000:.0f} ms"
+              f" -> cached {cached * 1e6:.0f} µs ({TemplateHandler.requests} request(s))")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Number of processes spawned to verify the required programs of each project.
+
+With the fast path, the executables are searched in the ``PATH`` without spawning any process and
+a program is only executed when its version is required. Without it, every probe executes its
+command, even when the program is missing (like the shell commands did before). The probe cache is
+ignored and the required programs are never installed.
+
+Usage: python benchmarks/probe_spawns.py
+"""
+import contextlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from unittest import mock
+
+os.environ["XDG_CACHE_HOME"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_automation import projects  # noqa: E402
+from project_automation.commands import CommandProgram, ProbeCache  # noqa: E402
+from project_automation.commands import command_program  # noqa: E402
+
+
+# Project classes with their specific arguments
+PROJECTS = [
+    ("CProject", {}),
+    ("CPPProject", {}),
+    ("DenoProject", {}),
+    ("FlutterProject", {}),
+    ("GolangProject", {}),
+    ("HaskellProject", {}),
+    ("JavaProject", {"package_name": "pkg", "company_name": "acme"}),
+    ("AntProject", {"package_name": "pkg", "company_name": "acme"}),
+    ("MavenProject", {"package_name": "pkg", "company_name": "acme"}),
+    ("NodeJSProject", {}),
+    ("ReactJSProject", {}),
+    ("WebpackJSProject", {}),
+    ("PHPWebsiteProject", {}),
+    ("PythonProject", {"use_env": False}),
+    ("CythonProject", {"use_env": False}),
+    ("SimpleWebsiteProject", {}),
+    ("TypescriptWebsiteProject", {}),
+]
+
+
+class SpawnCounter:
+    """
+    Count the processes created with `subprocess.Popen` (also used by `asyncio.create_subprocess_exec`).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def patch(self):
+        popen_init = subprocess.Popen.__init__
+
+        def counting_init(popen, *args, **kwargs):
+            with self.lock:
+                self.count += 1
+            return popen_init(popen, *args, **kwargs)
+
+        return mock.patch.object(subprocess.Popen, "__init__", counting_init)
+
+
+def count_spawns(klass: type, kwargs: dict, fast_path: bool) -> int:
+    counter = SpawnCounter()
+    patches = [counter.patch()]
+    if not fast_path:
+        patches += [
+            mock.patch.object(CommandProgram, "PROBE_EXECUTION", True),
+            # the missing programs are executed too
+            mock.patch.object(command_program, "resolve_executable",
+                              lambda cmd: shutil.which(cmd.split()[0]) or cmd.split()[0]),
+        ]
+    with contextlib.ExitStack() as stack:
+        for patch in patches:
+            stack.enter_context(patch)
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+        project = klass(path=tempfile.gettempdir(), name="project",
+                        allow_install=False, **kwargs)
+        try:
+            project.verify_requirements()
+        except SystemExit:
+            # some required programs are missing
+            pass
+    return counter.count
+
+
+def main():
+    ProbeCache.CONFIG['refresh'] = True
+    total_without = total_with = 0
+    print(f"{'project':<26}{'without fast path':>18}{'with fast path':>16}")
+    for name, kwargs in PROJECTS:
+        klass = getattr(projects, name)
+        without = count_spawns(klass, kwargs, fast_path=False)
+        with_fast_path = count_spawns(klass, kwargs, fast_path=True)
+        total_without += without
+        total_with += with_fast_path
+        print(f"{name:<26}{without:>18}{with_fast_path:>16}")
+    print(f"{'total':<26}{total_without:>18}{total_with:>16}")
+    print(f"spawns saved: {total_without - total_with}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Serialization of large generated `build.xml` and `pom.xml` documents.
+
+The single-pass serializer of `XMLFile` is compared with the previous round trip
+(``ElementTree.tostring``, parsing with minidom, ``toprettyxml`` and replacement of the first line
+by the doctype). Both outputs must be identical.
+
+Usage: python benchmarks/xml_serialization.py [--targets N] [--dependencies N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+import xml.dom.minidom
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_automation.files.xml_file import XMLFile  # noqa: E402
+
+
+def minidom_prettify(elem: ET.Element, doctype: str = None) -> str:
+    data = ET.tostring(elem, **XMLFile.CONFIG['xml_tostring'])
+    string = xml.dom.minidom.parseString(data).toprettyxml(
+        XMLFile.CONFIG['indentation'])
+    if doctype is not None:
+        lines = string.split("\n")
+        lines[0] = doctype
+        string = "\n".join(lines)
+    return string
+
+
+def build_ant(targets: int) -> ET.Element:
+    root = ET.Element(
+        "project", attrib={"name": "project", "default": "run", "basedir": "."})
+    for index in range(targets):
+        ET.SubElement(root, "property", attrib={
+                      "name": f"property{index}.dir", "value": f"${{basedir}}/src/{index}"})
+        target = ET.SubElement(
+            root, "target", attrib={"name": f"target{index}", "depends": "init"})
+        target.append(ET.Comment(f" target {index} "))
+        javac = ET.SubElement(target, "javac", attrib={
+                              "srcdir": "${src.dir}", "destdir": "${bin.dir}", "includeantruntime": "false"})
+        ET.SubElement(javac, "classpath", attrib={"refid": "project.classpath"})
+        ET.SubElement(target, "echo").text = f"Building <{index}> & co"
+    return root
+
+
+def build_pom(dependencies: int) -> ET.Element:
+    root = ET.Element("project")
+    ET.SubElement(root, "modelVersion").text = "4.0.0"
+    element = ET.SubElement(root, "dependencies")
+    for index in range(dependencies):
+        dependency = ET.SubElement(element, "dependency")
+        for tag, text in (("groupId", f"org.group{index}"), ("artifactId", f"artifact{index}"),
+                          ("version", "1.0.0"), ("scope", "test")):
+            ET.SubElement(dependency, tag).text = text
+    return root
+
+
+def best_time(function, root: ET.Element, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(root)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--targets", type=int, default=5000)
+    parser.add_argument("--dependencies", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for name, root in (("build.xml", build_ant(args.targets)), ("pom.xml", build_pom(args.dependencies))):
+        expected = minidom_prettify(root)
+        if XMLFile.prettify(root) != expected:
+            raise SystemExit(f"{name}: the outputs are different")
+        before = best_time(minidom_prettify, root, args.repeat)
+        after = best_time(XMLFile.prettify, root, args.repeat)
+        print(f"{name} ({len(expected) / 1e6:.1f} MB, identical): minidom {before * 1000:.0f} ms"
+              f" -> single pass {after * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
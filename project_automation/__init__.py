@@ -4,9 +4,13 @@ from .__version__ import __version__
 __all__ = [
     'commands',
     'files',
+    'gitignore',
     'licenses',
     'main',
+    'manifest',
     'projects',
-    'settings'
+    'runner',
+    'templates',
+    'settings',
     'utils',
 ]
@@ -1,22 +1,43 @@
+import importlib
+from typing import Any
+
 # Base files
 from .command_program import CommandProgram
+from .package_index import PackageIndexStamp
+from .planner import InstallPlanner
+from .probe import ProbeEngine
+from .probe_cache import ProbeCache
 
-from .c import GCCCommand
-from .cpp import GPPCommand
-from .deno import DenoCommand
-from .flutter import FlutterCommand
-from .github import GitCommand
-from .go import GoCommand
-from .haskell import GHCCommand
-from .java import AntCommand, JavaCommand, JavacCommand, MavenCommand
-from .nodejs import NPMCommand, NPXCommand
-from .php import PHPCommand
-from .python import PythonCommand, PythonPipCommand, PythonPipenvCommand, PythonVirtualEnvCommand
-from .typescript import TypescriptCommand
+# Other commands are imported on first access only
+_LAZY_IMPORTS = {
+    'GCCCommand': '.c',
+    'GPPCommand': '.cpp',
+    'DenoCommand': '.deno',
+    'FlutterCommand': '.flutter',
+    'GitCommand': '.github',
+    'GoCommand': '.go',
+    'GHCCommand': '.haskell',
+    'AntCommand': '.java',
+    'JavaCommand': '.java',
+    'JavacCommand': '.java',
+    'MavenCommand': '.java',
+    'NPMCommand': '.nodejs',
+    'NPXCommand': '.nodejs',
+    'PHPCommand': '.php',
+    'PythonCommand': '.python',
+    'PythonPipCommand': '.python',
+    'PythonPipenvCommand': '.python',
+    'PythonVirtualEnvCommand': '.python',
+    'TypescriptCommand': '.typescript',
+}
 
 
 __all__ = [
     'CommandProgram',
+    'InstallPlanner',
+    'PackageIndexStamp',
+    'ProbeCache',
+    'ProbeEngine',
 
     'AntCommand',
     'DenoCommand',
@@ -38,3 +59,29 @@ __all__ = [
     'PythonVirtualEnvCommand',
     'TypescriptCommand',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the module associated to the name on first access.
+
+    Parameters
+    ----------
+    name : str
+        name of the attribute to get
+
+    Returns
+    -------
+    value : Any
+        the attribute imported from its module
+
+    Raises
+    ------
+    AttributeError
+        when the name is not available in the module
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,17 +1,68 @@
+import re
+import shlex
+import shutil
 import sys
-from typing import NoReturn
+from typing import Any, NoReturn
 
 from project_automation.settings import SHELL_COLORS
-from project_automation.utils import execute_command
+from .probe import ProbeEngine
+from .probe_cache import ProbeCache
 from .utils import WindowsInstallationPackage, MacOSInstallationPackage, GNULinuxDistributionInstallationPackage
 
 
+VERSION_PATTERN = re.compile(r"\d+(?:\.\d+)+")
+
+
+def resolve_executable(cmd: str) -> Any:
+    """
+    Search in-process the executable of a command in the ``PATH`` environment variable.
+
+    Parameters
+    ----------
+    cmd : str
+        command line to resolve (only the first word is used)
+
+    Returns
+    -------
+    executable : str or None
+        path of the executable with its extension (like ``npm.cmd`` on Windows), None if it is not found
+    """
+    words = shlex.split(cmd)
+    return shutil.which(words[0]) if words else None
+
+
 class CommandProgram:
     """
     Command to verify if its recognized by the operating system.
     If its not verify, the class install it automatically if you want.
+
+    Attributes
+    ----------
+    cmd_to_test : str
+        command to test
+    allow_install : bool
+        True if you want to automatically install the required package, False otherwise
+    windows_installer : project_automation.commands.utils.WindowsInstallationPackage
+        installer for Windows
+    macos_installer : project_automation.commands.utils.MacOSInstallationPackage
+        installer for MacOS
+    linux_installer : project_automation.commands.utils.GNULinuxDistributionInstallationPackage
+        installer for GNU/Linux
+    version : str
+        version parsed from the output of the probe (None if not probed or not found)
+
+    Notes
+    -----
+    The executable is searched in the ``PATH`` without spawning any process. The command is
+    only executed when its version is required or when ``PROBE_EXECUTION`` is True (the command
+    checks more than the existence of the executable, like a Python module).
+
+    If a `ProbeEngine` is active, the command is registered in it and verified later
+    with the other commands. Otherwise, it is verified immediately.
     """
 
+    PROBE_EXECUTION = False
+
     def __init__(self,
                  cmd_to_test: str,
                  allow_install: bool,
@@ -34,15 +85,116 @@ class CommandProgram:
         linux_installer : project_automation.exceptions.utils.GNULinuxDistributionInstallationPackage
             installer for GNU/Linux
         """
-        code, _, _ = execute_command(cmd_to_test)
-        if code != 0:
-            if not allow_install:
-                print(
-                    f"{SHELL_COLORS['red']}Error : You cannot continue without install this package at least !{SHELL_COLORS['endcolor']}")
-                sys.exit(1)
-            if sys.platform == 'win32':
-                windows_installer.install(allow_install)
-            elif sys.platform == 'darwin':
-                macos_installer.install(allow_install)
-            else:
-                linux_installer.install(allow_install)
+        self.cmd_to_test = cmd_to_test
+        self.allow_install = allow_install
+        self.windows_installer = windows_installer
+        self.macos_installer = macos_installer
+        self.linux_installer = linux_installer
+        self.version = None
+        engine = ProbeEngine.current()
+        if engine is not None:
+            engine.add(self)
+        else:
+            self.verify()
+
+    def probe(self, timeout: int = None, require_version: bool = False) -> bool:
+        """
+        Verify if the command is recognized by the operating system.
+        The command is only executed if needed and its result is taken from the persistent cache
+        when the executable is unchanged.
+
+        Parameters
+        ----------
+        timeout : int
+            number of seconds to wait for the command (no limit if None)
+        require_version : bool
+            True to execute the command to get its version, False otherwise
+
+        Returns
+        -------
+        found : bool
+            True if the command works, False otherwise (or if the probe timed out)
+
+        See also
+        --------
+        resolve_executable, ProbeCache
+        """
+        executable = resolve_executable(self.cmd_to_test)
+        if executable is None:
+            return False
+        if not require_version and not self.PROBE_EXECUTION:
+            return True
+        cache = ProbeCache.get()
+        fingerprint = cache.fingerprint(executable)
+        entry = cache.lookup(self.cmd_to_test, fingerprint)
+        if entry is not None and (entry['version'] is not None or not require_version):
+            self.version = entry['version']
+            return entry['code'] == 0
+        from project_automation.runner import CommandRunner
+
+        print(f"Executing `{self.cmd_to_test}` command ...")
+        # the resolved path is executed (like the `.cmd` shims of npm on Windows, without a shell)
+        try:
+            result = CommandRunner.run(
+                [executable] + shlex.split(self.cmd_to_test)[1:], timeout=timeout)
+        except OSError:
+            return False
+        if result.timed_out:
+            return False
+        match = VERSION_PATTERN.search("\n".join(result.stdout + result.stderr))
+        self.version = match.group(0) if match is not None else None
+        if result.returncode == 0:
+            cache.store(self.cmd_to_test, fingerprint,
+                        result.returncode, self.version)
+        return result.returncode == 0
+
+    def get_version(self) -> tuple:
+        """
+        Return the version of the command, executing it if it is not known yet.
+
+        Returns
+        -------
+        version : tuple of integers
+            the version of the command, empty if it is not found
+        """
+        if self.version is None:
+            self.probe(require_version=True)
+            ProbeCache.get().save()
+        if self.version is None:
+            return ()
+        return tuple(int(number) for number in self.version.split('.'))
+
+    def verify(self) -> NoReturn:
+        """
+        Verify if the command is recognized and install it if needed.
+        """
+        found = self.probe()
+        ProbeCache.get().save()
+        if not found:
+            self.install()
+
+    def get_installer(self) -> Any:
+        """
+        Return the installer of the current operating system.
+
+        Returns
+        -------
+        installer : project_automation.commands.utils.InstallationPackage
+            the Windows, MacOS or GNU/Linux installer
+        """
+        if sys.platform == 'win32':
+            return self.windows_installer
+        elif sys.platform == 'darwin':
+            return self.macos_installer
+        return self.linux_installer
+
+    def install(self) -> NoReturn:
+        """
+        Install the command with the installer of the current operating system.
+        Exit the program if the installation is not allowed.
+        """
+        if not self.allow_install:
+            print(
+                f"{SHELL_COLORS['red']}Error : You cannot continue without install this package at least !{SHELL_COLORS['endcolor']}")
+            sys.exit(1)
+        self.get_installer().install(self.allow_install)
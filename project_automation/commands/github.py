@@ -19,7 +19,7 @@ class GitCommand(CommandProgram):
         allow_install : bool
             True if you want to automatically install the required package, False otherwise
         update_package_manager : bool
-            allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+            allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
         """
         windows = WindowsInstallationPackage(
             windows_download_link="https://git-scm.com/download/win",
@@ -0,0 +1,157 @@
+import os
+import threading
+import time
+from typing import NoReturn
+
+from project_automation.settings import CACHE_DIR, SHELL_COLORS
+from project_automation.utils import execute_command2, read_from_json_file, write_in_json_file
+
+
+# Commands to refresh the index of each package manager (without upgrading any installed package)
+# Pacman has none because installing after a bare `pacman -Sy` is a partial upgrade
+INDEX_COMMANDS = {
+    "apt-get": ("sudo apt-get update",),
+    "dnf": ("sudo dnf makecache",),
+    "yum": ("sudo yum makecache",),
+    "pacman": (),
+    "brew": ("brew update",),
+    "scoop": ("scoop update",),
+    "choco": (),
+    "winget": ("winget source update",),
+}
+
+# Commands to upgrade all the packages installed in the system, only run on explicit opt-in
+UPGRADE_COMMANDS = {
+    "apt-get": ("sudo apt-get upgrade",),
+    "dnf": ("sudo dnf upgrade",),
+    "yum": ("sudo yum upgrade",),
+    "pacman": ("sudo pacman -Syu",),
+    "brew": ("brew upgrade",),
+    "scoop": ("scoop update *",),
+    "choco": ("choco upgrade chocolatey",),
+    "winget": (),
+}
+
+
+class PackageIndexStamp:
+    """
+    Freshness policy of the package manager indexes.
+
+    The time of the last refresh of each package manager index is recorded in a stamp file
+    and the index is not refreshed again while it is younger than ``CONFIG['max_age']`` seconds.
+    The packages installed in the system are only upgraded if ``CONFIG['upgrade']`` is True.
+
+    Attributes
+    ----------
+    filename : str
+        path of the JSON stamp file
+    stamps : dict
+        time of the last refresh indexed by package manager
+    """
+
+    CONFIG = {
+        "filename": os.path.join(CACHE_DIR, "package_index.json"),
+        "max_age": 24 * 60 * 60,
+        "upgrade": False,
+    }
+
+    _lock = threading.Lock()
+
+    def __init__(self, filename: str = None) -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        filename : str
+            path of the JSON stamp file (``CONFIG['filename']`` if None)
+        """
+        self.filename = filename if filename is not None else self.CONFIG['filename']
+        self.stamps = {}
+        try:
+            self.stamps = read_from_json_file(self.filename)
+        except (OSError, ValueError):
+            pass
+
+    def is_fresh(self, package_manager: str) -> bool:
+        """
+        Verify if the index of a package manager was refreshed recently.
+
+        Parameters
+        ----------
+        package_manager : str
+            name of the package manager
+
+        Returns
+        -------
+        fresh : bool
+            True if the index was refreshed less than ``CONFIG['max_age']`` seconds ago, False otherwise
+        """
+        stamp = self.stamps.get(package_manager)
+        return stamp is not None and 0 <= time.time() - stamp <= self.CONFIG['max_age']
+
+    def touch(self, package_manager: str) -> NoReturn:
+        """
+        Record that the index of a package manager was just refreshed.
+
+        Parameters
+        ----------
+        package_manager : str
+            name of the package manager
+        """
+        with self._lock:
+            self.stamps[package_manager] = time.time()
+            try:
+                os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+                tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+                write_in_json_file(tmp_filename, self.stamps)
+                os.replace(tmp_filename, self.filename)
+            except OSError:
+                pass
+
+    def get_refresh_commands(self, package_manager: str) -> list:
+        """
+        Return the commands to run before an installation with a package manager.
+
+        Parameters
+        ----------
+        package_manager : str
+            name of the package manager
+
+        Returns
+        -------
+        commands : list of strings
+            the index refresh commands if the index is stale, followed by the upgrade commands if allowed
+        """
+        commands = []
+        if not self.is_fresh(package_manager):
+            commands.extend(INDEX_COMMANDS.get(package_manager, ()))
+        if self.CONFIG['upgrade']:
+            commands.extend(UPGRADE_COMMANDS.get(package_manager, ()))
+        return commands
+
+    def refresh(self, package_manager: str) -> bool:
+        """
+        Refresh the index of a package manager if it is stale (and upgrade the system if allowed).
+        The stamp is only updated if every command succeeds, otherwise the index is refreshed again next time.
+
+        Parameters
+        ----------
+        package_manager : str
+            name of the package manager
+
+        Returns
+        -------
+        success : bool
+            False if a command failed, True otherwise
+        """
+        commands = self.get_refresh_commands(package_manager)
+        for command in commands:
+            returncode = execute_command2(command)
+            if returncode != 0:
+                print(
+                    f"{SHELL_COLORS['yellow']}Warning : the index of {package_manager} cannot be refreshed ('{command}' exited with {returncode}){SHELL_COLORS['endcolor']}")
+                return False
+        if commands:
+            self.touch(package_manager)
+        return True
@@ -0,0 +1,111 @@
+from typing import Any, NoReturn
+
+from project_automation.utils import execute_command2
+from .package_index import PackageIndexStamp
+from .utils import BATCH_INSTALL_COMMANDS, SETUP_COMMANDS, parse_install_command
+
+
+class InstallPlanner:
+    """
+    Gather the installations of several missing commands to run them in one transaction per package manager.
+
+    The packages are deduplicated and each package manager is set up and refreshed at most once
+    (only if its index is stale, see `PackageIndexStamp`).
+    The commands which cannot be installed with a simple package manager command (download link,
+    shell script, winget, ...) fall back to their own installer.
+
+    Attributes
+    ----------
+    batches : dict
+        options, packages and refresh flag of the installation of each package manager
+    fallbacks : list of CommandProgram
+        commands installed one by one with their own installer
+    """
+
+    def __init__(self) -> NoReturn:
+        """
+        Constructor and initializer.
+        """
+        self.batches = {}
+        self.fallbacks = []
+
+    def add(self, command: Any) -> NoReturn:
+        """
+        Plan the installation of a missing command.
+
+        Parameters
+        ----------
+        command : CommandProgram
+            command to install
+        """
+        installer = command.get_installer()
+        package_manager, install_command = installer.get_package_command()
+        if package_manager not in BATCH_INSTALL_COMMANDS:
+            self.fallbacks.append(command)
+            return
+        try:
+            options, packages = parse_install_command(install_command)
+        except ValueError:
+            self.fallbacks.append(command)
+            return
+        batch = self.batches.setdefault(
+            package_manager, {"options": [], "packages": [], "update": False})
+        for option in options:
+            if option not in batch['options']:
+                batch['options'].append(option)
+        for package in packages:
+            if package not in batch['packages']:
+                batch['packages'].append(package)
+        batch['update'] = batch['update'] or installer.update_package_manager
+
+    def get_install_command(self, package_manager: str) -> str:
+        """
+        Return the single installation command of a package manager.
+
+        Parameters
+        ----------
+        package_manager : str
+            name of the planned package manager
+
+        Returns
+        -------
+        command : str
+            command installing all the planned packages of the package manager
+        """
+        batch = self.batches[package_manager]
+        arguments = " ".join(batch['options'] + batch['packages'])
+        return f"{BATCH_INSTALL_COMMANDS[package_manager]} {arguments}"
+
+    def get_commands(self) -> list:
+        """
+        Return the commands of the batched installations.
+
+        Returns
+        -------
+        commands : list of strings
+            setup, refresh and installation commands of each package manager, in order
+        """
+        stamp = PackageIndexStamp()
+        commands = []
+        for package_manager, batch in self.batches.items():
+            commands.extend(SETUP_COMMANDS.get(package_manager, ()))
+            if batch['update']:
+                commands.extend(stamp.get_refresh_commands(package_manager))
+            commands.append(self.get_install_command(package_manager))
+        return commands
+
+    def run(self) -> NoReturn:
+        """
+        Run the batched installations then the installations of the remaining commands.
+        """
+        stamp = PackageIndexStamp()
+        for package_manager, batch in self.batches.items():
+            for setup_command in SETUP_COMMANDS.get(package_manager, ()):
+                execute_command2(setup_command)
+            if batch['update']:
+                stamp.refresh(package_manager)
+            execute_command2(self.get_install_command(package_manager))
+        for command in self.fallbacks:
+            command.install()
+        self.batches = {}
+        self.fallbacks = []
@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Any, NoReturn
+
+from project_automation.settings import SHELL_COLORS
+from .planner import InstallPlanner
+from .probe_cache import ProbeCache
+
+
+class ProbeEngine:
+    """
+    Collect the commands to verify and probe them concurrently.
+
+    While the engine is active (in a ``with`` statement), each created `CommandProgram` is
+    registered instead of being verified. On exit, all the probes run in a thread pool and
+    all the missing commands are reported at once before being installed together
+    (see `InstallPlanner`).
+
+    Attributes
+    ----------
+    allow_install : bool
+        True if you want to automatically install the required packages, False otherwise
+    commands : list of CommandProgram
+        registered commands, without duplicated probes
+    """
+
+    CONFIG = {
+        "timeout": 30,
+        "max_workers": 8,
+    }
+
+    _local = threading.local()
+
+    def __init__(self, allow_install: bool) -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        allow_install : bool
+            True if you want to automatically install the required packages, False otherwise
+        """
+        self.allow_install = allow_install
+        self.commands = []
+
+    @classmethod
+    def current(cls) -> Any:
+        """
+        Return the active engine of the current thread.
+
+        Returns
+        -------
+        engine : ProbeEngine or None
+            the innermost active engine, None if there is no active engine
+        """
+        stack = getattr(cls._local, "stack", [])
+        return stack[-1] if stack else None
+
+    def __enter__(self) -> Any:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        self._local.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> NoReturn:
+        self._local.stack.remove(self)
+        if exc_type is None:
+            self.run()
+
+    def add(self, command: Any) -> NoReturn:
+        """
+        Register a command to verify.
+
+        Parameters
+        ----------
+        command : CommandProgram
+            command to verify
+        """
+        if all(command.cmd_to_test != other.cmd_to_test for other in self.commands):
+            self.commands.append(command)
+
+    def probe(self, command: Any) -> bool:
+        """
+        Verify if the command is recognized by the operating system.
+
+        Parameters
+        ----------
+        command : CommandProgram
+            command to verify
+
+        Returns
+        -------
+        found : bool
+            True if the command works, False otherwise (or if the probe timed out)
+        """
+        return command.probe(self.CONFIG['timeout'])
+
+    def run(self) -> NoReturn:
+        """
+        Probe all the registered commands concurrently and install the missing ones.
+        """
+        if not self.commands:
+            return
+        max_workers = min(self.CONFIG['max_workers'], len(self.commands))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.probe, self.commands))
+        ProbeCache.get().save()
+        missing = [command for command, found in zip(
+            self.commands, results) if not found]
+        self.commands = []
+        if not missing:
+            return
+        print(f"{SHELL_COLORS['red']}Missing commands :{SHELL_COLORS['endcolor']}")
+        for command in missing:
+            print(f"- {command.cmd_to_test.split()[0]}")
+        if not self.allow_install:
+            missing[0].install()
+        planner = InstallPlanner()
+        for command in missing:
+            planner.add(command)
+        planner.run()
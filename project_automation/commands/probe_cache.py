@@ -0,0 +1,160 @@
+import os
+import threading
+import time
+from typing import Any, NoReturn
+
+from project_automation.settings import CACHE_DIR
+from project_automation.utils import read_from_json_file, write_in_json_file
+
+
+class ProbeCache:
+    """
+    Persistent cache of the successful command probes.
+
+    An entry is only valid while the resolved executable (path, modification time and inode)
+    and the ``PATH`` environment variable are unchanged, and while its TTL is not expired.
+
+    Attributes
+    ----------
+    filename : str
+        path of the JSON file of the cache
+    entries : dict
+        cached probes indexed by the tested command
+    """
+
+    CONFIG = {
+        "filename": os.path.join(CACHE_DIR, "toolchains.json"),
+        "ttl": 24 * 60 * 60,
+        "refresh": False,
+    }
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, filename: str) -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        filename : str
+            path of the JSON file of the cache
+        """
+        self.filename = filename
+        self.entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            self.entries = read_from_json_file(filename)
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def get(cls) -> Any:
+        """
+        Return the cache shared by the whole process.
+
+        Returns
+        -------
+        cache : ProbeCache
+            the shared cache
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(cls.CONFIG['filename'])
+            return cls._instance
+
+    @staticmethod
+    def fingerprint(executable: str) -> Any:
+        """
+        Return the fingerprint of an executable.
+
+        Parameters
+        ----------
+        executable : str
+            path of the executable
+
+        Returns
+        -------
+        fingerprint : dict or None
+            resolved path, modification time and inode of the executable with the ``PATH`` value,
+            None if the executable cannot be accessed
+        """
+        try:
+            stat = os.stat(executable)
+        except OSError:
+            return None
+        return {
+            "path": os.path.realpath(executable),
+            "mtime": stat.st_mtime_ns,
+            "inode": stat.st_ino,
+            "PATH": os.environ.get("PATH", ""),
+        }
+
+    def lookup(self, cmd_to_test: str, fingerprint: dict) -> Any:
+        """
+        Return the cached probe of a command if it is still valid.
+
+        Parameters
+        ----------
+        cmd_to_test : str
+            command to test
+        fingerprint : dict
+            current fingerprint of the executable
+
+        Returns
+        -------
+        entry : dict or None
+            the cached exit code and version, None if there is no valid entry
+        """
+        if self.CONFIG['refresh'] or fingerprint is None:
+            return None
+        with self._lock:
+            entry = self.entries.get(cmd_to_test)
+        if entry is None or entry['fingerprint'] != fingerprint:
+            return None
+        if time.time() - entry['time'] > self.CONFIG['ttl']:
+            return None
+        return entry
+
+    def store(self, cmd_to_test: str, fingerprint: dict, code: int, version: str) -> NoReturn:
+        """
+        Store the result of a probe.
+
+        Parameters
+        ----------
+        cmd_to_test : str
+            command to test
+        fingerprint : dict
+            current fingerprint of the executable
+        code : int
+            returned code of the probe
+        version : str
+            parsed version of the command (None if not found)
+        """
+        if fingerprint is None:
+            return
+        with self._lock:
+            self.entries[cmd_to_test] = {
+                "fingerprint": fingerprint,
+                "code": code,
+                "version": version,
+                "time": time.time(),
+            }
+            self._dirty = True
+
+    def save(self) -> NoReturn:
+        """
+        Write the cache on the disk if it was modified.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+                tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+                write_in_json_file(tmp_filename, self.entries)
+                os.replace(tmp_filename, self.filename)
+                self._dirty = False
+            except OSError:
+                pass
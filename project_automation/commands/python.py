@@ -22,7 +22,7 @@ class GeneralPythonCommand(CommandProgram):
         allow_install : bool
             True if you want to automatically install the required package, False otherwise
         update_package_manager : bool
-            allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+            allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
         """
         windows = WindowsInstallationPackage(
             windows_download_link="https://www.python.org/downloads/",
@@ -62,7 +62,7 @@ class PythonCommand(GeneralPythonCommand):
         allow_install : bool
             True if you want to automatically install the required package, False otherwise
         update_package_manager : bool
-            allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+            allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
         """
         super().__init__(f"{'python' if sys.platform == 'win32' else 'python3'} --version",
                          allow_install, update_package_manager)
@@ -83,18 +83,20 @@ class PythonPipCommand(GeneralPythonCommand):
         allow_install : bool
             True if you want to automatically install the required package, False otherwise
         update_package_manager : bool
-            allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+            allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
         """
         super().__init__(f"{'pip' if sys.platform == 'win32' else 'pip3'} --version",
                          allow_install, update_package_manager)
 
 
-class PythonVirtualEnvCommand(GeneralPythonCommand):
+class PythonVirtualEnvCommand(CommandProgram):
     """
     Command to verify if ``python -m venv`` or ``python3 -m venv`` command is recognized by the operating system.
     If its not verify, the class install it automatically if you want.
     """
 
+    PROBE_EXECUTION = True
+
     def __init__(self, allow_install: bool, update_package_manager: bool = True) -> NoReturn:
         """
         Constructor and initializer.
@@ -104,7 +106,7 @@ class PythonVirtualEnvCommand(GeneralPythonCommand):
         allow_install : bool
             True if you want to automatically install the required package, False otherwise
         update_package_manager : bool
-            allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+            allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
         """
         windows = WindowsInstallationPackage(
             standard_command="python -m pip install virtualenv",
@@ -139,7 +141,7 @@ class PythonPipenvCommand(CommandProgram):
         allow_install : bool
             True if you want to automatically install the required package, False otherwise
         update_package_manager : bool
-            allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+            allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
         """
         windows = WindowsInstallationPackage(
             standard_command="python -m pip install pipenv",
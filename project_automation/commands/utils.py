@@ -1,11 +1,215 @@
+import functools
+import re
+import shutil
 import sys
 from typing import NoReturn
 
 from project_automation.settings import SHELL_COLORS
-from project_automation.utils import execute_command, execute_command2
+from project_automation.utils import execute_command2
+from .package_index import PackageIndexStamp
 
 
-class WindowsInstallationPackage:
+# Package managers to search for each platform, in order of preference
+PACKAGE_MANAGERS = {
+    "win32": ("scoop", "choco", "winget"),
+    "darwin": ("brew",),
+    "linux": ("apt-get", "dnf", "yum", "pacman"),
+}
+
+# Native package managers of the GNU/Linux distributions (``ID`` and ``ID_LIKE`` of the os-release file)
+DISTRIBUTION_PACKAGE_MANAGERS = {
+    "debian": ("apt-get",),
+    "ubuntu": ("apt-get",),
+    "fedora": ("dnf", "yum"),
+    "rhel": ("dnf", "yum"),
+    "centos": ("dnf", "yum"),
+    "arch": ("pacman",),
+}
+
+# Commands to run before any installation with a package manager
+SETUP_COMMANDS = {
+    "scoop": ("scoop bucket add extras",),
+}
+
+# Commands to install several packages in a single transaction
+# (winget only installs one package per command so it is not batched)
+BATCH_INSTALL_COMMANDS = {
+    "apt-get": "sudo apt-get install",
+    "dnf": "sudo dnf install",
+    "yum": "sudo yum install",
+    "pacman": "sudo pacman -S",
+    "brew": "brew install",
+    "scoop": "scoop install",
+    "choco": "choco install",
+}
+
+INSTALL_COMMAND_PATTERN = re.compile(
+    r"^(?:sudo\s+)?(?:apt-get|apt|dnf|yum|pacman|brew|scoop|choco)\s+(?:install|-S)\s+(?P<arguments>[\w.+@:=/\s-]+)$")
+
+
+def parse_install_command(command: str) -> tuple:
+    """
+    Split a simple package manager installation command into its options and its packages.
+
+    Parameters
+    ----------
+    command : str
+        installation command (like ``sudo apt-get install -y python3-dev python3-pip``)
+
+    Returns
+    -------
+    options : list of strings
+        options of the command (like ``-y``)
+    packages : list of strings
+        packages to install
+
+    Raises
+    ------
+    ValueError
+        when the command is not a simple installation command (pipes, chained commands, ...)
+    """
+    match = INSTALL_COMMAND_PATTERN.match(command.strip())
+    if match is None:
+        raise ValueError(f"not a simple installation command: {command}")
+    arguments = match.group("arguments").split()
+    options = [argument for argument in arguments if argument.startswith("-")]
+    packages = [argument for argument in arguments if not argument.startswith("-")]
+    if not packages:
+        raise ValueError(f"no package to install: {command}")
+    return options, packages
+
+
+def install_with_package_manager(package_manager: str, command: str, update_package_manager: bool) -> NoReturn:
+    """
+    Run an installation command with its setup and, if needed, the refresh of the package manager.
+
+    Parameters
+    ----------
+    package_manager : str
+        name of the package manager used by the command
+    command : str
+        installation command to run
+    update_package_manager : bool
+        True to refresh the index of the package manager before the installation if it is stale
+
+    See also
+    --------
+    PackageIndexStamp
+    """
+    for setup_command in SETUP_COMMANDS.get(package_manager, ()):
+        execute_command2(setup_command)
+    if update_package_manager:
+        PackageIndexStamp().refresh(package_manager)
+    execute_command2(command)
+
+
+@functools.lru_cache(maxsize=None)
+def read_os_release(filename: str = "/etc/os-release") -> dict:
+    """
+    Read the os-release file of the GNU/Linux distribution.
+
+    Parameters
+    ----------
+    filename : str
+        path of the os-release file
+
+    Returns
+    -------
+    data : dict
+        all the variables of the file (empty if the file does not exist)
+    """
+    data = {}
+    try:
+        with open(filename, "r") as file:
+            for line in file:
+                key, separator, value = line.strip().partition("=")
+                if separator and not key.startswith("#"):
+                    data[key] = value.strip("\"'")
+    except OSError:
+        pass
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def detect_package_managers(platform: str = sys.platform) -> tuple:
+    """
+    Detect once per process the package managers available on the operating system.
+    The executables are searched in the ``PATH`` without spawning any process.
+
+    Parameters
+    ----------
+    platform : str
+        platform of the operating system (like ``sys.platform``)
+
+    Returns
+    -------
+    package_managers : tuple of strings
+        available package managers, the native ones of the distribution first
+    """
+    candidates = PACKAGE_MANAGERS.get(platform, PACKAGE_MANAGERS["linux"])
+    if platform not in ("win32", "darwin"):
+        os_release = read_os_release()
+        distributions = [os_release.get("ID", "")] + \
+            os_release.get("ID_LIKE", "").split()
+        native = [manager for distribution in distributions
+                  for manager in DISTRIBUTION_PACKAGE_MANAGERS.get(distribution, ())]
+        candidates = tuple(dict.fromkeys(native + list(candidates)))
+    return tuple(manager for manager in candidates if shutil.which(manager) is not None)
+
+
+class InstallationPackage:
+    """
+    Base of the package installers.
+    It gives access to the package managers detected on the operating system.
+    """
+
+    PLATFORM = sys.platform
+
+    def get_package_managers(self) -> tuple:
+        """
+        Return the available package managers of the platform.
+
+        Returns
+        -------
+        package_managers : tuple of strings
+            available package managers, the native ones of the distribution first
+
+        See also
+        --------
+        detect_package_managers
+        """
+        return detect_package_managers(self.PLATFORM)
+
+    def get_package_command(self) -> tuple:
+        """
+        Return the package manager and the command to use to install the package/program.
+
+        Returns
+        -------
+        package_manager : str
+            name of the chosen package manager, None if no available package manager can install it
+        command : str
+            installation command of the package manager, None if no available package manager can install it
+        """
+        package_managers = self.get_package_managers()
+        installers = self.get_package_manager_commands()
+        package_manager = next((manager for manager in package_managers
+                                if installers.get(manager) is not None), None)
+        return package_manager, installers.get(package_manager)
+
+    def get_package_manager_commands(self) -> dict:
+        """
+        Return the installation commands indexed by package manager, in order of preference.
+
+        Returns
+        -------
+        installers : dict
+            installation command of each package manager of the platform (None if not referenced)
+        """
+        return {}
+
+
+class WindowsInstallationPackage(InstallationPackage):
     """
     Windows package installer shortcut.
     It allows users to install or give information to install packages/programs on the Windows operating system.
@@ -23,9 +227,11 @@ class WindowsInstallationPackage:
     choco_command : str
         command to install package/program via choco, https://chocolatey.org/
     update_package_manager : bool
-        allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+        allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
     """
 
+    PLATFORM = "win32"
+
     def __init__(self,
                  windows_download_link: str = None,
                  standard_command: str = None,
@@ -49,7 +255,7 @@ class WindowsInstallationPackage:
         choco_command : str
             command to install package/program via choco, https://chocolatey.org/
         update_package_manager : bool
-            allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+            allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
         """
         self.windows_download_link = windows_download_link
         self.standard_command = standard_command
@@ -58,6 +264,13 @@ class WindowsInstallationPackage:
         self.choco_command = choco_command
         self.update_package_manager = update_package_manager
 
+    def get_package_manager_commands(self) -> dict:
+        return {
+            "scoop": self.scoop_command,
+            "choco": self.choco_command,
+            "winget": self.winget_command,
+        }
+
     def install(self, allow_install: bool) -> NoReturn:
         """
         Install the needed package/program.
@@ -68,23 +281,15 @@ class WindowsInstallationPackage:
             True if you want to automatically install the required package, False otherwise
             If the value of this parameter is False, it displays all the possibilities to install the required package
         """
-        code_winget, _, _ = execute_command("winget --version")
-        code_scoop, _, _ = execute_command("scoop help")
-        code_choco, _, _ = execute_command("choco --version")
+        package_managers = self.get_package_managers()
+        has_winget = "winget" in package_managers
+        has_scoop = "scoop" in package_managers
+        has_choco = "choco" in package_managers
+        package_manager, command = self.get_package_command()
         if allow_install:
-            if self.scoop_command is not None and code_scoop == 0:
-                execute_command2("scoop bucket add extras")
-                if self.update_package_manager:
-                    execute_command2("scoop update")
-                    execute_command2("scoop update *")
-                execute_command2(self.scoop_command)
-            elif self.choco_command is not None and code_choco == 0:
-                if self.update_package_manager:
-                    execute_command2("choco upgrade chocolatey")
-                    execute_command2("choco outdated")
-                execute_command2(self.choco_command)
-            elif self.winget_command is not None and code_winget == 0:
-                execute_command2(self.winget_command)
+            if package_manager is not None:
+                install_with_package_manager(
+                    package_manager, command, self.update_package_manager)
             elif self.standard_command is not None:
                 execute_command2(self.standard_command)
             elif self.windows_download_link is not None:
@@ -107,18 +312,18 @@ class WindowsInstallationPackage:
                 if self.standard_command is not None:
                     print(
                         f"\t- Launch the following command : {self.standard_command}")
-                if self.winget_command is not None and code_winget == 0:
+                if self.winget_command is not None and has_winget:
                     print(
                         f"\t- Launch the following command : {self.winget_command}")
-                if self.scoop_command is not None and code_scoop == 0:
+                if self.scoop_command is not None and has_scoop:
                     print(
                         f"\t- Launch the following command : {self.scoop_command}")
-                if self.choco_command is not None and code_choco == 0:
+                if self.choco_command is not None and has_choco:
                     print(
                         f"\t- Launch the following command : {self.choco_command}")
 
 
-class MacOSInstallationPackage:
+class MacOSInstallationPackage(InstallationPackage):
     """
     MacOS package installer shortcut.
     It allows users to install or give information to install packages/programs on the Mac operating system.
@@ -132,9 +337,11 @@ class MacOSInstallationPackage:
     brew_command : str
         command to install package/program via Homebrew, https://brew.sh/
     update_package_manager : bool
-        allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+        allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
     """
 
+    PLATFORM = "darwin"
+
     def __init__(self,
                  macos_download_link: str = None,
                  standard_command: str = None,
@@ -152,13 +359,25 @@ class MacOSInstallationPackage:
         brew_command : str
             command to install package/program via Homebrew, https://brew.sh/
         update_package_manager : bool
-            allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+            allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
         """
         self.macos_download_link = macos_download_link
         self.standard_command = standard_command
         self.brew_command = brew_command
         self.update_package_manager = update_package_manager
 
+    def get_package_manager_commands(self) -> dict:
+        return {"brew": self.brew_command}
+
+    @staticmethod
+    def install_homebrew() -> NoReturn:
+        """
+        Install Homebrew and forget the detected package managers, so it is found by the next installations.
+        """
+        execute_command2(
+            "/bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/master/install.sh)\"")
+        detect_package_managers.cache_clear()
+
     def install(self, allow_install: bool) -> NoReturn:
         """
         Install the needed package/program.
@@ -169,16 +388,12 @@ class MacOSInstallationPackage:
             True if you want to automatically install the required package, False otherwise
             If the value of this parameter is False, it displays all the possibilities to install the required package
         """
-        code_brew, _, _ = execute_command("brew --version")
         if allow_install:
             if self.brew_command is not None:
-                if code_brew != 0:
-                    execute_command2(
-                        "/bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/master/install.sh)\"")
-                if self.update_package_manager:
-                    execute_command2("brew update")
-                    execute_command2("brew upgrade")
-                execute_command2(self.brew_command)
+                if "brew" not in self.get_package_managers():
+                    self.install_homebrew()
+                install_with_package_manager(
+                    "brew", self.brew_command, self.update_package_manager)
             elif self.standard_command is not None:
                 execute_command2(self.standard_command)
             elif self.macos_download_link is not None:
@@ -202,14 +417,13 @@ class MacOSInstallationPackage:
                     print(
                         f"\t- Launch the following command : {self.standard_command}")
                 if self.brew_command is not None:
-                    if code_brew != 0:
-                        execute_command2(
-                            "/bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/master/install.sh)\"")
+                    if "brew" not in self.get_package_managers():
+                        self.install_homebrew()
                     print(
                         f"\t- Launch the following command : {self.brew_command}")
 
 
-class GNULinuxDistributionInstallationPackage:
+class GNULinuxDistributionInstallationPackage(InstallationPackage):
     """
     GNU/Linux package installer shortcut.
     It allows users to install or give information to install packages/programs on the GNU/Linux operating system.
@@ -229,9 +443,11 @@ class GNULinuxDistributionInstallationPackage:
     pacman_command : str
         command to install package/program via Pacman, for ArchLinux-based distrib
     update_package_manager : bool
-        allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+        allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
     """
 
+    PLATFORM = "linux"
+
     def __init__(self,
                  linux_download_link: str = None,
                  standard_command: str = None,
@@ -258,7 +474,7 @@ class GNULinuxDistributionInstallationPackage:
         pacman_command : str
             command to install package/program via Pacman, for ArchLinux-based distrib
         update_package_manager : bool
-            allows this program to automatically update and upgrade all packages installed in the system (via the package manager used)
+            allows this program to refresh the index of the package manager used when it is stale (see `PackageIndexStamp`)
         """
         self.linux_download_link = linux_download_link
         self.standard_command = standard_command
@@ -268,6 +484,14 @@ class GNULinuxDistributionInstallationPackage:
         self.pacman_command = pacman_command
         self.update_package_manager = update_package_manager
 
+    def get_package_manager_commands(self) -> dict:
+        return {
+            "apt-get": self.apt_command,
+            "dnf": self.dnf_command,
+            "yum": self.yum_command,
+            "pacman": self.pacman_command,
+        }
+
     def install(self, allow_install: bool) -> NoReturn:
         """
         Install the needed package/program.
@@ -278,29 +502,11 @@ class GNULinuxDistributionInstallationPackage:
             True if you want to automatically install the required package, False otherwise
             If the value of this parameter is False, it displays all the possibilities to install the required package
         """
-        code_aptget, _, _ = execute_command("apt-get --help")
-        code_dnf, _, _ = execute_command("dnf --help")
-        code_yum, _, _ = execute_command("yum help")
-        code_pacman, _, _ = execute_command("pacman -S --help")
+        package_manager, command = self.get_package_command()
         if allow_install:
-            if self.apt_command is not None and code_aptget == 0:
-                if self.update_package_manager:
-                    execute_command2("sudo apt-get update")
-                    execute_command2("sudo apt-get upgrade")
-                execute_command2(self.apt_command)
-            elif self.dnf_command is not None and code_dnf == 0:
-                if self.update_package_manager:
-                    execute_command2("sudo dnf upgrade")
-                execute_command2(self.dnf_command)
-            elif self.yum_command is not None and code_yum == 0:
-                if self.update_package_manager:
-                    execute_command2("sudo yum update")
-                    execute_command2("sudo yum upgrade")
-                execute_command2(self.yum_command)
-            elif self.pacman_command is not None and code_pacman == 0:
-                if self.update_package_manager:
-                    execute_command2("pacman -Syu")
-                execute_command2(self.pacman_command)
+            if package_manager is not None:
+                install_with_package_manager(
+                    package_manager, command, self.update_package_manager)
             elif self.standard_command is not None:
                 execute_command2(self.standard_command)
             elif self.linux_download_link is not None:
@@ -326,15 +532,6 @@ class GNULinuxDistributionInstallationPackage:
                 if self.standard_command is not None:
                     print(
                         f"\t- Launch the following command : {self.standard_command}")
-                if self.apt_command is not None and code_aptget == 0:
-                    print(
-                        f"\t- Launch the following command : {self.apt_command}")
-                elif self.dnf_command is not None and code_dnf == 0:
-                    print(
-                        f"\t- Launch the following command : {self.dnf_command}")
-                elif self.yum_command is not None and code_yum == 0:
-                    print(
-                        f"\t- Launch the following command : {self.yum_command}")
-                elif self.pacman_command is not None and code_pacman == 0:
+                if package_manager is not None:
                     print(
-                        f"\t- Launch the following command : {self.pacman_command}")
+                        f"\t- Launch the following command : {command}")
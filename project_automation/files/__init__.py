@@ -1,39 +1,51 @@
+import importlib
+from typing import Any
+
 # Base files
+from .content_store import ContentStore
+from .virtual_tree import VirtualTree
 from .file import File
 from .folder import Folder
 from .custom_file_extension import CustomFileExtension
 
-from .bash_file import BashFile
-from .batch_file import BatchFile
-from .c_file import CFile
-from .c_header_file import CHeaderFile
-from .cpp_file import CPPFile
-from .cpp_header_file import CPPHeaderFile
-from .css_file import CSSFile
-from .cython_file import CythonFile
-from .cython_header_file import CythonHeaderFile
-from .gitignore_file import GitIgnoreFile
-from .golang_file import GolangFile
-from .haskell_file import HaskellFile
-from .html_file import HTMLFile
-from .java_file import JavaFile
-from .javascript_file import JavascriptFile
-from .json_file import JSONFile
-from .license_file import LicenseFile
-from .php_file import PHPFile
-from .powershell_file import PowershellFile
-from .python_file import PythonFile
-from .readme_file import ReadMeFile
-from .sass_file import SASSFile
-from .text_file import TextFile
-from .typescript_file import TypescriptFile
-from .xml_file import XMLFile
+# Other files are imported on first access only
+_LAZY_IMPORTS = {
+    'ArchiveWriter': '.archive_writer',
+    'BashFile': '.bash_file',
+    'BatchFile': '.batch_file',
+    'CFile': '.c_file',
+    'CHeaderFile': '.c_header_file',
+    'CPPFile': '.cpp_file',
+    'CPPHeaderFile': '.cpp_header_file',
+    'CSSFile': '.css_file',
+    'CythonFile': '.cython_file',
+    'CythonHeaderFile': '.cython_header_file',
+    'GitIgnoreFile': '.gitignore_file',
+    'GolangFile': '.golang_file',
+    'HaskellFile': '.haskell_file',
+    'HTMLFile': '.html_file',
+    'JavaFile': '.java_file',
+    'JavascriptFile': '.javascript_file',
+    'JSONFile': '.json_file',
+    'LicenseFile': '.license_file',
+    'PHPFile': '.php_file',
+    'PowershellFile': '.powershell_file',
+    'PythonFile': '.python_file',
+    'ReadMeFile': '.readme_file',
+    'SASSFile': '.sass_file',
+    'TextFile': '.text_file',
+    'TypescriptFile': '.typescript_file',
+    'XMLFile': '.xml_file',
+}
 
 
 __all__ = [
     'File',
     'Folder',
     'CustomFileExtension',
+    'ContentStore',
+    'VirtualTree',
+    'ArchiveWriter',
     'BashFile',
     'BatchFile',
     'CFile',
@@ -60,3 +72,29 @@ __all__ = [
     'TypescriptFile',
     'XMLFile',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the module associated to the name on first access.
+
+    Parameters
+    ----------
+    name : str
+        name of the attribute to get
+
+    Returns
+    -------
+    value : Any
+        the attribute imported from its module
+
+    Raises
+    ------
+    AttributeError
+        when the name is not available in the module
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
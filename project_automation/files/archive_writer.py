@@ -0,0 +1,205 @@
+import io
+import os
+import stat
+import tarfile
+import time
+import zipfile
+from typing import Any, BinaryIO, NoReturn
+
+from project_automation.settings import ARCHIVE_FORMATS
+
+
+class ArchiveWriter:
+    """
+    Writer of a `tar` or `zip` archive streamed into a binary file object.
+
+    The members are written in order and the file object is never read nor seeked,
+    so it can be a pipe (like the standard output) as well as a regular file.
+
+    Attributes
+    ----------
+    fileobj : BinaryIO
+        binary stream where the archive is written
+    format : str
+        format of the archive (one of the keys of ``FORMATS``)
+    mtime : float
+        modification time of all the members
+    """
+
+    # Supported formats with their compression (None for a zip archive)
+    FORMATS = ARCHIVE_FORMATS
+
+    def __init__(self, fileobj: BinaryIO, format: str = "tar.gz") -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        fileobj : BinaryIO
+            binary stream where the archive is written (it is not closed with the archive)
+        format : str
+            format of the archive (one of the keys of ``FORMATS``)
+
+        Raises
+        ------
+        ValueError
+            when the format is not supported
+        """
+        if format not in self.FORMATS:
+            raise ValueError(
+                f"unsupported archive format {format!r}, use one of: {', '.join(self.FORMATS)}")
+        self.fileobj = fileobj
+        self.format = format
+        self.mtime = time.time()
+        if self.FORMATS[format] is None:
+            self._zip = zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED)
+            self._tar = None
+        else:
+            self._zip = None
+            self._tar = tarfile.open(
+                fileobj=fileobj, mode=f"w|{self.FORMATS[format]}", format=tarfile.PAX_FORMAT)
+
+    @classmethod
+    def guess_format(cls, filename: str) -> str:
+        """
+        Return the format of an archive from the extension of its filename.
+
+        Parameters
+        ----------
+        filename : str
+            name of the archive
+
+        Returns
+        -------
+        format : str
+            format of the archive, "tar.gz" if the extension is unknown
+        """
+        filename = filename.lower()
+        if filename.endswith(".tgz"):
+            return "tar.gz"
+        for format in sorted(cls.FORMATS, key=len, reverse=True):
+            if filename.endswith(f".{format}"):
+                return format
+        return "tar.gz"
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> NoReturn:
+        self.close()
+
+    def add_folder(self, arcname: str, mode: int = 0o755) -> NoReturn:
+        """
+        Add a folder to the archive.
+
+        Parameters
+        ----------
+        arcname : str
+            path of the folder in the archive
+        mode : int
+            permissions of the folder
+        """
+        arcname = arcname.replace(os.sep, "/").rstrip("/")
+        if self._tar is not None:
+            info = tarfile.TarInfo(arcname)
+            info.type = tarfile.DIRTYPE
+            info.mode = mode
+            info.mtime = self.mtime
+            self._tar.addfile(info)
+        else:
+            info = zipfile.ZipInfo(
+                f"{arcname}/", time.localtime(self.mtime)[:6])
+            info.external_attr = (stat.S_IFDIR | mode) << 16 | 0x10
+            self._zip.writestr(info, b"")
+
+    def add_file(self, arcname: str, data: bytes, mode: int = None) -> NoReturn:
+        """
+        Add a file to the archive.
+
+        Parameters
+        ----------
+        arcname : str
+            path of the file in the archive
+        data : bytes
+            content of the file
+        mode : int
+            permissions of the file (0o644 if None)
+        """
+        arcname = arcname.replace(os.sep, "/")
+        mode = 0o644 if mode is None else stat.S_IMODE(mode)
+        if self._tar is not None:
+            info = tarfile.TarInfo(arcname)
+            info.size = len(data)
+            info.mode = mode
+            info.mtime = self.mtime
+            self._tar.addfile(info, io.BytesIO(data))
+        else:
+            info = zipfile.ZipInfo(arcname, time.localtime(self.mtime)[:6])
+            info.external_attr = (stat.S_IFREG | mode) << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._zip.writestr(info, data)
+
+    def add_symlink(self, arcname: str, target: str) -> NoReturn:
+        """
+        Add a symbolic link to the archive.
+
+        Parameters
+        ----------
+        arcname : str
+            path of the link in the archive
+        target : str
+            path pointed by the link (kept as is, relative or not)
+        """
+        arcname = arcname.replace(os.sep, "/")
+        if self._tar is not None:
+            info = tarfile.TarInfo(arcname)
+            info.type = tarfile.SYMTYPE
+            info.linkname = target
+            info.mode = 0o777
+            info.mtime = self.mtime
+            self._tar.addfile(info)
+        else:
+            info = zipfile.ZipInfo(arcname, time.localtime(self.mtime)[:6])
+            info.external_attr = (stat.S_IFLNK | 0o777) << 16
+            # the Unix attributes are only read from a Unix system
+            info.create_system = 3
+            # the zip tools store the target of a link as its content
+            self._zip.writestr(info, target.encode("utf-8"))
+
+    def add_directory(self, path: str, arcname: str) -> NoReturn:
+        """
+        Add recursively a folder of the disk to the archive.
+        The symbolic links are added as links (even if they point to a folder or nothing) and never followed.
+
+        Parameters
+        ----------
+        path : str
+            path of the folder on the disk
+        arcname : str
+            path of the folder in the archive
+        """
+        self.add_folder(arcname, stat.S_IMODE(os.stat(path).st_mode))
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            relative_path = os.path.relpath(dirpath, path)
+            for name in dirnames + sorted(filenames):
+                full_path = os.path.join(dirpath, name)
+                member = os.path.normpath(os.path.join(
+                    arcname, relative_path, name))
+                status = os.lstat(full_path)
+                if stat.S_ISLNK(status.st_mode):
+                    self.add_symlink(member, os.readlink(full_path))
+                elif stat.S_ISDIR(status.st_mode):
+                    self.add_folder(member, stat.S_IMODE(status.st_mode))
+                else:
+                    with open(full_path, "rb") as file:
+                        self.add_file(member, file.read(), status.st_mode)
+
+    def close(self) -> NoReturn:
+        """
+        Write the end of the archive (the file object stays open).
+        """
+        if self._tar is not None:
+            self._tar.close()
+        else:
+            self._zip.close()
@@ -1,4 +1,3 @@
-import os
 import stat
 from typing import NoReturn
 
@@ -50,4 +49,4 @@ class BashFile(CustomFileExtension):
         """
         content = "#!/bin/sh\n\n" + string
         super().write(content)
-        os.chmod(self.filename, stat.S_IRWXU)
+        self.chmod(stat.S_IRWXU)
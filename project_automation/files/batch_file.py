@@ -1,4 +1,3 @@
-import os
 import stat
 from typing import NoReturn
 
@@ -49,4 +48,4 @@ class BatchFile(CustomFileExtension):
             string to write into the file
         """
         super().write(string)
-        os.chmod(self.filename, stat.S_IRWXU)
+        self.chmod(stat.S_IRWXU)
@@ -1,6 +1,7 @@
 import os
 from typing import NoReturn
 
+from project_automation import templates
 from project_automation.files import CustomFileExtension
 
 
@@ -35,13 +36,8 @@ class CFile(CustomFileExtension):
         """
         Initialize the content of the file.
         """
-        content = f"""#include "{os.path.basename(self.filename).split('.')[0].lower()}.h"
-
-int function(int a, int b){{
-    return a + b - 2;
-}}
-"""
-        self.write(content)
+        self.write(templates.render('c_source.c', header=os.path.basename(
+            self.filename).split('.')[0].lower()))
 
     def init_main(self, other_file=None) -> NoReturn:
         """
@@ -60,13 +56,5 @@ int function(int a, int b){{
         if not isinstance(other_file, CFile):
             raise TypeError("other_file must be another CFile object")
         include_other_file = f"#include \"{os.path.basename(other_file.filename).split('.')[0].lower()}.h\"" if other_file is not None else ""
-        content = f"""#include <stdio.h>
-{include_other_file}
-
-int main(void){{
-    int y = function(2,2);
-    printf("%d\\n", y);
-    return 0;
-}}
-"""
-        self.write(content)
+        self.write(templates.render(
+            'c_main.c', include=include_other_file))
@@ -0,0 +1,264 @@
+import hashlib
+import os
+import shutil
+import sys
+import threading
+from typing import Any, NoReturn
+
+from project_automation.settings import CACHE_DIR
+from project_automation.utils import read_from_json_file, write_in_json_file
+
+
+# ioctl request to share the extents of a file with another one (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+class ContentStore:
+    """
+    Local store of file contents addressed by their SHA-256 digest.
+
+    A stored content is materialized in a project by the cheapest available way: a reflink (the
+    file shares the blocks of the stored object until one of them is modified), a hardlink (only
+    for the shared files which are never modified, like downloaded libraries), ``copy_file_range``
+    (an in-kernel copy) and finally a standard copy.
+
+    Attributes
+    ----------
+    directory : str
+        root directory of the store
+    urls : dict
+        digest of the downloaded contents indexed by their URL
+    """
+
+    CONFIG = {
+        "directory": os.path.join(CACHE_DIR, "store"),
+        "min_size": 4096,
+        "timeout": 60,
+    }
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, directory: str) -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        directory : str
+            root directory of the store
+        """
+        self.directory = directory
+        self.urls = {}
+        self._clone_support = {}
+        self._lock = threading.Lock()
+        try:
+            self.urls = read_from_json_file(self.get_urls_filename())
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def get(cls) -> Any:
+        """
+        Return the store shared by the whole process.
+
+        Returns
+        -------
+        store : ContentStore
+            the shared store
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(cls.CONFIG['directory'])
+            return cls._instance
+
+    def get_urls_filename(self) -> str:
+        """
+        Return the path of the index of the downloaded contents.
+
+        Returns
+        -------
+        filename : str
+            path of the JSON index
+        """
+        return os.path.join(self.directory, "urls.json")
+
+    def get_path(self, digest: str) -> str:
+        """
+        Return the path of a stored object.
+
+        Parameters
+        ----------
+        digest : str
+            SHA-256 digest of the content
+
+        Returns
+        -------
+        path : str
+            path of the object in the store
+        """
+        return os.path.join(self.directory, "objects", digest[:2], digest[2:])
+
+    def put(self, data: bytes) -> str:
+        """
+        Store a content if it is not already stored.
+
+        Parameters
+        ----------
+        data : bytes
+            content to store
+
+        Returns
+        -------
+        digest : str
+            SHA-256 digest of the content
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.get_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            # the objects can be hardlinked so they must never be modified
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, path)
+        return digest
+
+    def fetch(self, url: str) -> str:
+        """
+        Download a content once and store it.
+        The URL must identify an immutable content (like a versioned library).
+
+        Parameters
+        ----------
+        url : str
+            URL of the content
+
+        Returns
+        -------
+        digest : str
+            SHA-256 digest of the content
+
+        Raises
+        ------
+        requests.HTTPError
+            when the content cannot be downloaded
+        """
+        digest = self.urls.get(url)
+        if digest is not None and os.path.exists(self.get_path(digest)):
+            return digest
+        import requests
+
+        print(f"Downloading {url} ...")
+        response = requests.get(url, timeout=self.CONFIG['timeout'])
+        response.raise_for_status()
+        digest = self.put(response.content)
+        with self._lock:
+            self.urls[url] = digest
+            tmp_filename = f"{self.get_urls_filename()}.{os.getpid()}.tmp"
+            write_in_json_file(tmp_filename, self.urls)
+            os.replace(tmp_filename, self.get_urls_filename())
+        return digest
+
+    def can_clone(self, directory: str) -> bool:
+        """
+        Verify once per filesystem if the stored objects can be reflinked into a directory.
+
+        Parameters
+        ----------
+        directory : str
+            existing directory where to materialize the objects
+
+        Returns
+        -------
+        supported : bool
+            True if the store and the directory are on the same filesystem supporting reflinks, False otherwise
+        """
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            device = os.stat(directory).st_dev
+        except OSError:
+            return False
+        with self._lock:
+            if device in self._clone_support:
+                return self._clone_support[device]
+        probe = os.path.join(directory, f".clone-probe-{os.getpid()}-{threading.get_ident()}")
+        try:
+            self.materialize(self.put(b"project_automation"), probe, reflink_only=True)
+            supported = True
+        except OSError:
+            supported = False
+        finally:
+            if os.path.exists(probe):
+                os.remove(probe)
+        with self._lock:
+            self._clone_support[device] = supported
+        return supported
+
+    def materialize(self, digest: str, target: str, shared: bool = False, reflink_only: bool = False) -> str:
+        """
+        Create a file with a stored content.
+
+        Parameters
+        ----------
+        digest : str
+            SHA-256 digest of the content
+        target : str
+            path of the file to create (replaced if it exists)
+        shared : bool
+            True to allow a hardlink to the stored object (the file must never be modified), False otherwise
+        reflink_only : bool
+            True to only try a reflink, False to fall back on the other ways
+
+        Returns
+        -------
+        method : str
+            the used way: "reflink", "hardlink", "copy_file_range" or "copy"
+
+        Raises
+        ------
+        OSError
+            when the content cannot be materialized (or cannot be reflinked with `reflink_only`)
+        """
+        source = self.get_path(digest)
+        if os.path.lexists(target):
+            os.remove(target)
+        if sys.platform.startswith("linux"):
+            import fcntl
+
+            try:
+                with open(source, "rb") as source_file, open(target, "wb") as target_file:
+                    fcntl.ioctl(target_file.fileno(), FICLONE,
+                                source_file.fileno())
+                return "reflink"
+            except OSError:
+                if os.path.exists(target):
+                    os.remove(target)
+                if reflink_only:
+                    raise
+        elif reflink_only:
+            raise OSError("reflinks are not supported on this platform")
+        if shared:
+            try:
+                os.link(source, target)
+                return "hardlink"
+            except OSError:
+                pass
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(source, "rb") as source_file, open(target, "wb") as target_file:
+                    size = os.fstat(source_file.fileno()).st_size
+                    while size > 0:
+                        copied = os.copy_file_range(
+                            source_file.fileno(), target_file.fileno(), size)
+                        if copied == 0:
+                            break
+                        size -= copied
+                if size == 0:
+                    return "copy_file_range"
+            except OSError:
+                pass
+        shutil.copyfile(source, target)
+        return "copy"
@@ -1,5 +1,7 @@
 import os
-from typing import NoReturn
+from typing import Any, NoReturn
+
+from .virtual_tree import VirtualTree
 
 
 class File:
@@ -10,6 +12,8 @@ class File:
     ----------
     filename : str
         represents the path of the file and his name (with the extension)
+    tree : VirtualTree
+        virtual tree holding the content of the file (None if the file is directly written on the disk)
     """
 
     def __init__(self, filename: str) -> NoReturn:
@@ -22,12 +26,30 @@ class File:
             represents the path of the file and his name (with the extension)
         """
         self.filename = filename
+        self.tree = VirtualTree.current()
         self.create()
 
+    def get_tree(self) -> Any:
+        """
+        Return the virtual tree holding the content of the file if it is not flushed yet.
+
+        Returns
+        -------
+        tree : VirtualTree or None
+            the virtual tree of the file, None if the file must be accessed on the disk
+        """
+        if self.tree is not None and not self.tree.flushed:
+            return self.tree
+        return None
+
     def create(self) -> NoReturn:
         """
         Create an empty file.
         """
+        tree = self.get_tree()
+        if tree is not None:
+            tree.write(self.filename, "")
+            return
         file = open(self.filename, "w+")
         file.close()
 
@@ -42,6 +64,10 @@ class File:
         """
         if 'w' not in mode:
             raise ValueError("you must write (w) in the file")
+        tree = self.get_tree()
+        if tree is not None:
+            tree.write(self.filename, string)
+            return
         with open(self.filename, mode) as file:
             file.write(string)
 
@@ -56,6 +82,10 @@ class File:
         """
         if 'a' not in mode:
             raise ValueError("you must add (a) in the file")
+        tree = self.get_tree()
+        if tree is not None:
+            tree.append(self.filename, string)
+            return
         with open(self.filename, 'a+') as file:
             file.write(string)
 
@@ -70,6 +100,9 @@ class File:
         """
         if 'r' not in mode:
             raise ValueError("you must read (r) from the file")
+        tree = self.get_tree()
+        if tree is not None:
+            return tree.read(self.filename)
         with open(self.filename, 'r+') as file:
             data = file.read()
         return data
@@ -78,4 +111,23 @@ class File:
         """
         Remove the file.
         """
+        tree = self.get_tree()
+        if tree is not None:
+            tree.remove(self.filename)
+            return
         os.remove(self.filename)
+
+    def chmod(self, mode: int) -> NoReturn:
+        """
+        Change the permissions of the file.
+
+        Parameters
+        ----------
+        mode : int
+            permissions of the file (like ``stat.S_IRWXU``)
+        """
+        tree = self.get_tree()
+        if tree is not None:
+            tree.chmod(self.filename, mode)
+            return
+        os.chmod(self.filename, mode)
@@ -2,6 +2,8 @@ import os
 import shutil
 from typing import Iterable, NoReturn
 
+from .virtual_tree import VirtualTree
+
 
 class Folder:
     """
@@ -13,6 +15,8 @@ class Folder:
         path of the folder
     files : iterable of files/folder objects
         list of files and folder
+    tree : VirtualTree
+        virtual tree where the folder is created (None if the folder is directly created on the disk)
     """
 
     def __init__(self, path: str, *files: Iterable) -> NoReturn:
@@ -28,13 +32,17 @@ class Folder:
         """
         self.path = path
         self.files = [*files]
+        self.tree = VirtualTree.current()
         self.create()
 
     def create(self) -> NoReturn:
         """
         Create root folder and recursively subfiles and subfolders.
         """
-        os.makedirs(self.path, exist_ok=True)
+        if self.tree is not None and not self.tree.flushed:
+            self.tree.add_folder(self.path)
+        else:
+            os.makedirs(self.path, exist_ok=True)
         for file in self.files:
             file.create()
 
@@ -65,6 +73,7 @@ class Folder:
         """
         Remove folder and all subfiles/subfolders.
         """
-        before_path, current_dir = os.path.split(self.path)
-        os.chdir(before_path)
-        shutil.rmtree(current_dir)
+        if self.tree is not None and not self.tree.flushed:
+            self.tree.remove_folder(self.path)
+            return
+        shutil.rmtree(self.path)
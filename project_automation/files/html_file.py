@@ -18,6 +18,7 @@ class HTMLFile(XMLFile):
         "extension": "html",
         "doctype": "<!DOCTYPE html>",
     }
+    CONFIG = {**XMLFile.CONFIG, **CONFIG_HTML}
 
     def __init__(self, path: str, filename: str) -> NoReturn:
         """
@@ -30,7 +31,6 @@ class HTMLFile(XMLFile):
         filename : str
             name of the file without extension
         """
-        self.CONFIG.update(self.CONFIG_HTML)
         super().__init__(path, filename)
 
     def init(self) -> NoReturn:
@@ -83,7 +83,7 @@ class HTMLFile(XMLFile):
         self.body = ET.SubElement(self.root, "body")
         self.main_title = ET.SubElement(self.body, "h1")
         self.main_title.text = "Hello World"
-        self.write_xml()
+        self.mark_dirty()
 
     def add_meta(self, content: str, name: str = None, property: str = None) -> NoReturn:
         """
@@ -108,7 +108,7 @@ class HTMLFile(XMLFile):
             dicte["property"] = property
         dicte.update({"content": content})
         ET.SubElement(self.head, "meta", attrib=dicte)
-        self.write_xml()
+        self.mark_dirty()
 
     def add_headlink(self, type: str, rel: str, href: str, href_is_relative: bool = True) -> NoReturn:
         """
@@ -134,7 +134,7 @@ class HTMLFile(XMLFile):
                 [href, self.filename]), ".").replace("\\", "/")
         attrib = {"type": type, "rel": rel, "href": href}
         ET.SubElement(self.head, "link", attrib=attrib)
-        self.write_xml()
+        self.mark_dirty()
 
     def add_style(self, rules: dict) -> NoReturn:
         """
@@ -154,7 +154,7 @@ class HTMLFile(XMLFile):
             styles_to_add += create_css_rule(*rules[rule])
         style_tag = ET.SubElement(self.head, "style")
         style_tag.text = styles_to_add
-        self.write_xml()
+        self.mark_dirty()
 
     def add_script(self, src: str, src_is_relative: bool = True) -> NoReturn:
         """
@@ -176,4 +176,4 @@ class HTMLFile(XMLFile):
                 [src, self.filename]), ".").replace("\\", "/")
         script = ET.SubElement(self.body, "script", attrib={"src": src})
         script.text = " "
-        self.write_xml()
+        self.mark_dirty()
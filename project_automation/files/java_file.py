@@ -1,5 +1,6 @@
 from typing import NoReturn
 
+from project_automation import templates
 from project_automation.files import CustomFileExtension
 
 
@@ -37,18 +38,5 @@ class JavaFile(CustomFileExtension):
         """
         Initialize the content of the file.
         """
-        content = f"""package {self.package_name};
-
-public class Main {{
-    public static String helloWorld(){{
-        String str = "Hello World";
-        System.out.println(str);
-        return str;
-    }}
-
-    public static void main(String[] args){{
-        helloWorld();
-    }}
-}}
-"""
-        self.write(content)
+        self.write(templates.render(
+            'java_main.java', package_name=self.package_name))
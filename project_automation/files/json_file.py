@@ -1,7 +1,7 @@
+import json
 from typing import NoReturn
 
 from project_automation.files import CustomFileExtension
-from project_automation.utils import write_in_json_file, read_from_json_file
 
 
 class JSONFile(CustomFileExtension):
@@ -48,7 +48,7 @@ class JSONFile(CustomFileExtension):
             all data to put in the file
         """
         self.data = data
-        write_in_json_file(self.filename, data, self.CONFIG['indentation'])
+        super().write(json.dumps(data, indent=self.CONFIG['indentation']))
 
     def append(self, data_to_append: dict) -> NoReturn:
         """
@@ -60,8 +60,7 @@ class JSONFile(CustomFileExtension):
             data to append at the enf of the file
         """
         self.data.update(data_to_append)
-        write_in_json_file(self.filename, self.data,
-                           self.CONFIG['indentation'])
+        super().write(json.dumps(self.data, indent=self.CONFIG['indentation']))
 
     def read(self) -> str:
         """
@@ -72,4 +71,4 @@ class JSONFile(CustomFileExtension):
         data : dict
             content of the file
         """
-        return read_from_json_file(self.filename)
+        return json.loads(super().read())
@@ -2,7 +2,7 @@ from datetime import datetime
 import os
 from typing import NoReturn
 
-from project_automation.settings import LICENSE_MODE_SHORTCUT
+from project_automation import licenses
 from .file import File
 
 
@@ -25,16 +25,14 @@ class LicenseFile(File):
         path : str
             path of the file (not add the filename)
         mode : str
-            type of the license to use
+            type of the license to use (SPDX identifier, full name or shortcut)
         username : str
             name of the current user
         """
         File.__init__(self, os.path.join(path, "LICENSE"))
         try:
-            license_str = LICENSE_MODE_SHORTCUT[mode.lower()]
-            license_str = license_str.replace(
-                "year_to_add", str(datetime.today().year))
-            license_str = license_str.replace("username_to_add", username)
-        except:
-            license_str = LICENSE_MODE_SHORTCUT['unlicense']
+            license_str = licenses.render(
+                mode, datetime.today().year, username)
+        except KeyError:
+            license_str = licenses.get_content('unlicense')
         self.write(license_str)
@@ -1,5 +1,5 @@
 import os
-from typing import NoReturn
+from typing import Any, NoReturn
 
 from .file import File
 
@@ -8,10 +8,15 @@ class ReadMeFile(File):
     """
     Represents a `README.md` file.
 
+    The appended contents are buffered and written at once by `flush` or `close`.
+    Use the file in a ``with`` statement to flush it automatically.
+
     Attributes
     ----------
     filename : str
         represents the path of the file and his name (with the extension)
+    fragments : list of strings
+        contents appended since the last flush
     """
 
     def __init__(self, path: str) -> NoReturn:
@@ -23,8 +28,67 @@ class ReadMeFile(File):
         path : str
             path of the file (not add the filename)
         """
+        self.fragments = []
         File.__init__(self, os.path.join(path, "README.md"))
 
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> NoReturn:
+        self.close()
+
+    def write(self, string: str, mode="w+") -> NoReturn:
+        """
+        Write into the file and drop the contents not flushed yet.
+
+        Parameters
+        ----------
+        string : str
+            string to write into the file
+        """
+        self.fragments = []
+        File.write(self, string, mode)
+
+    def append(self, string: str, mode="a+") -> NoReturn:
+        """
+        Add a string to the buffer, written after the content of the file on the next flush.
+
+        Parameters
+        ----------
+        string : str
+            string to append to the file
+        """
+        if 'a' not in mode:
+            raise ValueError("you must add (a) in the file")
+        self.fragments.append(string)
+
+    def read(self, mode="r+") -> str:
+        """
+        Flush the buffer then read all the file.
+
+        Returns
+        -------
+        string : str
+            content of the file
+        """
+        self.flush()
+        return File.read(self, mode)
+
+    def flush(self) -> NoReturn:
+        """
+        Write all the buffered contents into the file at once.
+        """
+        if self.fragments:
+            content = "".join(self.fragments)
+            self.fragments = []
+            File.append(self, content)
+
+    def close(self) -> NoReturn:
+        """
+        Flush the buffered contents.
+        """
+        self.flush()
+
     def write_title(self, title: str, title_degree: int = 1) -> NoReturn:
         """
         Write title into the file.
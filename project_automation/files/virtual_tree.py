@@ -0,0 +1,363 @@
+from concurrent.futures import ThreadPoolExecutor
+import locale
+import os
+import threading
+import time
+from typing import Any, NoReturn
+
+from .content_store import ContentStore
+
+
+class VirtualTree:
+    """
+    In-memory tree of a project, materialized on the disk with a single flush.
+
+    While the tree is active (in a ``with`` statement), each created `File` and `Folder`
+    builds its content in memory instead of writing on the disk. On exit, the tree is flushed:
+    the folders are created and each file is written once with its final content.
+    Once flushed, the files and folders of the tree work directly on the disk again.
+
+    Attributes
+    ----------
+    files : dict
+        content of each file indexed by its path
+    folders : list of strings
+        paths of the folders to create
+    modes : dict
+        permissions of the files indexed by their path
+    flushed : bool
+        True if the tree was written on the disk, False otherwise
+    timings : dict
+        number of seconds spent in each phase of the flush
+    archive : ArchiveWriter
+        archive where the tree is flushed instead of the disk (None to write on the disk)
+    root : str
+        folder of the disk matching the root of the archive
+    deferred : dict
+        objects whose ``flush`` method is called at the beginning of the flush (used as an ordered set)
+
+    Notes
+    -----
+    The files are written by ``CONFIG['jobs']`` threads (sequentially by default) once the folders
+    are created. Trees with less than ``CONFIG['parallel_threshold']`` files are always written
+    sequentially.
+
+    The contents bigger than ``ContentStore.CONFIG['min_size']`` are reflinked from the `ContentStore`
+    when the filesystem supports it, so identical files of several projects share their blocks.
+
+    When the tree has an ``archive``, the flush streams the folders and files into it and
+    nothing is written on the disk.
+    """
+
+    CONFIG = {
+        "jobs": 1,
+        "parallel_threshold": 32,
+    }
+
+    _local = threading.local()
+
+    def __init__(self, archive: Any = None, root: str = None) -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        archive : ArchiveWriter
+            archive where the tree is flushed instead of the disk (None to write on the disk)
+        root : str
+            folder whose content is at the root of the archive (the current directory if None)
+        """
+        self.files = {}
+        self.folders = []
+        self.modes = {}
+        self.flushed = False
+        self.timings = {}
+        self.archive = archive
+        self.root = root if root is not None else os.curdir
+        self.deferred = {}
+
+    @classmethod
+    def current(cls) -> Any:
+        """
+        Return the active tree of the current thread.
+
+        Returns
+        -------
+        tree : VirtualTree or None
+            the innermost active tree, None if there is no active tree
+        """
+        stack = getattr(cls._local, "stack", [])
+        return stack[-1] if stack else None
+
+    def __enter__(self) -> Any:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        self._local.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> NoReturn:
+        self._local.stack.remove(self)
+        if exc_type is None:
+            self.flush()
+
+    def defer(self, obj: Any) -> NoReturn:
+        """
+        Register an object which writes its content in the tree only when the tree is flushed
+        (like a modified `XMLFile`).
+
+        Parameters
+        ----------
+        obj : Any
+            object with a ``flush`` method
+        """
+        self.deferred[obj] = None
+
+    def flush_deferred(self) -> NoReturn:
+        """
+        Call the ``flush`` method of the deferred objects, in their registration order.
+        """
+        while self.deferred:
+            obj = next(iter(self.deferred))
+            del self.deferred[obj]
+            obj.flush()
+
+    def add_folder(self, path: str) -> NoReturn:
+        """
+        Add a folder to create.
+
+        Parameters
+        ----------
+        path : str
+            path of the folder
+        """
+        if path not in self.folders:
+            self.folders.append(path)
+
+    def remove_folder(self, path: str) -> NoReturn:
+        """
+        Remove a folder and all its subfiles/subfolders from the tree.
+
+        Parameters
+        ----------
+        path : str
+            path of the folder
+        """
+        prefix = os.path.join(path, "")
+        self.folders = [folder for folder in self.folders
+                        if folder != path and not folder.startswith(prefix)]
+        for filename in [filename for filename in self.files if filename.startswith(prefix)]:
+            self.remove(filename)
+
+    def write(self, filename: str, string: str) -> NoReturn:
+        """
+        Replace the content of a file.
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+        string : str
+            new content of the file
+        """
+        self.files[filename] = [string]
+
+    def append(self, filename: str, string: str) -> NoReturn:
+        """
+        Add a string after the content of a file.
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+        string : str
+            string to append to the file
+        """
+        if filename not in self.files:
+            self.files[filename] = [self.read(filename)]
+        self.files[filename].append(string)
+
+    def read(self, filename: str) -> str:
+        """
+        Return the content of a file (from the disk if it is not in the tree).
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+
+        Returns
+        -------
+        string : str
+            content of the file
+        """
+        if filename not in self.files:
+            if not os.path.exists(filename):
+                return ""
+            with open(filename, "r") as file:
+                return file.read()
+        content = "".join(self.files[filename])
+        self.files[filename] = [content]
+        return content
+
+    def remove(self, filename: str) -> NoReturn:
+        """
+        Remove a file from the tree.
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+        """
+        self.files.pop(filename, None)
+        self.modes.pop(filename, None)
+
+    def chmod(self, filename: str, mode: int) -> NoReturn:
+        """
+        Set the permissions of a file once it is written.
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+        mode : int
+            permissions of the file (like ``stat.S_IRWXU``)
+        """
+        self.modes[filename] = mode
+
+    def get_jobs(self) -> int:
+        """
+        Return the number of threads used to write the files.
+
+        Returns
+        -------
+        jobs : int
+            number of threads (1 to write the files sequentially)
+        """
+        if len(self.files) < self.CONFIG['parallel_threshold']:
+            return 1
+        return max(min(self.CONFIG['jobs'], len(self.files)), 1)
+
+    def get_data(self, filename: str) -> bytes:
+        """
+        Return the bytes of a file of the tree as they are written on the disk.
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+
+        Returns
+        -------
+        data : bytes
+            content of the file encoded like a file opened in text mode
+        """
+        return "".join(self.files[filename]).replace("\n", os.linesep).encode(
+            locale.getpreferredencoding(False))
+
+    def get_arcname(self, path: str) -> str:
+        """
+        Return the path of a file or a folder of the tree in the archive.
+
+        Parameters
+        ----------
+        path : str
+            path of the file or the folder
+
+        Returns
+        -------
+        arcname : str
+            path relative to the ``root`` attribute
+
+        Raises
+        ------
+        ValueError
+            when the path is outside of the ``root`` attribute
+        """
+        arcname = os.path.relpath(path, self.root)
+        if arcname == os.pardir or arcname.startswith(os.pardir + os.sep):
+            raise ValueError(f"{path} is outside of the archive root")
+        return arcname
+
+    def write_file(self, filename: str) -> NoReturn:
+        """
+        Write a file of the tree on the disk.
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+        """
+        content = "".join(self.files[filename])
+        store = ContentStore.get()
+        if len(content) >= store.CONFIG['min_size'] and store.can_clone(os.path.dirname(filename)):
+            store.materialize(store.put(self.get_data(filename)), filename)
+        else:
+            with open(filename, "w") as file:
+                file.write(content)
+        if filename in self.modes:
+            os.chmod(filename, self.modes[filename])
+
+    def get_folders(self) -> list:
+        """
+        Return all the folders to create, with the folders of the files.
+
+        Returns
+        -------
+        folders : list of strings
+            paths of the folders in their creation order
+        """
+        folders = dict.fromkeys(self.folders)
+        folders.update(dict.fromkeys(os.path.dirname(filename)
+                                     for filename in self.files))
+        return [folder for folder in folders if folder]
+
+    def flush(self) -> NoReturn:
+        """
+        Create all the folders then write each file once on the disk (or in the archive).
+        The time spent in each phase is stored in the ``timings`` attribute.
+        """
+        self.flush_deferred()
+        if self.archive is not None:
+            self.flush_archive()
+            return
+        start = time.perf_counter()
+        for folder in self.get_folders():
+            os.makedirs(folder, exist_ok=True)
+        self.timings['folders'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        jobs = self.get_jobs()
+        if jobs > 1:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                list(executor.map(self.write_file, self.files))
+        else:
+            for filename in self.files:
+                self.write_file(filename)
+        self.timings['files'] = time.perf_counter() - start
+        self.flushed = True
+
+    def flush_archive(self) -> NoReturn:
+        """
+        Stream all the folders then each file into the archive.
+        The time spent in each phase is stored in the ``timings`` attribute.
+        """
+        start = time.perf_counter()
+        added = {os.curdir}
+        for folder in self.get_folders():
+            # the parent folders first, like `os.makedirs`
+            arcname = self.get_arcname(folder)
+            missing = []
+            while arcname not in added and arcname != "":
+                missing.append(arcname)
+                arcname = os.path.dirname(arcname)
+            for arcname in reversed(missing):
+                self.archive.add_folder(arcname)
+                added.add(arcname)
+        self.timings['folders'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for filename in self.files:
+            self.archive.add_file(self.get_arcname(filename), self.get_data(filename),
+                                  self.modes.get(filename))
+        self.timings['files'] = time.perf_counter() - start
+        self.flushed = True
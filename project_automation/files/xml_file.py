@@ -1,18 +1,34 @@
-from typing import NoReturn
-import defusedxml.minidom
+import atexit
+import codecs
+import io
+import threading
+from typing import Any, Callable, NoReturn, TextIO
 import xml.etree.ElementTree as ET
 
 from project_automation.files import CustomFileExtension
 
 
+XML_DECLARATION = '<?xml version="1.0" ?>'
+
+
 class XMLFile(CustomFileExtension):
     """
     Represents a `.xml` file.
 
+    The modifications of the tree only mark the file as dirty and the file is serialized once
+    by `flush`, `close`, `read`, the end of a ``with`` statement or an explicit `write_xml`.
+    The files not flushed by their caller are serialized at the latest when their `VirtualTree`
+    is flushed, by `flush_pending` (called by `Project.generate` for the projects without virtual
+    tree) or at the exit of the interpreter.
+
     Attributes
     ----------
     filename : str
         represents the path of the file and his name (with the extension)
+    root : ~xml.etree.ElementTree.Element
+        root element of the file
+    dirty : bool
+        True if the tree was modified since the last serialization, False otherwise
     """
 
     CONFIG = {
@@ -24,6 +40,10 @@ class XMLFile(CustomFileExtension):
         "doctype": None,
     }
 
+    # Dirty files modified outside of a virtual tree with the thread which modified them
+    _pending = {}
+    _pending_lock = threading.Lock()
+
     def __init__(self, path: str, filename: str) -> NoReturn:
         """
         Constructor and initializer.
@@ -35,8 +55,15 @@ class XMLFile(CustomFileExtension):
         filename : str
             name of the file without extension
         """
+        self.dirty = False
         super().__init__(path, filename)
 
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> NoReturn:
+        self.close()
+
     def init(self) -> NoReturn:
         """
         Initialize the content of the file.
@@ -48,7 +75,7 @@ class XMLFile(CustomFileExtension):
         test1.set("myKey", "myValue")
         test1.set("emptyKey", "")
         ET.SubElement(title, "test1")
-        self.write_xml()
+        self.mark_dirty()
 
     def append(self, string: str) -> NoReturn:
         """
@@ -61,13 +88,71 @@ class XMLFile(CustomFileExtension):
         """
         raise NotImplementedError
 
+    def read(self, mode="r+") -> str:
+        """
+        Flush the modifications then read all the file.
+
+        Returns
+        -------
+        string : str
+            content of the file
+        """
+        self.flush()
+        return super().read(mode)
+
+    def mark_dirty(self) -> NoReturn:
+        """
+        Mark the tree as modified to serialize it on the next flush.
+        """
+        if self.dirty:
+            return
+        self.dirty = True
+        tree = self.get_tree()
+        if tree is not None:
+            tree.defer(self)
+        else:
+            with XMLFile._pending_lock:
+                XMLFile._pending[self] = threading.get_ident()
+
+    @classmethod
+    def flush_pending(cls, all_threads: bool = False) -> NoReturn:
+        """
+        Serialize the dirty files modified outside of a virtual tree.
+
+        Parameters
+        ----------
+        all_threads : bool
+            True to flush the files of all the threads, False to flush only the files modified by the current thread
+        """
+        thread = threading.get_ident()
+        with XMLFile._pending_lock:
+            files = [file for file, owner in XMLFile._pending.items()
+                     if all_threads or owner == thread]
+        for file in files:
+            file.flush()
+
+    def flush(self) -> NoReturn:
+        """
+        Serialize the tree into the file if it was modified.
+        """
+        if self.dirty:
+            self.write_xml()
+
+    def close(self) -> NoReturn:
+        """
+        Flush the modifications of the tree.
+        """
+        self.flush()
+
     def write_xml(self) -> NoReturn:
         """
         Write correctly the file in the XML format.
         """
         dom = self.prettify(self.root, doctype=self.CONFIG['doctype'])
-        with open(self.filename, "w+") as f:
-            f.write(dom)
+        self.write(dom)
+        self.dirty = False
+        with XMLFile._pending_lock:
+            XMLFile._pending.pop(self, None)
 
     @classmethod
     def prettify(cls, elem: ET.Element, doctype: str = None) -> str:
@@ -85,12 +170,101 @@ class XMLFile(CustomFileExtension):
         -------
         string : str
             the all root in string format
+
+        See also
+        --------
+        serialize
+        """
+        stream = io.StringIO()
+        cls.serialize(elem, stream, doctype)
+        return stream.getvalue()
+
+    @classmethod
+    def serialize(cls, elem: ET.Element, stream: TextIO, doctype: str = None) -> NoReturn:
+        """
+        Write the pretty-printed XML of the element into a text stream in a single pass.
+        The layout is the one of `xml.dom.minidom` with ``CONFIG['indentation']`` and the characters
+        which cannot be encoded with ``CONFIG['xml_tostring']['encoding']`` are written as character references.
+
+        Parameters
+        ----------
+        elem : ~xml.etree.ElementTree.Element
+            the root element
+        stream : TextIO
+            text stream where to write the XML
+        doctype : str
+            the string to put instead of the XML declaration
+
+        Raises
+        ------
+        ValueError
+            when a tag or an attribute uses a namespace or when a comment contains ``--``
         """
-        data = ET.tostring(elem, **cls.CONFIG['xml_tostring'])
-        dom = defusedxml.minidom.parseString(data)
-        string = dom.toprettyxml(cls.CONFIG['indentation'])
-        if doctype is not None:
-            lines = string.split("\n")
-            lines[0] = doctype
-            string = "\n".join(lines)
-        return string
+        escape = cls.get_escape(cls.CONFIG['xml_tostring'].get('encoding'))
+        stream.write(
+            f"{doctype if doctype is not None else XML_DECLARATION}\n")
+        cls._serialize_element(elem, stream.write, escape,
+                               "", cls.CONFIG['indentation'])
+
+    @staticmethod
+    def get_escape(encoding: str = None) -> Callable[[str], str]:
+        """
+        Return the function escaping the texts and the attribute values.
+
+        Parameters
+        ----------
+        encoding : str
+            encoding of the document (unicode if None)
+
+        Returns
+        -------
+        escape : callable
+            function escaping the special characters of a string
+        """
+        def escape(data: str) -> str:
+            return data.replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;")
+
+        if encoding is None or encoding.lower() == "unicode" or \
+                codecs.lookup(encoding).name in ("utf-8", "utf-16", "utf-32"):
+            return escape
+        return lambda data: escape(data).encode(encoding, "xmlcharrefreplace").decode(encoding)
+
+    @classmethod
+    def _serialize_element(cls, elem: ET.Element, write: Callable[[str], Any],
+                           escape: Callable[[str], str], indent: str, indentation: str) -> NoReturn:
+        tag = elem.tag
+        if tag is ET.Comment:
+            if "--" in elem.text:
+                raise ValueError("'--' is not allowed in a comment node")
+            write(f"{indent}<!--{elem.text}-->\n")
+            return
+        if tag is ET.ProcessingInstruction:
+            target, _, data = elem.text.partition(" ")
+            write(f"{indent}<?{target} {data.lstrip()}?>\n")
+            return
+        if not isinstance(tag, str) or tag.startswith("{"):
+            raise ValueError(f"unsupported tag: {tag!r}")
+        write(f"{indent}<{tag}")
+        for key, value in elem.items():
+            if key.startswith("{"):
+                raise ValueError(f"unsupported attribute: {key!r}")
+            write(f" {key}=\"{escape(value)}\"")
+        text = elem.text.replace("\r\n", "\n").replace(
+            "\r", "\n") if elem.text else elem.text
+        if len(elem) == 0:
+            write(f">{escape(text)}</{tag}>\n" if text else "/>\n")
+            return
+        write(">\n")
+        child_indent = indent + indentation
+        if text:
+            write(f"{child_indent}{escape(text)}\n")
+        for child in elem:
+            cls._serialize_element(child, write, escape,
+                                   child_indent, indentation)
+            if child.tail:
+                tail = child.tail.replace("\r\n", "\n").replace("\r", "\n")
+                write(f"{child_indent}{escape(tail)}\n")
+        write(f"{indent}</{tag}>\n")
+
+
+atexit.register(XMLFile.flush_pending, all_threads=True)
@@ -0,0 +1,853 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+import fnmatch
+import os
+import re
+import threading
+import time
+from typing import Any, Iterable, NoReturn
+
+from project_automation.settings import CACHE_DIR, SHELL_COLORS
+from project_automation.utils import read_from_json_file, write_in_json_file
+
+
+class GitIgnoreCache:
+    """
+    Persistent cache of the downloaded `.gitignore` templates.
+
+    Each template is stored with its ``ETag`` and ``Last-Modified`` headers, so it can be
+    revalidated with a conditional request once its TTL is expired.
+
+    Attributes
+    ----------
+    filename : str
+        path of the JSON file of the cache
+    entries : dict
+        cached templates indexed by their name
+    """
+
+    CONFIG = {
+        "filename": os.path.join(CACHE_DIR, "gitignore.json"),
+        "ttl": 24 * 60 * 60,
+    }
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, filename: str) -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        filename : str
+            path of the JSON file of the cache
+        """
+        self.filename = filename
+        self.entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            self.entries = read_from_json_file(filename)
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def get(cls) -> Any:
+        """
+        Return the cache shared by the whole process.
+
+        Returns
+        -------
+        cache : GitIgnoreCache
+            the shared cache
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(cls.CONFIG['filename'])
+            return cls._instance
+
+    def lookup(self, name: str) -> Any:
+        """
+        Return the cached template, even if its TTL is expired.
+
+        Parameters
+        ----------
+        name : str
+            name of the template
+
+        Returns
+        -------
+        entry : dict or None
+            the content of the template with its validators, None if it is not cached
+        """
+        with self._lock:
+            return self.entries.get(name)
+
+    def is_fresh(self, entry: dict) -> bool:
+        """
+        Verify if a cached template can be used without revalidation.
+
+        Parameters
+        ----------
+        entry : dict
+            cached template
+
+        Returns
+        -------
+        fresh : bool
+            True if the TTL of the template is not expired, False otherwise
+        """
+        return time.time() - entry['time'] <= self.CONFIG['ttl']
+
+    def store(self, name: str, content: str, etag: str = None, last_modified: str = None) -> NoReturn:
+        """
+        Store a downloaded template.
+
+        Parameters
+        ----------
+        name : str
+            name of the template
+        content : str
+            content of the template
+        etag : str
+            value of the ``ETag`` header of the response (None if missing)
+        last_modified : str
+            value of the ``Last-Modified`` header of the response (None if missing)
+        """
+        with self._lock:
+            self.entries[name] = {
+                "content": content,
+                "etag": etag,
+                "last_modified": last_modified,
+                "time": time.time(),
+            }
+            self._dirty = True
+
+    def touch(self, name: str) -> NoReturn:
+        """
+        Restart the TTL of a template confirmed by the server.
+
+        Parameters
+        ----------
+        name : str
+            name of the template
+        """
+        with self._lock:
+            if name in self.entries:
+                self.entries[name]['time'] = time.time()
+                self._dirty = True
+
+    def remove(self, name: str) -> NoReturn:
+        """
+        Remove a template which does not exist anymore.
+
+        Parameters
+        ----------
+        name : str
+            name of the template
+        """
+        with self._lock:
+            if self.entries.pop(name, None) is not None:
+                self._dirty = True
+
+    def save(self) -> NoReturn:
+        """
+        Write the cache on the disk if it was modified.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+                tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+                write_in_json_file(tmp_filename, self.entries)
+                os.replace(tmp_filename, self.filename)
+                self._dirty = False
+            except OSError:
+                pass
+
+
+# Characters with a special meaning in a pattern
+GLOB_CHARACTERS = re.compile(r"[*?\[\\]")
+
+# Names used by the projects without their own template, with the template to use instead
+ALIASES = {
+    "javascript": "Node",
+    "reactjs": "Node",
+    "typescript": "Node",
+    "webpackjs": "Node",
+}
+
+
+class GitIgnoreCatalog:
+    """
+    Persistent index of the templates available in the github/gitignore repository.
+
+    The names are resolved locally (case insensitive, with ``ALIASES``) to the path of their template,
+    so no request is sent for a name without template. The templates which were not found
+    by the server are also remembered until the next refresh of the catalog.
+
+    The catalog is refreshed in a background thread once it is older than ``CONFIG['ttl']``:
+    the current one is used in the meantime. Without catalog (first run), the names are only
+    resolved with ``ALIASES``.
+
+    Attributes
+    ----------
+    filename : str
+        path of the JSON file of the catalog
+    templates : dict
+        path of the templates (without the extension) indexed by their lower-cased name
+    missing : list of strings
+        templates not found by the server since the last refresh
+    time : float
+        timestamp of the last refresh, None if the catalog was never downloaded
+    etag : str
+        value of the ``ETag`` header of the last refresh
+    """
+
+    CONFIG = {
+        "filename": os.path.join(CACHE_DIR, "gitignore_catalog.json"),
+        "url": "https://api.github.com/repos/github/gitignore/git/trees/master?recursive=1",
+        "ttl": 7 * 24 * 60 * 60,
+        "timeout": 10,
+    }
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, filename: str) -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        filename : str
+            path of the JSON file of the catalog
+        """
+        self.filename = filename
+        self.templates = {}
+        self.missing = []
+        self.time = None
+        self.etag = None
+        self._thread = None
+        self._lock = threading.Lock()
+        try:
+            data = read_from_json_file(filename)
+            self.templates = data['templates']
+            self.missing = data['missing']
+            self.time = data['time']
+            self.etag = data['etag']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    @classmethod
+    def get(cls) -> Any:
+        """
+        Return the catalog shared by the whole process.
+
+        Returns
+        -------
+        catalog : GitIgnoreCatalog
+            the shared catalog
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(cls.CONFIG['filename'])
+            return cls._instance
+
+    def is_stale(self) -> bool:
+        """
+        Verify if the catalog must be refreshed.
+
+        Returns
+        -------
+        stale : bool
+            True if the catalog was never downloaded or is older than its TTL, False otherwise
+        """
+        return self.time is None or time.time() - self.time > self.CONFIG['ttl']
+
+    def resolve(self, name: str) -> str:
+        """
+        Return the template to use for a name.
+
+        Parameters
+        ----------
+        name : str
+            name of a language or a framework (like "Python" or "Javascript")
+
+        Returns
+        -------
+        template : str
+            path of the template without the extension (like "Node"), None if there is no template
+        """
+        with self._lock:
+            template = self.templates.get(name.lower())
+            if template is None and name.lower() in ALIASES:
+                template = ALIASES[name.lower()]
+            elif template is None and self.time is None:
+                # unknown catalog, the server decides
+                template = name
+            if template is None or template in self.missing:
+                return None
+            return template
+
+    def mark_missing(self, template: str) -> NoReturn:
+        """
+        Remember that a template was not found by the server.
+
+        Parameters
+        ----------
+        template : str
+            path of the template without the extension
+        """
+        with self._lock:
+            if template in self.missing:
+                return
+            self.missing.append(template)
+            self.save()
+
+    def refresh(self, session: Any) -> NoReturn:
+        """
+        Download the list of the templates if it was modified and save the catalog.
+
+        Parameters
+        ----------
+        session : ~requests.Session
+            HTTP session used to download the list
+
+        Raises
+        ------
+        requests.RequestException
+            when the list cannot be downloaded
+        """
+        headers = {"Accept": "application/vnd.github+json"}
+        if self.etag is not None and self.time is not None:
+            headers['If-None-Match'] = self.etag
+        response = session.get(self.CONFIG['url'], headers=headers,
+                               timeout=self.CONFIG['timeout'])
+        if response.status_code == 304:
+            with self._lock:
+                self.time = time.time()
+                self.missing = []
+                self.save()
+            return
+        response.raise_for_status()
+        templates = {}
+        # the templates of the root folder first, then the ones of the sub-folders (Global, community)
+        paths = sorted((item['path'][:-len(".gitignore")] for item in response.json()['tree']
+                        if item['type'] == "blob" and item['path'].endswith(".gitignore")),
+                       key=lambda path: path.count("/"))
+        for path in paths:
+            templates.setdefault(path.rsplit("/", 1)[-1].lower(), path)
+        with self._lock:
+            self.templates = templates
+            self.missing = []
+            self.time = time.time()
+            self.etag = response.headers.get("ETag")
+            self.save()
+
+    def refresh_in_background(self, session: Any) -> NoReturn:
+        """
+        Refresh the catalog in a background thread if it is stale (at most once per process).
+        The process waits for the end of the refresh (at most ``CONFIG['timeout']``) before exiting.
+
+        Parameters
+        ----------
+        session : ~requests.Session
+            HTTP session used to download the list
+        """
+        with self._lock:
+            if not self.is_stale() or self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._refresh_quietly, args=(session,),
+                                            name="gitignore-catalog")
+            self._thread.start()
+
+    def _refresh_quietly(self, session: Any) -> NoReturn:
+        try:
+            self.refresh(session)
+        except Exception:
+            # the current catalog stays usable, it is refreshed again on the next run
+            pass
+
+    def save(self) -> NoReturn:
+        """
+        Write the catalog on the disk (the lock must be held).
+        """
+        try:
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            tmp_filename = f"{self.filename}.{os.getpid()}.tmp"
+            write_in_json_file(tmp_filename, {
+                "templates": self.templates,
+                "missing": self.missing,
+                "time": self.time,
+                "etag": self.etag,
+            })
+            os.replace(tmp_filename, self.filename)
+        except OSError:
+            pass
+
+
+class GitIgnoreFetcher:
+    """
+    Download the `.gitignore` templates of the github/gitignore repository concurrently.
+
+    All the downloads share a single HTTP session (with a pool of keep-alive connections).
+    Each download has its own timeout and all the downloads of a call have a common deadline.
+
+    The names are resolved with the `GitIgnoreCatalog`, so no request is sent for the names without
+    template. The templates are kept in the `GitIgnoreCache`: a template is only revalidated (with a conditional
+    request) once its TTL is expired and the cached one is used when the server cannot be reached.
+    With ``CONFIG['offline']``, only the cached templates are used and the network is never accessed.
+
+    Attributes
+    ----------
+    session : ~requests.Session
+        HTTP session shared by the downloads (created on first use)
+    cache : GitIgnoreCache
+        cache of the downloaded templates
+    catalog : GitIgnoreCatalog
+        index of the available templates
+    """
+
+    CONFIG = {
+        "url": "https://raw.githubusercontent.com/github/gitignore/master/{name}.gitignore",
+        "timeout": 10,
+        "deadline": 30,
+        "max_workers": 8,
+        "offline": False,
+    }
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> NoReturn:
+        """
+        Constructor and initializer.
+        """
+        self.session = None
+        self.cache = GitIgnoreCache.get()
+        self.catalog = GitIgnoreCatalog.get()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> Any:
+        """
+        Return the fetcher shared by the whole process.
+
+        Returns
+        -------
+        fetcher : GitIgnoreFetcher
+            the shared fetcher
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def get_session(self) -> Any:
+        """
+        Return the HTTP session, created on first use.
+
+        Returns
+        -------
+        session : ~requests.Session
+            the shared session
+        """
+        with self._lock:
+            if self.session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                self.session = requests.Session()
+                # one pool for the templates and one for the catalog
+                adapter = HTTPAdapter(pool_connections=2,
+                                      pool_maxsize=self.CONFIG['max_workers'])
+                self.session.mount("https://", adapter)
+                self.session.mount("http://", adapter)
+            return self.session
+
+    def fetch(self, name: str, timeout: float = None) -> str:
+        """
+        Download a template (if it was modified since it was cached) and update the cache.
+
+        Parameters
+        ----------
+        name : str
+            path of the template without the extension (like "Python")
+        timeout : float
+            maximum number of seconds to wait for the server (``CONFIG['timeout']`` if None)
+
+        Returns
+        -------
+        content : str
+            content of the template, None if it does not exist
+
+        Raises
+        ------
+        requests.RequestException
+            when the template cannot be downloaded
+        """
+        entry = self.cache.lookup(name)
+        headers = {}
+        if entry is not None and entry['etag'] is not None:
+            headers['If-None-Match'] = entry['etag']
+        if entry is not None and entry['last_modified'] is not None:
+            headers['If-Modified-Since'] = entry['last_modified']
+        response = self.get_session().get(self.CONFIG['url'].format(name=name), headers=headers,
+                                          timeout=self.CONFIG['timeout'] if timeout is None else timeout)
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(name)
+            return entry['content']
+        if response.status_code == 404:
+            self.cache.remove(name)
+            self.catalog.mark_missing(name)
+            return None
+        response.raise_for_status()
+        content = response.content.decode("utf-8")
+        self.cache.store(name, content, response.headers.get("ETag"),
+                         response.headers.get("Last-Modified"))
+        return content
+
+    def fetch_all(self, names: Iterable[str]) -> dict:
+        """
+        Get the templates of several languages: the names are resolved with the catalog, then the fresh
+        cached templates are used directly and the other ones are downloaded concurrently before
+        the deadline (``CONFIG['deadline']``).
+        The names without template are skipped with a warning. When a template cannot be downloaded in time,
+        its cached version is used (or it is skipped) with a warning.
+
+        Parameters
+        ----------
+        names : iterable of strings
+            names of the languages and frameworks
+
+        Returns
+        -------
+        contents : dict
+            content of the templates indexed by their path (like "Node"), in the order of the names
+        """
+        if not self.CONFIG['offline']:
+            self.catalog.refresh_in_background(self.get_session())
+        templates = []
+        for name in names:
+            template = self.catalog.resolve(name)
+            if template is None:
+                self.warn(name, "there is no template for this name")
+            elif template not in templates:
+                templates.append(template)
+        contents = {}
+        pending = []
+        for template in templates:
+            entry = self.cache.lookup(template)
+            if entry is not None and (self.CONFIG['offline'] or self.cache.is_fresh(entry)):
+                contents[template] = entry['content']
+            elif self.CONFIG['offline']:
+                self.warn(template, "offline mode")
+            else:
+                pending.append(template)
+        if pending:
+            self.download(pending, contents)
+            self.cache.save()
+        return {template: contents[template] for template in templates if contents.get(template) is not None}
+
+    def download(self, names: list, contents: dict) -> NoReturn:
+        """
+        Download concurrently several templates before the deadline (``CONFIG['deadline']``).
+
+        Parameters
+        ----------
+        names : list of strings
+            names of the templates
+        contents : dict
+            dictionary where the content of each template is put (None if it does not exist)
+        """
+        deadline = time.monotonic() + self.CONFIG['deadline']
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(names), self.CONFIG['max_workers']))
+        futures = {}
+        try:
+            for name in names:
+                futures[name] = executor.submit(self.fetch, name)
+            wait(futures.values(), timeout=max(deadline - time.monotonic(), 0))
+        finally:
+            # the downloads not started are cancelled (cancel_futures of shutdown needs Python 3.9)
+            # and the downloads still running are abandoned (they end with their own timeout)
+            for future in futures.values():
+                future.cancel()
+            executor.shutdown(wait=False)
+        for name, future in futures.items():
+            # the downloads cancelled before their start also exceeded the deadline
+            if not future.done() or future.cancelled():
+                reason = "the deadline is exceeded"
+            elif future.exception() is None:
+                contents[name] = future.result()
+                continue
+            else:
+                reason = future.exception()
+            entry = self.cache.lookup(name)
+            if entry is None:
+                self.warn(name, reason)
+            else:
+                self.warn(name, reason, stale=True)
+                contents[name] = entry['content']
+
+    @staticmethod
+    def warn(name: str, reason: Any, stale: bool = False) -> NoReturn:
+        """
+        Show that a template cannot be downloaded.
+
+        Parameters
+        ----------
+        name : str
+            name of the template
+        reason : Any
+            why the template cannot be downloaded
+        stale : bool
+            True if the expired cached template is used instead, False if the template is skipped
+        """
+        action = "the cached one is used" if stale else "it is skipped"
+        print(
+            f"{SHELL_COLORS['yellow']}Warning : the .gitignore template of {name} cannot be downloaded, {action} ({reason}){SHELL_COLORS['endcolor']}")
+
+
+def normalize_pattern(line: str) -> str:
+    """
+    Return the canonical form of a line of a `.gitignore` file.
+
+    The unescaped trailing spaces are removed (git ignores them) and a leading ``**/`` is removed
+    from the patterns without other slash (they already match at any depth).
+
+    Parameters
+    ----------
+    line : str
+        line of the file
+
+    Returns
+    -------
+    pattern : str
+        the canonical pattern (starting with "!" for a negation), None for a blank line or a comment
+    """
+    if line.startswith("#"):
+        return None
+    pattern = line.rstrip(" ")
+    if pattern.endswith("\\") and len(pattern) < len(line):
+        pattern += " "
+    if not pattern.strip():
+        return None
+    prefix = "!" if pattern.startswith("!") else ""
+    body = pattern[len(prefix):]
+    while body.startswith("**/") and len(body) > 3 and "/" not in body[3:].rstrip("/"):
+        body = body[3:]
+    return prefix + body
+
+
+def merge_templates(templates: dict) -> str:
+    """
+    Merge several `.gitignore` templates into a compact file with one section per template.
+
+    The comments and the blank lines are removed. A pattern is dropped when a previous pattern
+    of the same kind (exclusion or negation) already matches all its paths: the same pattern,
+    the same pattern without the directory-only slash or a glob without slash matching the name
+    (like ``*.log`` for ``npm-debug.log``). Because the last matching pattern wins, it is only
+    dropped when no pattern of the other kind is between them, so the result ignores exactly
+    the same paths as the concatenated templates.
+
+    Parameters
+    ----------
+    templates : dict
+        content of the templates indexed by their name, in the order of the sections
+
+    Returns
+    -------
+    content : str
+        the merged file
+    """
+    # position of the last emission of each pattern and of the last pattern of each kind
+    positions = {}
+    last_positions = {False: -1, True: -1}
+    # position, regex and directory-only flag of the emitted globs without slash, by kind
+    globs = {False: [], True: []}
+    sections = []
+    position = 0
+    for name, content in templates.items():
+        patterns = []
+        for line in content.splitlines():
+            pattern = normalize_pattern(line)
+            if pattern is None:
+                continue
+            negation = pattern.startswith("!")
+            body = pattern[1:] if negation else pattern
+            since = last_positions[not negation]
+            base = body.rstrip("/")
+            if positions.get((negation, body), -1) > since or \
+                    (body.endswith("/") and positions.get((negation, base), -1) > since):
+                continue
+            if "/" not in base and not GLOB_CHARACTERS.search(base) and \
+                    any(glob_position > since and (body.endswith("/") or not directory_only) and regex.match(base)
+                        for glob_position, regex, directory_only in globs[negation]):
+                continue
+            positions[(negation, body)] = position
+            last_positions[negation] = position
+            if "/" not in base and "\\" not in base and GLOB_CHARACTERS.search(base):
+                globs[negation].append((position, re.compile(fnmatch.translate(base)),
+                                        body.endswith("/")))
+            position += 1
+            patterns.append(pattern)
+        if patterns:
+            sections.append("\n".join([f"# {name}", *patterns]) + "\n")
+    return "\n".join(sections)
+
+
+def translate_pattern(pattern: str) -> str:
+    """
+    Translate a pattern of a `.gitignore` file into a regular expression.
+
+    The regular expression matches the paths relative to the folder of the file, with a trailing
+    slash for the folders (like ``src/main.c`` or ``build/``).
+
+    Parameters
+    ----------
+    pattern : str
+        the pattern without the "!" of the negations (see ``normalize_pattern``)
+
+    Returns
+    -------
+    regex : str
+        the regular expression of the pattern
+    """
+    directory_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    parts = [] if anchored else ["(?:.*/)?"]
+    index = 0
+    while index < len(pattern):
+        character = pattern[index]
+        if pattern.startswith("**", index) and (index == 0 or pattern[index - 1] == "/"):
+            if pattern.startswith("**/", index):
+                parts.append("(?:.*/)?")
+                index += 3
+                continue
+            if index + 2 == len(pattern):
+                parts.append(".+" if index else ".*")
+                break
+        if character == "*":
+            parts.append("[^/]*")
+        elif character == "?":
+            parts.append("[^/]")
+        elif character == "\\" and index + 1 < len(pattern):
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        elif character == "[" and "]" in pattern[index + 2:]:
+            end = pattern.index("]", index + 2)
+            content = pattern[index + 1:end]
+            if content[0] in "!^":
+                content = "^" + content[1:]
+            parts.append(f"[{content}]")
+            index = end
+        else:
+            parts.append(re.escape(character))
+        index += 1
+    parts.append("/" if directory_only else "/?")
+    return "".join(parts)
+
+
+class GitIgnoreMatcher:
+    """
+    Compiled patterns of a `.gitignore` file.
+
+    The consecutive patterns of the same kind (exclusions or negations) are compiled into a single
+    regular expression, so a path is matched with a few searches from the last group to the first.
+
+    Attributes
+    ----------
+    groups : list of tuples
+        compiled regular expression of each group of patterns and if it is a group of negations
+    """
+
+    def __init__(self, content: str = "") -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        content : str
+            content of the `.gitignore` file
+        """
+        self.groups = []
+        regexes = []
+        negation = False
+        for line in content.splitlines():
+            pattern = normalize_pattern(line)
+            if pattern is None:
+                continue
+            if pattern.startswith("!") != negation and regexes:
+                self.groups.append((re.compile("|".join(regexes)), negation))
+                regexes = []
+            negation = pattern.startswith("!")
+            regexes.append(
+                f"(?:{translate_pattern(pattern[1:] if negation else pattern)})")
+        if regexes:
+            self.groups.append((re.compile("|".join(regexes)), negation))
+        self.groups.reverse()
+
+    @classmethod
+    def from_file(cls, filename: str) -> Any:
+        """
+        Compile a `.gitignore` file.
+
+        Parameters
+        ----------
+        filename : str
+            path of the file
+
+        Returns
+        -------
+        matcher : GitIgnoreMatcher
+            the compiled file, without pattern if the file cannot be read
+        """
+        try:
+            with open(filename, "r", encoding="utf-8") as file:
+                return cls(file.read())
+        except (OSError, UnicodeDecodeError):
+            return cls()
+
+    def match(self, path: str, is_directory: bool = False) -> bool:
+        """
+        Test if a path is ignored.
+
+        Parameters
+        ----------
+        path : str
+            path relative to the folder of the `.gitignore` file, with "/" as separator
+        is_directory : bool
+            if the path is a folder
+
+        Returns
+        -------
+        ignored : bool
+            True if the last pattern matching the path is not a negation
+
+        Notes
+        -----
+        The parent folders of the path are not tested: a path inside an ignored folder is
+        ignored even if no pattern matches it, so the ignored folders should not be explored.
+        """
+        if is_directory:
+            path += "/"
+        for regex, negation in self.groups:
+            if regex.fullmatch(path):
+                return not negation
+        return False
+
+
+__all__ = [
+    'GitIgnoreCache',
+    'GitIgnoreCatalog',
+    'GitIgnoreFetcher',
+    'GitIgnoreMatcher',
+    'merge_templates',
+    'normalize_pattern',
+    'translate_pattern',
+]
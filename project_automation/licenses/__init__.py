@@ -1,29 +1,108 @@
-from . import apache2
-from . import bsd2
-from . import bsd3
-from . import cc1
-from . import eclipse2
-from . import gnu_affero3
-from . import gnu_lesser21
-from . import gnu_lesser3
-from . import gnu2
-from . import gnu3
-from . import mit
-from . import mozilla2
-from . import unlicense
+import gzip
+import pkgutil
+import re
+
+
+# All available licenses indexed by their SPDX identifier.
+# The texts are stored compressed in the `<spdx_id>.txt.gz` resources of this package.
+LICENSES = {
+    "Apache-2.0": ("Apache License 2.0", "apache"),
+    "BSD-3-Clause": ("BSD 3-Clause \"New\" or \"Revised\" License", "bsd3"),
+    "BSD-2-Clause": ("BSD 2-Clause \"Simplified\" License", "bsd2"),
+    "CC0-1.0": ("Creative Commons Zero v1.0 Universal", "CC"),
+    "EPL-2.0": ("Eclipse Public License 2.0", "eclipse"),
+    "GPL-3.0": ("GNU General Public License v3.0", "gnu3"),
+    "GPL-2.0": ("GNU General Public License v2.0", "gnu2"),
+    "AGPL-3.0": ("GNU Affero General Public License v3.0", "gnuAffero3"),
+    "LGPL-3.0": ("GNU Lesser General Public License v3.0", "gnuLess3"),
+    "LGPL-2.1": ("GNU Lesser General Public License v2.1", "gnuLess2.1"),
+    "MIT": ("MIT License", "mit"),
+    "MPL-2.0": ("Mozilla Public License 2.0", "mozilla"),
+    "Unlicense": ("Unlicense", "unlicense"),
+}
+
+# Lower-cased SPDX identifiers, full names and shortcuts to their SPDX identifier
+_INDEX = {key.lower(): spdx_id for spdx_id, names in LICENSES.items()
+          for key in (spdx_id, *names)}
+
+PLACEHOLDERS = re.compile(r"year_to_add|username_to_add")
+
+
+def get_spdx_id(key: str) -> str:
+    """
+    Get the SPDX identifier of a license.
+
+    Parameters
+    ----------
+    key : str
+        SPDX identifier, full name or shortcut of the license (case insensitive)
+
+    Returns
+    -------
+    spdx_id : str
+        the SPDX identifier of the license
+
+    Raises
+    ------
+    KeyError
+        when the license is not referenced
+    """
+    return _INDEX[key.lower()]
+
+
+def get_content(key: str) -> str:
+    """
+    Decompress and return the raw text of a license.
+
+    Parameters
+    ----------
+    key : str
+        SPDX identifier, full name or shortcut of the license (case insensitive)
+
+    Returns
+    -------
+    content : str
+        the license text with its placeholders
+
+    Raises
+    ------
+    KeyError
+        when the license is not referenced
+    """
+    data = pkgutil.get_data(__name__, f"{get_spdx_id(key)}.txt.gz")
+    return gzip.decompress(data).decode("utf-8")
+
+
+def render(key: str, year: str, username: str) -> str:
+    """
+    Return the text of a license with its placeholders replaced in a single pass.
+
+    Parameters
+    ----------
+    key : str
+        SPDX identifier, full name or shortcut of the license (case insensitive)
+    year : str
+        year to put in the copyright
+    username : str
+        name of the copyright holder
+
+    Returns
+    -------
+    content : str
+        the rendered license text
+
+    Raises
+    ------
+    KeyError
+        when the license is not referenced
+    """
+    values = {"year_to_add": str(year), "username_to_add": username}
+    return PLACEHOLDERS.sub(lambda match: values[match.group(0)], get_content(key))
+
 
 __all__ = [
-    'apache2',
-    'bsd2',
-    'bsd3',
-    'cc1',
-    'eclipse2',
-    'gnu_affero3',
-    'gnu_lesser21',
-    'gnu_lesser3',
-    'gnu2',
-    'gnu3',
-    'mit',
-    'mozilla2',
-    'unlicense',
+    'LICENSES',
+    'get_content',
+    'get_spdx_id',
+    'render',
 ]
@@ -1,7 +1,37 @@
 import argparse
-import inspect
+import os
+import sys
+from typing import BinaryIO
 
-from project_automation import projects, utils
+from project_automation import manifest
+from project_automation.settings import ARCHIVE_FORMATS
+
+
+def open_archive_stream(filename: str) -> BinaryIO:
+    """
+    Open the stream where the archive of the project is written.
+
+    Parameters
+    ----------
+    filename : str
+        path of the archive, "-" for the standard output
+
+    Returns
+    -------
+    stream : BinaryIO
+        binary stream of the archive
+
+    Notes
+    -----
+    With the standard output, the archive keeps the original descriptor and the standard output
+    of the process (with the external programs) is redirected to the standard error.
+    """
+    if filename != "-":
+        return open(filename, "wb")
+    sys.stdout.flush()
+    stream = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return stream
 
 
 def main():
@@ -9,6 +39,19 @@ def main():
     parser = argparse.ArgumentParser(allow_abbrev=False)
     parser.add_argument('-i', '--allow-install',
                         help='allows to install used commands/packages (False by default)', action='store_true', default=False)
+    parser.add_argument('--refresh-toolchains', action='store_true', default=False,
+                        help='probe again the required programs instead of using the cache (False by default)')
+    parser.add_argument('--upgrade-system', action='store_true', default=False,
+                        help='upgrade all the packages of the system before installing the required programs (False by default)')
+    parser.add_argument('--offline', action='store_true', default=False,
+                        help='never use the network to download the .gitignore templates, only the cached ones (False by default)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of threads writing the files of the project, small projects are always written sequentially (1 by default)')
+    archive_group = parser.add_argument_group(title='Archive options')
+    archive_group.add_argument('--archive', metavar='FILE', default=None,
+                               help='write the project into an archive instead of its path ("-" for the standard output)')
+    archive_group.add_argument('--archive-format', choices=list(ARCHIVE_FORMATS), default=None,
+                               help='format of the archive (guessed from the extension of the archive by default, else tar.gz)')
     github_group = parser.add_argument_group(title='Github options')
     github_group.add_argument('--github', action='store_true',
                               help='use the github versioning')
@@ -21,15 +64,24 @@ def main():
     subparsers = parser.add_subparsers(
         help='Use one of the available sub-command', dest='command')
 
-    modules = inspect.getmembers(projects, inspect.ismodule)
-    parser_classes = []
-    for _, module in modules:
-        classes_in_module = inspect.getmembers(module, inspect.isclass)
-        for _, Klass in list(filter(utils.get_parser_class, classes_in_module)):
-            parser_classes.append(Klass(subparsers))
+    manifest.add_subcommands(subparsers)
 
     # Get the CLI results
     result = parser.parse_args()
+    if result.archive is not None and result.github:
+        parser.error("the --archive and --github options cannot be used together")
+    if result.archive not in (None, "-"):
+        result.archive = os.path.abspath(result.archive)
+
+    # Imported after the parsing, so the help does not load them
+    from project_automation.commands import PackageIndexStamp, ProbeCache
+    from project_automation.files import ArchiveWriter, VirtualTree
+    from project_automation.gitignore import GitIgnoreFetcher
+
+    ProbeCache.CONFIG['refresh'] = result.refresh_toolchains
+    PackageIndexStamp.CONFIG['upgrade'] = result.upgrade_system
+    VirtualTree.CONFIG['jobs'] = result.jobs
+    GitIgnoreFetcher.CONFIG['offline'] = result.offline
 
     # Creation of the arguments for the projects creation
     github_settings = {
@@ -44,16 +96,27 @@ def main():
         "allow_install": result.allow_install,
     }
 
-    # Iterate each parser class and get its key-word argument
-    for parser_class in parser_classes:
-        kwargs = parser_class.get_result(result, kwargs)
+    # Import only the parser class of the chosen sub-command and get its key-word argument
+    parser_class = manifest.load_parser(result.command)
+    kwargs = parser_class().get_result(result, kwargs)
 
     # Generation of the project
     Klass = kwargs.pop('klass')
     if Klass != None:
         project = Klass(**kwargs)
-        project.create()
-        project.commit()
+        if result.archive is None:
+            project.generate()
+            project.commit()
+        else:
+            archive_format = result.archive_format or ArchiveWriter.guess_format(
+                result.archive)
+            try:
+                with open_archive_stream(result.archive) as stream, ArchiveWriter(stream, archive_format) as archive:
+                    project.generate(archive)
+            except BaseException:
+                if result.archive != "-" and os.path.exists(result.archive):
+                    os.remove(result.archive)
+                raise
     else:
         raise ValueError("Any class project match with your command line")
 
@@ -0,0 +1,148 @@
+import argparse
+import importlib
+from typing import ClassVar, NoReturn
+
+
+# Declarative description of all the available sub-commands.
+# Each entry gives the description and the arguments of the sub-command
+# and the import path of the associated `utils.Parser` class.
+# The project modules are only imported for the chosen sub-command.
+SUBCOMMANDS = {
+    "c": {
+        "description": "sub-command to generate C type project",
+        "parser": "project_automation.projects.c.ParserC",
+        "arguments": [],
+    },
+    "cpp": {
+        "description": "sub-command to generate C++ type project",
+        "parser": "project_automation.projects.cpp.ParserCPP",
+        "arguments": [],
+    },
+    "deno": {
+        "description": "sub-command to generate Deno type project",
+        "parser": "project_automation.projects.deno.ParserDeno",
+        "arguments": [],
+    },
+    "flutter": {
+        "description": "sub-command to generate Flutter type project",
+        "parser": "project_automation.projects.flutter.ParserFlutter",
+        "arguments": [],
+    },
+    "go": {
+        "description": "sub-command to generate Golang type project",
+        "parser": "project_automation.projects.go.ParserGolang",
+        "arguments": [],
+    },
+    "haskell": {
+        "description": "sub-command to generate Haskell type project",
+        "parser": "project_automation.projects.haskell.ParserHaskell",
+        "arguments": [],
+    },
+    "java": {
+        "description": "sub-command to generate Java type project",
+        "parser": "project_automation.projects.java.ParserJava",
+        "arguments": [
+            (('package_name',), {
+                'help': 'name of the main java package'}),
+            (('-t', '--type'), {
+                'choices': ['classic', 'ant', 'mvn'], 'default': 'classic',
+                'help': 'create some specific java project (classic by default)'}),
+            (('-c', '--company-name'), {
+                'default': 'nobody',
+                'help': 'name of the compagny for the name of the package (nobody by default)'}),
+            (('-s', '--scripts'), {
+                'default': False, 'action': 'store_true',
+                'help': 'generate some scripts to simplify usage for "classic" and "ant" only (False by default)'}),
+        ],
+    },
+    "nodejs": {
+        "description": "sub-command to generate NodeJS type project",
+        "parser": "project_automation.projects.nodejs.ParserNodeJS",
+        "arguments": [
+            (('-t', '--type'), {
+                'choices': ['classic', 'react', 'webpack'], 'default': 'classic',
+                'help': 'create some specific NodeJS project (classic by default with no dependencies)'}),
+        ],
+    },
+    "php": {
+        "description": "sub-command to generate PHP type project",
+        "parser": "project_automation.projects.php.ParserPHP",
+        "arguments": [],
+    },
+    "python": {
+        "description": "sub-command to generate Python type project",
+        "parser": "project_automation.projects.python.ParserPython",
+        "arguments": [
+            (('-t', '--type'), {
+                'choices': ['classic', 'cython'], 'default': 'classic',
+                'help': 'create some specific python project (classic by default)'}),
+            (('--no-env',), {
+                'action': 'store_true', 'default': False,
+                'help': 'no use the python virtual environment (False by default)'}),
+            (('--env',), {
+                'choices': ['pipenv', 'venv'], 'default': 'pipenv',
+                'help': 'choice a python virtual environment (pipenv by default)'}),
+            (('-p', '--packages'), {
+                'nargs': '+',
+                'help': 'package to install for this specific project'}),
+        ],
+    },
+    "website": {
+        "description": "sub-command to generate website type project",
+        "parser": "project_automation.projects.website.ParserWebsite",
+        "arguments": [
+            (('-t', '--type'), {
+                'choices': ['classic', 'typescript'], 'default': 'classic',
+                'help': 'create some specific website project (classic by default)'}),
+        ],
+    },
+}
+
+
+def add_subcommands(subparsers: argparse._SubParsersAction, subcommands: dict = SUBCOMMANDS) -> NoReturn:
+    """
+    Add all the sub-commands of the manifest without importing the project modules.
+
+    Parameters
+    ----------
+    subparsers : argparse._SubParsersAction
+        subparser instance to add subcommands
+    subcommands : dict
+        manifest of the sub-commands to add
+    """
+    for subcommand, entry in subcommands.items():
+        parser = subparsers.add_parser(
+            subcommand, description=entry['description'])
+        parser.add_argument(
+            'path', help='path of the parent root for create the project structure')
+        parser.add_argument(
+            'project_name', help='name of the project')
+        for args, kwargs in entry['arguments']:
+            parser.add_argument(*args, **kwargs)
+
+
+def load_parser(subcommand: str, subcommands: dict = SUBCOMMANDS) -> ClassVar:
+    """
+    Import and return the parser class associated to the sub-command.
+
+    Parameters
+    ----------
+    subcommand : str
+        name of the chosen sub-command
+    subcommands : dict
+        manifest of the available sub-commands
+
+    Returns
+    -------
+    parser_class : class
+        the `utils.Parser` child class of the sub-command
+
+    Raises
+    ------
+    ValueError
+        when the sub-command is not referenced in the manifest
+    """
+    if subcommand not in subcommands:
+        raise ValueError(f"unknown sub-command: {subcommand}")
+    module_name, class_name = subcommands[subcommand]['parser'].rsplit('.', 1)
+    return getattr(importlib.import_module(module_name), class_name)
@@ -1,17 +1,39 @@
-# Base files
-from .project import Project
-
-from .c import CProject, ParserC
-from .cpp import CPPProject, ParserCPP
-from .deno import DenoProject, ParserDeno
-from .flutter import FlutterProject, ParserFlutter
-from .go import GolangProject, ParserGolang
-from .haskell import HaskellProject, ParserHaskell
-from .java import AntProject, JavaProject, MavenProject, ParserJava
-from .nodejs import NodeJSProject, ParserNodeJS, ReactJSProject, WebpackJSProject
-from .php import ParserPHP, PHPWebsiteProject
-from .python import CythonProject, ParserPython, PythonProject
-from .website import ParserWebsite, SimpleWebsiteProject, TypescriptWebsiteProject
+import importlib
+from typing import Any
+
+# Other projects are imported on first access only
+_LAZY_IMPORTS = {
+    'Project': '.project',
+    'CProject': '.c',
+    'ParserC': '.c',
+    'CPPProject': '.cpp',
+    'ParserCPP': '.cpp',
+    'DenoProject': '.deno',
+    'ParserDeno': '.deno',
+    'FlutterProject': '.flutter',
+    'ParserFlutter': '.flutter',
+    'GolangProject': '.go',
+    'ParserGolang': '.go',
+    'HaskellProject': '.haskell',
+    'ParserHaskell': '.haskell',
+    'AntProject': '.java',
+    'JavaProject': '.java',
+    'MavenProject': '.java',
+    'ParserJava': '.java',
+    'NodeJSProject': '.nodejs',
+    'ParserNodeJS': '.nodejs',
+    'ReactJSProject': '.nodejs',
+    'WebpackJSProject': '.nodejs',
+    'ParserPHP': '.php',
+    'PHPWebsiteProject': '.php',
+    'CythonProject': '.python',
+    'ParserPython': '.python',
+    'PythonProject': '.python',
+    'ParserWebsite': '.website',
+    'SimpleWebsiteProject': '.website',
+    'TypescriptWebsiteProject': '.website',
+}
+
 
 __all__ = [
     'Project',
@@ -46,3 +68,29 @@ __all__ = [
     'ParserPython',
     'ParserWebsite',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the module associated to the name on first access.
+
+    Parameters
+    ----------
+    name : str
+        name of the attribute to get
+
+    Returns
+    -------
+    value : Any
+        the attribute imported from its module
+
+    Raises
+    ------
+    AttributeError
+        when the name is not available in the module
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
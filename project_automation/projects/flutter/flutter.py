@@ -38,6 +38,10 @@ class FlutterProject(Project):
         },
     }
 
+    VIRTUAL_TREE = False
+    # `flutter create` writes the absolute path of the project (like in ios/Flutter/Generated.xcconfig)
+    STAGED = False
+
     def __init__(self, path: str, name: str, github_settings: dict = {}, **kwargs: Any) -> NoReturn:
         """
         Constructor and initializer.
@@ -64,8 +68,8 @@ class FlutterProject(Project):
         utils.execute_command2
         """
         super().create()
-        os.chdir(os.path.join(self.path, '..'))
-        execute_command2(f"flutter create {self.name}")
+        execute_command2(f"flutter create {os.path.basename(self.path)}",
+                         cwd=os.path.dirname(self.path))
 
     def verify_installation(self) -> NoReturn:
         """
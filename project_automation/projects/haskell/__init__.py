@@ -18,25 +18,17 @@ class ParserHaskell(Parser):
     ----------
     subcommand : str
         subcommand to show in the CLI
-    parser : argparse.ArgumentParser
-        subcommand parser
 
     See also
     --------
-    utils.get_parser_class
+    manifest.SUBCOMMANDS
     """
 
-    def __init__(self, subparser: argparse._SubParsersAction) -> NoReturn:
+    def __init__(self) -> NoReturn:
         """
         Constructor and initializer.
-
-        Parameters
-        ----------
-        subparser : argparse._SubParsersAction
-            subparser instance to add subcommands
         """
-        super().__init__(subparser, 'haskell',
-                         'sub-command to generate Haskell type project')
+        super().__init__('haskell')
 
     def modify_project_settings(self, result: argparse.Namespace, project_settings: dict) -> dict:
         """
@@ -23,33 +23,17 @@ class ParserJava(Parser):
     ----------
     subcommand : str
         subcommand to show in the CLI
-    parser : argparse.ArgumentParser
-        subcommand parser
 
     See also
     --------
-    utils.get_parser_class
+    manifest.SUBCOMMANDS
     """
 
-    def __init__(self, subparser: argparse._SubParsersAction) -> NoReturn:
+    def __init__(self) -> NoReturn:
         """
         Constructor and initializer.
-
-        Parameters
-        ----------
-        subparser : argparse._SubParsersAction
-            subparser instance to add subcommands
         """
-        super().__init__(subparser, 'java',
-                         'sub-command to generate Java type project')
-        self.parser.add_argument(
-            'package_name', help='name of the main java package')
-        self.parser.add_argument('-t', '--type', choices=[
-            'classic', 'ant', 'mvn'], default='classic', help='create some specific java project (classic by default)')
-        self.parser.add_argument('-c', '--company-name', default='nobody',
-                                 help='name of the compagny for the name of the package (nobody by default)')
-        self.parser.add_argument('-s', '--scripts', default=False, action='store_true',
-                                 help='generate some scripts to simplify usage for "classic" and "ant" only (False by default)')
+        super().__init__('java')
 
     def modify_project_settings(self, result: argparse.Namespace, project_settings: dict) -> dict:
         """
@@ -1,10 +1,9 @@
 import os
-import requests
 from typing import Any, NoReturn
 from xml.etree import ElementTree as ET
 
 from project_automation.commands import AntCommand
-from project_automation.files import JavaFile, Folder, XMLFile
+from project_automation.files import ContentStore, JavaFile, Folder, XMLFile
 from project_automation.projects.java.java import JavaProject
 
 
@@ -44,6 +43,8 @@ class AntProject(JavaProject):
         },
     }
 
+    VIRTUAL_TREE = False
+
     def __init__(self, path: str, name: str, package_name: str, company_name: str, executing_scripts: bool = True, github_settings: dict = {}, **kwargs: Any) -> NoReturn:
         """
         Constructor and initializer.
@@ -92,9 +93,9 @@ class AntProject(JavaProject):
         lib_path = os.path.join(self.path, 'lib')
         lib_dir = Folder(lib_path)
         url = "https://repo1.maven.org/maven2/org/junit/platform/junit-platform-console-standalone/1.6.2/junit-platform-console-standalone-1.6.2.jar"
-        print("Downloading JUnit JAR file ...")
-        response = requests.get(url, allow_redirects=False)
-        open(os.path.join(lib_path, "junit-platform-console-standalone-1.6.2.jar"), 'wb').write(response.content)
+        store = ContentStore.get()
+        store.materialize(store.fetch(url), os.path.join(
+            lib_path, "junit-platform-console-standalone-1.6.2.jar"), shared=True)
         self.root.add(lib_dir)
 
         java_file = JavaFile(main_path, "Main", package)
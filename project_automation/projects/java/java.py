@@ -2,6 +2,7 @@ import os
 import sys
 from typing import Any, NoReturn
 
+from project_automation import templates
 from project_automation.commands import JavaCommand, JavacCommand
 from project_automation.files import Folder, JavaFile, BashFile, BatchFile, TextFile
 from project_automation.projects import Project
@@ -90,54 +91,44 @@ class JavaProject(Project):
         if self.generate_files:
             if self.executing_scripts:
                 name = self.company_name
-                if self.company_name == 'nobody' and self.user is not None:
+                if self.company_name == 'nobody' and self.github_settings != {} and self.user is not None:
                     name = self.user.name
                 manifest_file = TextFile(self.path, 'Manifest')
                 manifest_file.write(
                     f"Main-Class: {self.package_name}.Main\nManifest-Version: 1.0\nCreated-By: {name}")
 
-                compile_script_content = f"javac -encoding \"utf-8\" -d build/ src/{self.package_name}/*.java"
+                compile_script_content = templates.render(
+                    'java_compile', package_name=self.package_name)
                 compile_bash_script = BashFile(self.path, 'compile')
                 compile_bash_script.write(compile_script_content)
                 compile_batch_script = BatchFile(self.path, 'compile')
                 compile_batch_script.write(compile_script_content)
                 self.root.add(compile_bash_script, compile_batch_script)
 
-                install_script_content = f"if [ ! -d lib ]; then lib ( mkdir lib )fi\nif [ ! -e lib/junit-platform-console-standalone-1.6.2.jar ]; then cd lib\nwget https://repo1.maven.org/maven2/org/junit/platform/junit-platform-console-standalone/1.6.2/junit-platform-console-standalone-1.6.2.jar"
-                install_script_content2 = f"if not exist lib ( mkdir lib )\nif not exist lib\junit-platform-console-standalone-1.6.2.jar (cd lib\npowershell.exe -command \"Invoke-WebRequest https://repo1.maven.org/maven2/org/junit/platform/junit-platform-console-standalone/1.6.2/junit-platform-console-standalone-1.6.2.jar -o junit-platform-console-standalone-1.6.2.jar\")"
                 install_bash_script = BashFile(self.path, 'install')
-                install_bash_script.write(install_script_content)
+                install_bash_script.write(templates.render('java_install.sh'))
                 install_batch_script = BatchFile(self.path, 'install')
-                install_batch_script.write(install_script_content2)
+                install_batch_script.write(templates.render('java_install.bat'))
                 self.root.add(install_bash_script, install_batch_script)
 
-                if sys.platform == 'win32':
-                    run_script_content = "call compile.bat"
-                else:
-                    run_script_content = "sh compile.sh"
-                run_script_content += f"\njava -cp build {self.package_name}.Main"
+                run_script_content = templates.render(
+                    'java_run', package_name=self.package_name, win32=sys.platform == 'win32')
                 run_bash_script = BashFile(self.path, 'run')
                 run_bash_script.write(run_script_content)
                 run_batch_script = BatchFile(self.path, 'run')
                 run_batch_script.write(run_script_content)
                 self.root.add(run_bash_script, run_batch_script)
 
-                doc_script_content = f"javadoc -encoding \"utf-8\" -docencoding \"utf-8\" -d doc/ src/{self.package_name}/*.java "
+                doc_script_content = templates.render(
+                    'java_doc', package_name=self.package_name)
                 doc_bash_script = BashFile(self.path, 'doc')
                 doc_bash_script.write(doc_script_content)
                 doc_batch_script = BatchFile(self.path, 'doc')
                 doc_batch_script.write(doc_script_content)
                 self.root.add(doc_bash_script, doc_batch_script)
 
-                if sys.platform == 'win32':
-                    package_script_content = "call compile.bat"
-                else:
-                    package_script_content = "sh compile.sh"
-                package_script_content += f"\ncd build/\njar cfm {self.package_name}.jar \"../Manifest.txt\" {self.package_name}/\ncd ..\nmkdir dist\n"
-                if sys.platform == 'win32':
-                    package_script_content += f"move \"build\{self.package_name}.jar\" dist/"
-                else:
-                    package_script_content += f"mv build/{self.package_name}.jar dist/{self.package_name}.jar"
+                package_script_content = templates.render(
+                    'java_package', package_name=self.package_name, win32=sys.platform == 'win32')
                 package_bash_script = BashFile(self.path, 'package')
                 package_bash_script.write(package_script_content)
                 package_batch_script = BatchFile(self.path, 'package')
@@ -44,6 +44,8 @@ class MavenProject(JavaProject):
         },
     }
 
+    VIRTUAL_TREE = False
+
     def __init__(self, path: str, name: str, package_name: str, company_name: str, executing_scripts: bool = False, github_settings: dict = {}, **kwargs: Any) -> NoReturn:
         """
         Constructor and initializer.
@@ -75,10 +77,9 @@ class MavenProject(JavaProject):
         ---------
         utils.execute_command2
         """
-        self.verify_installation()
-        os.chdir(os.path.join(self.path, '..'))
+        self.verify_requirements()
         execute_command2(
-            f"mvn archetype:generate -DgroupId={self.company_name.lower()}.{self.package_name} -DartifactId={self.package_name} -DarchetypeArtifactId=maven-archetype-quickstart -DinteractiveMode=false")
+            f"mvn archetype:generate -DgroupId={self.company_name.lower()}.{self.package_name} -DartifactId={self.package_name} -DarchetypeArtifactId=maven-archetype-quickstart -DinteractiveMode=false", cwd=os.path.dirname(self.path))
         super().create()
 
     def verify_installation(self) -> NoReturn:
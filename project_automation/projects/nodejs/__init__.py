@@ -22,27 +22,17 @@ class ParserNodeJS(Parser):
     ----------
     subcommand : str
         subcommand to show in the CLI
-    parser : argparse.ArgumentParser
-        subcommand parser
 
     See also
     --------
-    utils.get_parser_class
+    manifest.SUBCOMMANDS
     """
 
-    def __init__(self, subparser: argparse._SubParsersAction) -> NoReturn:
+    def __init__(self) -> NoReturn:
         """
         Constructor and initializer.
-
-        Parameters
-        ----------
-        subparser : argparse._SubParsersAction
-            subparser instance to add subcommands
         """
-        super().__init__(subparser, 'nodejs',
-                         'sub-command to generate NodeJS type project')
-        self.parser.add_argument('-t', '--type', choices=[
-            'classic', 'react', 'webpack'], default='classic', help='create some specific NodeJS project (classic by default with no dependencies)')
+        super().__init__('nodejs')
 
     def modify_project_settings(self, result: argparse.Namespace, project_settings: dict) -> dict:
         """
@@ -1,4 +1,3 @@
-import os
 from typing import Any, NoReturn
 
 from project_automation.commands import NPMCommand
@@ -26,7 +25,7 @@ class NodeJSProject(Project):
         github user if ``github_settings`` is not empty
     root : ~files.Folder
         root folder of the project
-    npm_version : tuple of strings
+    npm_version : tuple of integers
         npm version
     """
 
@@ -40,6 +39,8 @@ class NodeJSProject(Project):
         }
     }
 
+    VIRTUAL_TREE = False
+
     def __init__(self, path: str, name: str, github_settings: dict = {}, **kwargs: Any) -> NoReturn:
         """
         Constructor and initializer.
@@ -66,8 +67,7 @@ class NodeJSProject(Project):
         utils.execute_command
         """
         super().create()
-        os.chdir(self.path)
-        execute_command("npm init -y")
+        execute_command("npm init -y", cwd=self.path)
         print(
             "To install packages, launch `npm install -D <package_name1> [<package_name2>, ...]`")
 
@@ -77,11 +77,8 @@ class NodeJSProject(Project):
 
         See also
         --------
-        utils.execute_command
         commands.NPMCommand
         """
         super().verify_installation()
-        code, outs, _ = execute_command(
-            f"npm --version")
-        NPMCommand(self.allow_install)
-        self.npm_version = tuple(outs[0].split('\n')[0].split('.'))
+        npm = NPMCommand(self.allow_install)
+        self.npm_version = npm.get_version()
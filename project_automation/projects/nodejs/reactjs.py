@@ -26,7 +26,7 @@ class ReactJSProject(NodeJSProject):
         github user if ``github_settings`` is not empty
     root : ~files.Folder
         root folder of the project
-    npm_version : tuple of strings
+    npm_version : tuple of integers
         npm version
     use_npx : bool
         use the ``npx`` command
@@ -69,18 +69,17 @@ class ReactJSProject(NodeJSProject):
         utils.execute_command2
         """
         super().create()
-        os.chdir(os.path.join(self.path, '..'))
         if self.use_npx:
             if self.allow_install:
                 execute_command2(
-                    f"npx create-react-app {os.path.basename(self.path)}")
+                    f"npx create-react-app {os.path.basename(self.path)}", cwd=os.path.dirname(self.path))
             else:
                 print(
                     f"Launch `npx create-react-app {os.path.basename(self.path)}` command to create a ReactJS App")
         else:
             if self.allow_install:
                 execute_command2(
-                    f"npm init react-app {os.path.basename(self.path)}")
+                    f"npm init react-app {os.path.basename(self.path)}", cwd=os.path.dirname(self.path))
             else:
                 print(
                     f"Launch `npm init react-app {os.path.basename(self.path)}` command to create a ReactJS App")
@@ -96,7 +95,7 @@ class ReactJSProject(NodeJSProject):
         """
         super().verify_installation()
         NPMCommand(self.allow_install)
-        if self.npm_version >= ('5', '2'):
+        if self.npm_version >= (5, 2):
             NPXCommand(self.allow_install)
             self.use_npx = True
         else:
@@ -1,6 +1,7 @@
 import os
 from typing import Any, NoReturn
 
+from project_automation import templates
 from project_automation.commands import TypescriptCommand
 from project_automation.files import Folder, HTMLFile, CSSFile, SASSFile, JavascriptFile, TypescriptFile
 from project_automation.projects.nodejs.nodejs import NodeJSProject
@@ -27,7 +28,7 @@ class WebpackJSProject(NodeJSProject):
         github user if ``github_settings`` is not empty
     root : ~files.Folder
         root folder of the project
-    npm_version : tuple of strings
+    npm_version : tuple of integers
         npm version
     """
 
@@ -72,13 +73,12 @@ class WebpackJSProject(NodeJSProject):
         ts = 'y' in input(
             "Do you want to include TypeScript files ? (y/n) ").lower()
         super().create()
-        os.chdir(self.path)
         source_folder_path = os.path.join(self.path, "src")
         source_folder = Folder(source_folder_path)
         self.root.add(Folder(os.path.join(self.path, "public")), source_folder)
         if self.allow_install:
             execute_command2(
-                'npm i -D webpack webpack-cli webpack-dev-server @babel/core babel-loader @babel/preset-env html-webpack-plugin html-loader file-loader style-loader css-loader mini-css-extract-plugin')
+                'npm i -D webpack webpack-cli webpack-dev-server @babel/core babel-loader @babel/preset-env html-webpack-plugin html-loader file-loader style-loader css-loader mini-css-extract-plugin', cwd=self.path)
             package_json = read_from_json_file(
                 os.path.join(self.path, 'package.json'))
             package_json['scripts'] = {
@@ -88,10 +88,12 @@ class WebpackJSProject(NodeJSProject):
             write_in_json_file(os.path.join(
                 self.path, 'package.json'), package_json, indent_json=2)
             if sass:
-                execute_command2("npm i -D node-sass sass-loader webpack-sass")
+                execute_command2(
+                    "npm i -D node-sass sass-loader webpack-sass", cwd=self.path)
             if ts:
-                execute_command2("npm i -D ts-loader typescript")
-                execute_command2('tsc --init')
+                execute_command2(
+                    "npm i -D ts-loader typescript", cwd=self.path)
+                execute_command2('tsc --init', cwd=self.path)
                 print("Finally, change target by \"es6\" and module by \"es2015\"")
         else:
             print('Launch this command `npm i -D webpack webpack-cli webpack-dev-server @babel/core babel-loader @babel/preset-env`')
@@ -107,79 +109,9 @@ class WebpackJSProject(NodeJSProject):
                 print("\tnpm i -D ts-loader typescript")
                 print("\ntsc --init")
                 print("Finally, change target by \"es6\" and module by \"es2015\"")
-        ts_content = """{
-        test: /\.tsx?$/,
-        include: [path.resolve(__dirname, "src")],
-        use: "ts-loader",
-        exclude: /node_modules/,
-      },"""
-        ts_resolve = """".tsx", ".ts","""
-        sass_content = """{
-        test: /\.scss$/,
-        include: [path.resolve(__dirname, "src")],
-        use: [MiniCssExtractPlugin.loader, "css-loader", "sass-loader"],
-      },"""
-        webpack_config_content = f"""const path = require("path");
-const HtmlWebpackPlugin = require("html-webpack-plugin");
-const MiniCssExtractPlugin = require("mini-css-extract-plugin");
-
-module.exports = {{
-  mode: "development", // development or production
-  devtool: "eval-source-map",
-  entry: "./src/app.js",
-  module: {{
-    rules: [
-      {{
-        test: /\.jsx?$/,
-        exclude: /node_modules/,
-        include: [path.resolve(__dirname, "src")],
-        use: "babel-loader",
-      }},
-      {ts_content if ts else ''}
-      {{
-        test: /\.css$/,
-        include: [path.resolve(__dirname, "src")],
-        use: [
-          MiniCssExtractPlugin.loader,
-          "css-loader",
-        ],
-      }},
-      {sass_content if sass else ''}
-      {{
-        test: /\.html$/,
-        include: [path.resolve(__dirname, "src")],
-        use: [
-          {{
-            loader: "html-loader",
-            options: {{ minimize: true }},
-          }},
-        ],
-      }},
-      {{
-        test: /\.(png|svg|jpg|jpeg|gif)$/,
-        include: [path.resolve(__dirname, "src")],
-        use: "file-loader",
-      }},
-    ],
-  }},
-  resolve: {{ extensions: [{ts_resolve if ts else ''}".jsx", ".js"] }},
-  plugins: [
-    new HtmlWebpackPlugin({{
-      filename: "index.html",
-      template: "src/index.html",
-    }}),
-    new MiniCssExtractPlugin({{
-      filename: "index.css",
-    }}),
-  ],
-  output: {{
-    filename: "app.bundle.js",
-    path: path.resolve(__dirname, "public"),
-  }},
-}};
-"""
         webpack_config = JavascriptFile(self.path, 'webpack.config')
-        webpack_config.write(webpack_config_content)
+        webpack_config.write(
+            templates.render('webpack.config.js', sass=sass, ts=ts))
         self.root.add(webpack_config)
 
         assets_dir = Folder(os.path.join(source_folder_path, "assets"))
@@ -205,22 +137,14 @@ module.exports = {{
             main_ts.write("export const perfect: string = \"perfect\";\n")
             source_folder.add(main_ts)
         app_js = JavascriptFile(source_folder_path, 'app')
-        app_js.write(f"""{"import './styles/main.scss';" if sass else "import './styles/style.css';"}
-import {{ bro }} from "./bro";
-{"import { perfect } from './main';" if ts else ''}
-
-let ok = ["ok", "ok"];
-console.log(ok);
-console.log(bro("Dude"));
-{"console.log(perfect);" if ts else ''}
-""")
+        app_js.write(templates.render('webpack_app.js', sass=sass, ts=ts))
         bro_js = JavascriptFile(source_folder_path, 'bro')
         bro_js.write("""export const bro = (greeting) => {
   return `${greeting}, bro`;
 };
 """)
-        source_folder.add(bro_js, app_js, HTMLFile(
-            source_folder_path, 'index'))
+        with HTMLFile(source_folder_path, 'index') as index_html:
+            source_folder.add(bro_js, app_js, index_html)
 
     def verify_installation(self) -> NoReturn:
         """
@@ -1,16 +1,59 @@
 import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
 from typing import Any, NoReturn
 
-import github
-
-from project_automation.commands import GitCommand
+from project_automation.commands import GitCommand, ProbeEngine
 from project_automation.files import (
-    Folder, GitIgnoreFile, ReadMeFile, LicenseFile,
+    ArchiveWriter, Folder, GitIgnoreFile, ReadMeFile, LicenseFile, VirtualTree, XMLFile,
 )
 from project_automation.settings import GITHUB_USER, GITHUB_PASS, GITHUB_OAUTH_ACCESS_TOKEN, SHELL_COLORS
 from project_automation.utils import execute_command2, tree
 
 
+_github_lock = threading.Lock()
+_github_user = None
+
+
+def get_github_user() -> tuple:
+    """
+    Authenticate the Github user once per process.
+
+    The client is only created on the first call and the result is shared by all the projects.
+
+    Returns
+    -------
+    user : ~github.AuthenticatedUser or None
+        the authenticated github user, None if the authentication failed
+    error : str or None
+        the error occured during the authentication, None otherwise
+    """
+    global _github_user
+    with _github_lock:
+        if _github_user is None:
+            import github
+
+            try:
+                if GITHUB_OAUTH_ACCESS_TOKEN is not None:
+                    client = github.Github(GITHUB_OAUTH_ACCESS_TOKEN)
+                else:
+                    client = github.Github(GITHUB_USER, GITHUB_PASS)
+                user = client.get_user()
+                user.login  # the user is lazy, force the authentication
+                _github_user = (user, None)
+            except github.BadCredentialsException:
+                _github_user = (None, "Your Github credentials are bad.")
+            except github.TwoFactorException:
+                _github_user = (
+                    None, "You have activate the 2-Factor-Authentication on Github. Use the OAuth access token to bypass the 2FA (developer tab).")
+            except github.GithubException as e:
+                _github_user = (None, f"Cannot authenticate on Github: {e}")
+        return _github_user
+
+
 class Project:
     """
     Represents a simple project to create.
@@ -28,9 +71,23 @@ class Project:
     errors : list of string
         all occured error during project creation (not exceptions)
     user : ~github.AuthenticatedUser or ~github.NamedUser
-        github user if ``github_settings`` is not empty
+        github user, authenticated on first access (see `get_github_user`)
     root : ~files.Folder
         root folder of the project
+
+    Notes
+    -----
+    When ``VIRTUAL_TREE`` is True, `generate` builds the whole project in memory and writes it
+    on the disk at once. It must be False for the projects running external programs on the
+    generated files during their creation.
+
+    When ``STAGED`` is True, `generate` builds the project in a hidden sibling directory and
+    moves it into place at the end, so a failed generation never leaves a partial tree.
+    It must be False for the projects whose generated files contain their absolute path.
+
+    `generate` can also stream the project into an archive: the virtual tree is flushed into
+    the archive without touching the disk, the other projects are built in a temporary directory.
+    The projects which are not ``STAGED`` cannot be archived.
     """
 
     CONFIG = {
@@ -38,6 +95,9 @@ class Project:
         'readme_content': {}
     }
 
+    VIRTUAL_TREE = True
+    STAGED = True
+
     def __init__(self, path: str, name: str, allow_install: bool, github_settings: dict = {}, **kwargs: Any) -> NoReturn:
         """
         Constructor and initializer.
@@ -56,36 +116,193 @@ class Project:
             other keywords parameters
         """
         self.errors = []
-        try:
-            client = None
-            if GITHUB_OAUTH_ACCESS_TOKEN is not None:
-                client = github.Github(GITHUB_OAUTH_ACCESS_TOKEN)
-            else:
-                client = github.Github(GITHUB_USER, GITHUB_PASS)
-            self.user = client.get_user()
-        except github.BadCredentialsException:
-            self.errors.append("Your Github credentials are bad.")
-            self.user = None
-        except github.TwoFactorException:
-            self.errors.append(
-                "You have activate the 2-Factor-Authentication on Github. Use the OAuth access token to bypass the 2FA (developer tab).")
-            self.user = None
+        self._user = None
+        self._user_resolved = False
         self.path = os.path.join(path, name)
         self.name = name
         self.github_settings = github_settings
         self.allow_install = allow_install
 
+    @property
+    def user(self) -> Any:
+        """
+        Github user, authenticated the first time it is needed.
+
+        Returns
+        -------
+        user : ~github.AuthenticatedUser or None
+            the authenticated github user, None if the authentication failed
+
+        See also
+        --------
+        get_github_user
+        """
+        if not self._user_resolved:
+            self._user, error = get_github_user()
+            if error is not None:
+                self.errors.append(error)
+            self._user_resolved = True
+        return self._user
+
+    def generate(self, archive: ArchiveWriter = None) -> NoReturn:
+        """
+        Create the structure of the project in a virtual tree flushed at once
+        (if the project supports it, see ``VIRTUAL_TREE``).
+        The project is built in a staging directory next to its final path and moved
+        into place with a single rename (if the project supports it, see ``STAGED``).
+
+        Parameters
+        ----------
+        archive : ~files.ArchiveWriter
+            archive where the project is written instead of its path (None to write it on the disk)
+
+        Raises
+        ------
+        FileExistsError
+            when the project is staged and its path already exists and is not empty
+        ValueError
+            when the project must be archived but it is not ``STAGED``
+
+        See also
+        --------
+        create
+        generate_archive
+        files.VirtualTree
+        """
+        if archive is not None:
+            self.generate_archive(archive)
+            return
+        final_path = self.path
+        staging_path = self.make_staging_directory() if self.STAGED else None
+        if staging_path is not None:
+            self.path = os.path.join(staging_path, os.path.basename(final_path))
+        try:
+            start = time.perf_counter()
+            if self.VIRTUAL_TREE:
+                with VirtualTree() as virtual_tree:
+                    self.create()
+                    timings = {"build": time.perf_counter() - start}
+                timings.update(virtual_tree.timings)
+            else:
+                self.create()
+                XMLFile.flush_pending()
+                timings = {"build": time.perf_counter() - start}
+            if staging_path is not None:
+                start = time.perf_counter()
+                self.publish(staging_path, final_path)
+                timings['rename'] = time.perf_counter() - start
+        except BaseException:
+            if staging_path is not None:
+                shutil.rmtree(staging_path, ignore_errors=True)
+            raise
+        finally:
+            self.path = final_path
+        self.print_timings(timings)
+
+    def generate_archive(self, archive: ArchiveWriter) -> NoReturn:
+        """
+        Create the structure of the project directly in an archive, the root folder of the archive
+        is the folder of the project.
+        The virtual tree of the project is streamed into the archive without writing on the disk,
+        the projects without virtual tree are built in a temporary directory removed at the end.
+
+        Parameters
+        ----------
+        archive : ~files.ArchiveWriter
+            archive where the project is written
+
+        Raises
+        ------
+        ValueError
+            when the project is not ``STAGED`` (its files would contain the temporary path)
+        """
+        if not self.STAGED:
+            raise ValueError(
+                f"{type(self).__name__} cannot be archived because its files contain its absolute path")
+        start = time.perf_counter()
+        if self.VIRTUAL_TREE:
+            with VirtualTree(archive, os.path.dirname(self.path)) as virtual_tree:
+                self.create()
+                timings = {"build": time.perf_counter() - start}
+            timings.update(virtual_tree.timings)
+        else:
+            final_path = self.path
+            temporary_path = tempfile.mkdtemp(prefix=f".{self.name}.")
+            self.path = os.path.join(temporary_path, os.path.basename(final_path))
+            try:
+                self.create()
+                XMLFile.flush_pending()
+                timings = {"build": time.perf_counter() - start}
+                start = time.perf_counter()
+                archive.add_directory(self.path, os.path.basename(final_path))
+                timings['archive'] = time.perf_counter() - start
+            finally:
+                self.path = final_path
+                shutil.rmtree(temporary_path, ignore_errors=True)
+        self.print_timings(timings)
+
+    def print_timings(self, timings: dict) -> NoReturn:
+        """
+        Show the time spent in each phase of the generation.
+
+        Parameters
+        ----------
+        timings : dict
+            number of seconds spent in each phase indexed by its name
+        """
+        details = ", ".join(f"{phase}: {duration:.3f} s" for phase,
+                            duration in timings.items())
+        print(
+            f"Project generated in {sum(timings.values()):.3f} s ({details})")
+
+    def make_staging_directory(self) -> str:
+        """
+        Create the hidden staging directory of the project next to its final path (on the same filesystem).
+
+        Returns
+        -------
+        staging_path : str
+            path of the staging directory, the project is built in a folder with its final name inside it
+
+        Raises
+        ------
+        FileExistsError
+            when the path of the project already exists and is not empty
+        """
+        parent, name = os.path.split(os.path.abspath(self.path))
+        if os.path.isdir(self.path) and os.listdir(self.path):
+            raise FileExistsError(f"the folder {self.path} already exists")
+        os.makedirs(parent, exist_ok=True)
+        return tempfile.mkdtemp(prefix=f".{name}.", suffix=".staging", dir=parent)
+
+    def publish(self, staging_path: str, final_path: str) -> NoReturn:
+        """
+        Move the project built in the staging directory to its final path with a single rename.
+
+        Parameters
+        ----------
+        staging_path : str
+            path of the staging directory
+        final_path : str
+            final path of the project
+        """
+        # Windows cannot replace an empty directory
+        if sys.platform == 'win32' and os.path.isdir(final_path):
+            os.rmdir(final_path)
+        os.rename(self.path, final_path)
+        os.rmdir(staging_path)
+
     def create(self) -> NoReturn:
         """
         Create the structure of the project.
         """
-        self.verify_installation()
+        self.verify_requirements()
         self.root = Folder(self.path)
-        readme = ReadMeFile(self.path)
-        readme.write_title(self.name)
-        readme.write_paragraph(
-            "Project generated with `project_automation` module")
-        readme.write_from_dict(self.CONFIG['readme_content'])
+        with ReadMeFile(self.path) as readme:
+            readme.write_title(self.name)
+            readme.write_paragraph(
+                "Project generated with `project_automation` module")
+            readme.write_from_dict(self.CONFIG['readme_content'])
         gitignore = GitIgnoreFile(self.path, self.CONFIG['languages'])
         self.root.add(readme, gitignore)
         if self.github_settings != {}:
@@ -98,6 +315,19 @@ class Project:
                 self.path, self.github_settings['license'], self.user.name)
             self.root.add(license_file)
 
+    def verify_requirements(self) -> NoReturn:
+        """
+        Verify concurrently all the required programs of the project
+        and report all the missing ones at once.
+
+        See also
+        --------
+        verify_installation
+        commands.ProbeEngine
+        """
+        with ProbeEngine(self.allow_install):
+            self.verify_installation()
+
     def verify_installation(self) -> NoReturn:
         """
         Verify if all the required programs are installed.
@@ -123,16 +353,14 @@ class Project:
         --------
         utils.execute_command
         """
-        os.chdir(self.path)
-        execute_command2(f"cd {self.path}")
         if self.github_settings != {} and self.user is not None:
-            execute_command2("git init")
-            execute_command2(f"git add {self.path}")
-            execute_command2(f"git commit -m \"{message}\"")
+            execute_command2("git init", cwd=self.path)
+            execute_command2(f"git add {self.path}", cwd=self.path)
+            execute_command2(f"git commit -m \"{message}\"", cwd=self.path)
             execute_command2(
-                f"git remote add origin https://github.com/{self.user.login}/{self.name}.git")
-            execute_command2("git push -u origin master")
-        elif self.user is None:
+                f"git remote add origin https://github.com/{self.user.login}/{self.name}.git", cwd=self.path)
+            execute_command2("git push -u origin master", cwd=self.path)
+        elif self.github_settings != {}:
             self.errors.append(
                 "You cannot push your modification on your repo.")
 
@@ -145,7 +373,7 @@ class Project:
 
     def structure(self) -> NoReturn:
         """
-        Show the structure of the project.
+        Show the structure of the project (without the paths ignored by its `.gitignore` file).
 
         See also
         --------
@@ -157,4 +385,4 @@ class Project:
         """
         Remove the whole project.
         """
-        self.root.remove_folder()
+        shutil.rmtree(self.path)
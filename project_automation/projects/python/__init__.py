@@ -20,33 +20,17 @@ class ParserPython(Parser):
     ----------
     subcommand : str
         subcommand to show in the CLI
-    parser : argparse.ArgumentParser
-        subcommand parser
 
     See also
     --------
-    utils.get_parser_class
+    manifest.SUBCOMMANDS
     """
 
-    def __init__(self, subparser: argparse._SubParsersAction) -> NoReturn:
+    def __init__(self) -> NoReturn:
         """
         Constructor and initializer.
-
-        Parameters
-        ----------
-        subparser : argparse._SubParsersAction
-            subparser instance to add subcommands
         """
-        super().__init__(subparser, 'python',
-                         'sub-command to generate Python type project')
-        self.parser.add_argument('-t', '--type', choices=[
-            'classic', 'cython'], default='classic', help='create some specific python project (classic by default)')
-        self.parser.add_argument('--no-env', action='store_true',
-                                 default=False, help='no use the python virtual environment (False by default)')
-        self.parser.add_argument(
-            '--env', choices=['pipenv', 'venv'], help='choice a python virtual environment (pipenv by default)', default='pipenv')
-        self.parser.add_argument(
-            '-p', '--packages', nargs='+', help='package to install for this specific project')
+        super().__init__('python')
 
     def modify_project_settings(self, result: argparse.Namespace, project_settings: dict) -> dict:
         """
@@ -1,5 +1,6 @@
 from typing import Any, NoReturn
 
+from project_automation import templates
 from project_automation.commands import GCCCommand
 from project_automation.files import PythonFile, CythonFile, CythonHeaderFile
 from .python import PythonProject
@@ -43,6 +44,7 @@ class CythonProject(PythonProject):
         },
         'packages': ['Cython'],
     }
+    CONFIG = {**PythonProject.CONFIG, **CONFIG_CYTHON}
 
     def __init__(self, path: str, name: str, use_env: bool = True, env_type: str = "pipenv", github_settings: dict = {}, **kwargs: Any) -> NoReturn:
         """
@@ -64,7 +66,6 @@ class CythonProject(PythonProject):
         **kwargs : Any
             other keywords parameters
         """
-        self.CONFIG.update(self.CONFIG_CYTHON)
         super().__init__(path, name, use_env=use_env,
                          env_type=env_type, github_settings=github_settings, **kwargs)
 
@@ -87,8 +88,5 @@ class CythonProject(PythonProject):
         py_script_file = CythonFile(self.path, "script")
         py_script_header_file = CythonHeaderFile(self.path, "script")
         py_setup_file = PythonFile(self.path, "setup")
-        setup_content = "from distutils.core import setup\nfrom distutils.extension import Extension\nfrom os.path import join, dirname\n\nfrom Cython.Build import cythonize\nfrom Cython.Distutils import build_ext\n\n\n"
-        setup_content += "path = dirname(__file__)\n\nextensions = [\n    Extension('script', sources=[join(path, 'script.pyx')]),\n]\n\n"
-        setup_content += "setup(\n    cmdclass={'build_ext': build_ext},\n    ext_modules=cythonize(extensions))"
-        py_setup_file.write(setup_content)
+        py_setup_file.write(templates.render('cython_setup.py'))
         self.root.add(py_script_file, py_script_header_file, py_setup_file)
@@ -46,6 +46,9 @@ class PythonProject(Project):
         "packages": [],
     }
 
+    VIRTUAL_TREE = False
+    STAGED = False
+
     def __init__(self, path: str, name: str, use_env: bool = True, env_type: str = "pipenv", github_settings: dict = {}, **kwargs: Any) -> NoReturn:
         """
         Constructor and initializer.
@@ -66,7 +69,9 @@ class PythonProject(Project):
         """
         super().__init__(path, name, github_settings=github_settings, **kwargs)
         if 'additionnal_packages' in kwargs.keys() and kwargs['additionnal_packages'] is not None:
-            self.CONFIG['packages'].extend(kwargs['additionnal_packages'])
+            # copy the configuration to keep the class one unchanged
+            self.CONFIG = {**self.CONFIG, 'packages': [
+                *self.CONFIG['packages'], *kwargs['additionnal_packages']]}
         self.use_env = use_env
         self.env_type = env_type
 
@@ -119,22 +124,22 @@ class PythonProject(Project):
         python_version_for_system = '3' if sys.platform != 'win32' else ''
         if self.use_env:
             if self.env_type == 'pipenv':
-                os.chdir(self.path)
                 if self.allow_install:
                     execute_command2(
-                        f"pipenv install {' '.join(self.CONFIG['packages'])}")
+                        f"pipenv install {' '.join(self.CONFIG['packages'])}", cwd=self.path)
             elif self.env_type == 'venv':
                 execute_command2(
-                    f"python{python_version_for_system} -m venv {os.path.join(self.path, 'env')}")
+                    f"python{python_version_for_system} -m venv {os.path.join(self.path, 'env')}", cwd=self.path)
                 if self.allow_install:
                     if sys.platform == 'win32':
-                        execute_command2("env\Scripts\\activate.bat")
+                        execute_command2(
+                            "env\Scripts\\activate.bat", cwd=self.path)
                     else:
-                        execute_command2(". env/bin/activate")
+                        execute_command2(". env/bin/activate", cwd=self.path)
                     if len(self.CONFIG['packages']) > 0:
                         execute_command2(
-                            f"pip install {' '.join(self.CONFIG['packages'])}")
+                            f"pip install {' '.join(self.CONFIG['packages'])}", cwd=self.path)
         else:
             if len(self.CONFIG['packages']) > 0 and self.allow_install:
                 execute_command2(
-                    f"pip{python_version_for_system} install {' '.join(self.CONFIG['packages'])}")
+                    f"pip{python_version_for_system} install {' '.join(self.CONFIG['packages'])}", cwd=self.path)
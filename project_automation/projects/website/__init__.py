@@ -20,27 +20,17 @@ class ParserWebsite(Parser):
     ----------
     subcommand : str
         subcommand to show in the CLI
-    parser : argparse.ArgumentParser
-        subcommand parser
 
     See also
     --------
-    utils.get_parser_class
+    manifest.SUBCOMMANDS
     """
 
-    def __init__(self, subparser: argparse._SubParsersAction) -> NoReturn:
+    def __init__(self) -> NoReturn:
         """
         Constructor and initializer.
-
-        Parameters
-        ----------
-        subparser : argparse._SubParsersAction
-            subparser instance to add subcommands
         """
-        super().__init__(subparser, 'website',
-                         'sub-command to generate website type project')
-        self.parser.add_argument('-t', '--type', choices=[
-            'classic', 'typescript'], default='classic', help='create some specific website project (classic by default)')
+        super().__init__('website')
 
     def modify_project_settings(self, result: argparse.Namespace, project_settings: dict) -> dict:
         """
@@ -51,7 +51,7 @@ class SimpleWebsiteProject(Project):
         **kwargs : Any
             other keywords parameters
         """
-        super().__init__(path, name, github_settings=github_settings)
+        super().__init__(path, name, github_settings=github_settings, **kwargs)
 
     def create(self) -> NoReturn:
         """
@@ -81,4 +81,5 @@ class SimpleWebsiteProject(Project):
         index_html_file.add_headlink(
             type="text/css", rel="stylesheet", href=style.filename, href_is_relative=False)
         index_html_file.add_script(src=script.filename, src_is_relative=False)
+        index_html_file.flush()
         self.root.add(index_html_file, js_dir, css_dir, assets_dir)
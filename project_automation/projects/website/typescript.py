@@ -53,7 +53,7 @@ class TypescriptWebsiteProject(Project):
         **kwargs : Any
             other keywords parameters
         """
-        super().__init__(path, name, github_settings=github_settings)
+        super().__init__(path, name, github_settings=github_settings, **kwargs)
 
     def create(self) -> NoReturn:
         """
@@ -83,6 +83,7 @@ class TypescriptWebsiteProject(Project):
         index_html_file.add_headlink(
             type="text/css", rel="stylesheet", href=style.filename, href_is_relative=False)
         index_html_file.add_script(src=script.filename, src_is_relative=False)
+        index_html_file.flush()
         self.root.add(index_html_file, js_dir, css_dir, assets_dir)
 
     def verify_installation(self) -> NoReturn:
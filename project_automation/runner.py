@@ -0,0 +1,260 @@
+import asyncio
+from collections import deque
+import locale
+import subprocess
+from typing import Any, Callable, NoReturn
+
+
+class CommandResult:
+    """
+    Result of a command executed by the `CommandRunner`.
+
+    Attributes
+    ----------
+    argv : list of strings
+        executed command and its arguments
+    returncode : int
+        returned code of the command (None if the process could not be waited)
+    stdout : list of strings
+        last lines written on the standard output (bounded by ``CommandRunner.CONFIG['max_lines']``)
+    stderr : list of strings
+        last lines written on the error output (bounded by ``CommandRunner.CONFIG['max_lines']``)
+    timed_out : bool
+        True if the command was stopped because of its timeout or deadline, False otherwise
+    truncated : bool
+        True if some output lines were dropped from the buffers, False otherwise
+    """
+
+    def __init__(self, argv: list, returncode: int, stdout: list, stderr: list,
+                 timed_out: bool = False, truncated: bool = False) -> NoReturn:
+        """
+        Constructor and initializer.
+
+        Parameters
+        ----------
+        argv : list of strings
+            executed command and its arguments
+        returncode : int
+            returned code of the command
+        stdout : list of strings
+            last lines written on the standard output
+        stderr : list of strings
+            last lines written on the error output
+        timed_out : bool
+            True if the command was stopped because of its timeout or deadline, False otherwise
+        truncated : bool
+            True if some output lines were dropped from the buffers, False otherwise
+        """
+        self.argv = argv
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.timed_out = timed_out
+        self.truncated = truncated
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if the command ended successfully in time, False otherwise.
+        """
+        return self.returncode == 0 and not self.timed_out
+
+    def __repr__(self) -> str:
+        return f"CommandResult(argv={self.argv!r}, returncode={self.returncode!r}, timed_out={self.timed_out!r})"
+
+
+class CommandRunner:
+    """
+    Asynchronous runner of external commands.
+
+    The commands are given as argument lists and executed without shell. Their outputs are
+    streamed line by line to optional callbacks and only the last lines are kept in memory.
+    A command can be stopped by a timeout, a deadline shared by several commands or a cancellation,
+    in which case its process is terminated (then killed after ``CONFIG['kill_delay']`` seconds).
+
+    The synchronous methods `run` and `run_all` wrap the asynchronous ones for the callers
+    which are not written with asyncio.
+    """
+
+    CONFIG = {
+        "max_lines": 1000,
+        "line_limit": 2 ** 16,
+        "kill_delay": 5,
+        "encoding": locale.getpreferredencoding(False),
+    }
+
+    @classmethod
+    async def _read_stream(cls, stream: asyncio.StreamReader, buffer: deque,
+                           callback: Callable[[str], Any]) -> bool:
+        truncated = False
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # the line is longer than CONFIG['line_limit'], its content is dropped
+                truncated = True
+                continue
+            if not line:
+                return truncated
+            text = line.decode(cls.CONFIG['encoding'], errors="replace").rstrip("\r\n")
+            if len(buffer) == buffer.maxlen:
+                truncated = True
+            buffer.append(text)
+            if callback is not None:
+                callback(text)
+
+    @classmethod
+    async def _terminate(cls, process: asyncio.subprocess.Process) -> NoReturn:
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), cls.CONFIG['kill_delay'])
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        except ProcessLookupError:
+            pass
+
+    @classmethod
+    async def run_async(cls, argv: list, cwd: str = None, env: dict = None, input: str = None,
+                        on_stdout: Callable[[str], Any] = None, on_stderr: Callable[[str], Any] = None,
+                        timeout: float = None, deadline: float = None) -> CommandResult:
+        """
+        Execute a command and wait for its end.
+
+        Parameters
+        ----------
+        argv : list of strings
+            command to execute and its arguments
+        cwd : str
+            working directory of the command (current directory if None)
+        env : dict
+            environment variables of the command (inherited if None)
+        input : str
+            data written on the standard input of the command (standard input inherited if None)
+        on_stdout : callable
+            function called with each line written on the standard output
+        on_stderr : callable
+            function called with each line written on the error output
+        timeout : float
+            number of seconds to wait for the command (no limit if None)
+        deadline : float
+            time of the event loop clock after which the command is stopped (no limit if None)
+
+        Returns
+        -------
+        result : CommandResult
+            returned code, last output lines and status of the command
+
+        Raises
+        ------
+        OSError
+            when the executable cannot be launched
+        """
+        loop = asyncio.get_running_loop()
+        if deadline is not None:
+            remaining = max(deadline - loop.time(), 0)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        process = await asyncio.create_subprocess_exec(
+            *argv, cwd=cwd, env=env,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            limit=cls.CONFIG['line_limit'])
+        stdout, stderr = deque(maxlen=cls.CONFIG['max_lines']), deque(
+            maxlen=cls.CONFIG['max_lines'])
+        truncated = [False, False]
+
+        async def communicate():
+            if input is not None:
+                process.stdin.write(input.encode(cls.CONFIG['encoding']))
+                try:
+                    await process.stdin.drain()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                process.stdin.close()
+            truncated[:] = await asyncio.gather(
+                cls._read_stream(process.stdout, stdout, on_stdout),
+                cls._read_stream(process.stderr, stderr, on_stderr))
+            return await process.wait()
+
+        timed_out = False
+        try:
+            returncode = await asyncio.wait_for(communicate(), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            await cls._terminate(process)
+            returncode = process.returncode
+        except asyncio.CancelledError:
+            await cls._terminate(process)
+            raise
+        return CommandResult(list(argv), returncode, list(stdout), list(stderr),
+                             timed_out, any(truncated))
+
+    @classmethod
+    async def run_all_async(cls, commands: list, timeout: float = None, **kwargs) -> list:
+        """
+        Execute several commands concurrently with a deadline shared by all of them.
+
+        Parameters
+        ----------
+        commands : list of lists of strings
+            commands to execute with their arguments
+        timeout : float
+            number of seconds to wait for all the commands (no limit if None)
+        kwargs : dict
+            other arguments given to `run_async` for each command
+
+        Returns
+        -------
+        results : list of CommandResult
+            results of the commands, in the same order
+        """
+        deadline = None
+        if timeout is not None:
+            deadline = asyncio.get_running_loop().time() + timeout
+        return await asyncio.gather(*(cls.run_async(argv, deadline=deadline, **kwargs)
+                                      for argv in commands))
+
+    @classmethod
+    def run(cls, argv: list, **kwargs) -> CommandResult:
+        """
+        Synchronous facade of `run_async`.
+        It must not be called from a running event loop.
+
+        Parameters
+        ----------
+        argv : list of strings
+            command to execute and its arguments
+        kwargs : dict
+            other arguments of `run_async`
+
+        Returns
+        -------
+        result : CommandResult
+            returned code, last output lines and status of the command
+        """
+        return asyncio.run(cls.run_async(argv, **kwargs))
+
+    @classmethod
+    def run_all(cls, commands: list, timeout: float = None, **kwargs) -> list:
+        """
+        Synchronous facade of `run_all_async`.
+        It must not be called from a running event loop.
+
+        Parameters
+        ----------
+        commands : list of lists of strings
+            commands to execute with their arguments
+        timeout : float
+            number of seconds to wait for all the commands (no limit if None)
+        kwargs : dict
+            other arguments given to `run_async` for each command
+
+        Returns
+        -------
+        results : list of CommandResult
+            results of the commands, in the same order
+        """
+        return asyncio.run(cls.run_all_async(commands, timeout, **kwargs))
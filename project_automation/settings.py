@@ -2,8 +2,6 @@ import os
 
 from dotenv import load_dotenv
 
-from .licenses import *
-
 # Load the env file into the environment
 load_dotenv()
 
@@ -12,36 +10,17 @@ GITHUB_USER = os.getenv("GITHUB_USER")
 GITHUB_PASS = os.getenv("GITHUB_PASS")
 GITHUB_OAUTH_ACCESS_TOKEN = os.getenv("GITHUB_OAUTH_ACCESS_TOKEN")
 
-# License part
-LICENSE_MODE = {
-    "Apache License 2.0": apache2.CONTENT,
-    "BSD 3-Clause \"New\" or \"Revised\" License": bsd3.CONTENT,
-    "BSD 2-Clause \"Simplified\" License": bsd2.CONTENT,
-    "Creative Commons Zero v1.0 Universal": cc1.CONTENT,
-    "Eclipse Public License 2.0": eclipse2.CONTENT,
-    "GNU General Public License v3.0": gnu3.CONTENT,
-    "GNU General Public License v2.0": gnu2.CONTENT,
-    "GNU Affero General Public License v3.0": gnu_affero3.CONTENT,
-    "GNU Lesser General Public License v2.1": gnu_lesser21.CONTENT,
-    "GNU Lesser General Public License v3.0": gnu_lesser3.CONTENT,
-    "MIT License": mit.CONTENT,
-    "Mozilla Public License 2.0": mozilla2.CONTENT,
-    "Unlicense": unlicense.CONTENT,
-}
-LICENSE_MODE_SHORTCUT = {
-    "apache": LICENSE_MODE['Apache License 2.0'],
-    "bsd3": LICENSE_MODE['BSD 3-Clause "New" or "Revised" License'],
-    "bsd2": LICENSE_MODE['BSD 2-Clause "Simplified" License'],
-    "CC": LICENSE_MODE['Creative Commons Zero v1.0 Universal'],
-    "eclipse": LICENSE_MODE['Eclipse Public License 2.0'],
-    "gnu3": LICENSE_MODE['GNU General Public License v3.0'],
-    "gnu2": LICENSE_MODE['GNU General Public License v2.0'],
-    "gnuAffero3": LICENSE_MODE['GNU Affero General Public License v3.0'],
-    "gnuLess3": LICENSE_MODE['GNU Lesser General Public License v3.0'],
-    "gnuLess2.1": LICENSE_MODE['GNU Lesser General Public License v2.1'],
-    "mit": LICENSE_MODE['MIT License'],
-    "mozilla": LICENSE_MODE['Mozilla Public License 2.0'],
-    "unlicense": LICENSE_MODE['Unlicense'],
+# Directory of the persistent caches
+CACHE_DIR = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.join(
+    os.path.expanduser("~"), ".cache"), "project_automation")
+
+# Compression of each supported archive format (None for a zip archive)
+ARCHIVE_FORMATS = {
+    "tar": "",
+    "tar.gz": "gz",
+    "tar.bz2": "bz2",
+    "tar.xz": "xz",
+    "zip": None,
 }
 
 SHELL_COLORS = {
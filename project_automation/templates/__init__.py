@@ -0,0 +1,268 @@
+import hashlib
+import marshal
+import os
+import pkgutil
+import re
+import sys
+import threading
+from typing import Any, Callable, NoReturn
+
+from project_automation.settings import CACHE_DIR
+
+
+# Directory of the compiled templates
+CACHE_DIRECTORY = os.path.join(CACHE_DIR, "templates")
+
+# Version of the code generated from the templates (change it when `translate` changes)
+COMPILER_VERSION = "1"
+
+# A tag alone on its line consumes the whole line
+TOKENS = re.compile(r"^[ \t]*{%\s*(?P<line_tag>[^%\n]*?)\s*%}[ \t]*(?:\n|\Z)"
+                    r"|{{\s*(?P<variable>[A-Za-z_]\w*)\s*}}"
+                    r"|{%\s*(?P<tag>[^%\n]*?)\s*%}", re.MULTILINE)
+
+TAG = re.compile(
+    r"(?P<keyword>if|elif)\s+(?P<negation>not\s+)?(?P<variable>[A-Za-z_]\w*)|(?P<end>else|endif)")
+
+# Render functions of the loaded templates indexed by their name
+_TEMPLATES = {}
+_TEMPLATES_LOCK = threading.Lock()
+
+
+def get_source(name: str) -> str:
+    """
+    Return the source of a template.
+
+    Parameters
+    ----------
+    name : str
+        name of the template (the `<name>.tmpl` resource of this package)
+
+    Returns
+    -------
+    source : str
+        the source of the template
+
+    Raises
+    ------
+    FileNotFoundError
+        when the template does not exist
+    """
+    return pkgutil.get_data(__name__, f"{name}.tmpl").decode("utf-8")
+
+
+def translate(source: str, name: str = "<template>") -> str:
+    """
+    Translate a template into the Python source of its render function.
+
+    The template copies its text verbatim except:
+
+    - ``{{ variable }}`` which is replaced by the value of the variable;
+    - ``{% if [not] variable %}``, ``{% elif [not] variable %}``, ``{% else %}`` and ``{% endif %}``
+      which keep their section according to the truth value of the variable.
+
+    A tag alone on its line removes the whole line from the output.
+
+    Parameters
+    ----------
+    source : str
+        source of the template
+    name : str
+        name of the template (used in the error messages)
+
+    Returns
+    -------
+    code : str
+        source of a ``render(context)`` function returning the rendered string
+
+    Raises
+    ------
+    ValueError
+        when a tag is invalid or the conditional sections are not balanced
+    """
+    lines = ["def render(context):",
+             "    parts = []",
+             "    append = parts.append"]
+    # line number of each opened section and if it already has an `else` tag
+    sections = []
+    position = 0
+
+    def emit(code: str) -> NoReturn:
+        lines.append("    " * (len(sections) + 1) + code)
+
+    for match in TOKENS.finditer(source):
+        if match.start() > position:
+            emit(f"append({source[position:match.start()]!r})")
+        position = match.end()
+        if match.group("variable") is not None:
+            emit(f"append(str(context[{match.group('variable')!r}]))")
+            continue
+        lineno = source.count("\n", 0, match.start()) + 1
+        tag = match.group("line_tag") if match.group(
+            "line_tag") is not None else match.group("tag")
+        parsed = TAG.fullmatch(tag)
+        if parsed is None:
+            raise ValueError(f"{name}, line {lineno}: invalid tag {tag!r}")
+        keyword = parsed.group("keyword") or parsed.group("end")
+        condition = f"{'not ' if parsed.group('negation') else ''}context[{parsed.group('variable')!r}]"
+        if keyword == "if":
+            emit(f"if {condition}:")
+            sections.append([lineno, False])
+            emit("pass")
+        elif not sections or (keyword != "endif" and sections[-1][1]):
+            raise ValueError(
+                f"{name}, line {lineno}: unexpected {keyword!r} tag")
+        elif keyword == "endif":
+            sections.pop()
+        else:
+            sections[-1][1] = keyword == "else"
+            lines.append("    " * len(sections) +
+                         ("else:" if keyword == "else" else f"elif {condition}:"))
+            emit("pass")
+    if sections:
+        raise ValueError(
+            f"{name}, line {sections[-1][0]}: 'if' tag is never closed")
+    if position < len(source):
+        emit(f"append({source[position:]!r})")
+    emit("return ''.join(parts)")
+    return "\n".join(lines) + "\n"
+
+
+def get_cache_filename(name: str, digest: str) -> str:
+    """
+    Return the path of the compiled template.
+
+    Parameters
+    ----------
+    name : str
+        name of the template
+    digest : str
+        SHA-256 digest of the template source and of the compiler version
+
+    Returns
+    -------
+    filename : str
+        path of the marshalled code, None if the interpreter does not support the bytecode caches
+    """
+    if sys.implementation.cache_tag is None:
+        return None
+    return os.path.join(CACHE_DIRECTORY, f"{name}.{digest[:16]}.{sys.implementation.cache_tag}.bin")
+
+
+def compile_template(name: str) -> Callable[[dict], str]:
+    """
+    Compile a template into its render function.
+    The bytecode is cached on the disk and reused until the template source changes.
+
+    Parameters
+    ----------
+    name : str
+        name of the template
+
+    Returns
+    -------
+    render : callable
+        function taking the dictionary of the variables and returning the rendered string
+
+    Raises
+    ------
+    FileNotFoundError
+        when the template does not exist
+    ValueError
+        when the template is invalid
+
+    See also
+    --------
+    translate
+    """
+    source = get_source(name)
+    digest = hashlib.sha256(
+        f"{COMPILER_VERSION}\0{source}".encode("utf-8")).hexdigest()
+    cache_filename = get_cache_filename(name, digest)
+    code = None
+    if cache_filename is not None and os.path.exists(cache_filename):
+        try:
+            with open(cache_filename, "rb") as file:
+                code = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            code = None
+    if code is None:
+        code = compile(translate(source, name),
+                       f"<template {name}>", "exec")
+        if cache_filename is not None:
+            tmp_filename = f"{cache_filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+                with open(tmp_filename, "wb") as file:
+                    marshal.dump(code, file)
+                os.replace(tmp_filename, cache_filename)
+            except OSError:
+                # the cache is optional
+                pass
+    namespace = {}
+    exec(code, namespace)
+    return namespace["render"]
+
+
+def get_template(name: str) -> Callable[[dict], str]:
+    """
+    Return the render function of a template, compiled once per process.
+
+    Parameters
+    ----------
+    name : str
+        name of the template
+
+    Returns
+    -------
+    render : callable
+        function taking the dictionary of the variables and returning the rendered string
+
+    Raises
+    ------
+    FileNotFoundError
+        when the template does not exist
+    ValueError
+        when the template is invalid
+    """
+    with _TEMPLATES_LOCK:
+        if name not in _TEMPLATES:
+            _TEMPLATES[name] = compile_template(name)
+        return _TEMPLATES[name]
+
+
+def render(name: str, **context: Any) -> str:
+    """
+    Render a template.
+
+    Parameters
+    ----------
+    name : str
+        name of the template
+    **context : Any
+        values of the variables of the template
+
+    Returns
+    -------
+    content : str
+        the rendered template
+
+    Raises
+    ------
+    FileNotFoundError
+        when the template does not exist
+    KeyError
+        when a variable of the template is not given
+    ValueError
+        when the template is invalid
+    """
+    return get_template(name)(context)
+
+
+__all__ = [
+    'compile_template',
+    'get_source',
+    'get_template',
+    'render',
+    'translate',
+]
@@ -1,13 +1,12 @@
 import abc
 import argparse
-from itertools import islice, takewhile
+from itertools import takewhile
 import json
 import os
 from pathlib import Path
-import requests
 import subprocess
 import sys
-from typing import ClassVar, NoReturn, Union
+from typing import Any, ClassVar, Iterator, NoReturn, Union
 
 
 SPACE = '    '
@@ -16,8 +15,74 @@ TEE = '├── '
 LAST = '└── '
 
 
+def iter_tree(dir_path: Union[str, Path], level: int = -1, limit_to_directories: bool = False,
+              matcher: Any = None) -> Iterator[str]:
+    """
+    Generate lazily the lines of the file structure from a given path.
+
+    The folders are explored iteratively with `os.scandir` (the type of the entries is given by
+    the folder, without a `stat` call per entry) and are never read beyond the depth limit.
+
+    Parameters
+    ----------
+    dir_path : str or ~pathlib.Path
+        path of the directory to show the tree
+    level : int
+        level to show the tree depth (-1 for no limit)
+    limit_to_directories : bool
+        just show directories
+    matcher : gitignore.GitIgnoreMatcher
+        patterns of the paths to skip (with the `.git` folder), relative to `dir_path` (None to show all)
+
+    Yields
+    ------
+    line : str
+        line of the tree (the name of a folder ends with "/")
+    """
+    def scan(path: str, relative_path: str) -> list:
+        contents = []
+        try:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    try:
+                        is_directory = entry.is_dir()
+                    except OSError:
+                        is_directory = False
+                    if limit_to_directories and not is_directory:
+                        continue
+                    if matcher is not None and (entry.name == ".git" or
+                                                matcher.match(relative_path + entry.name, is_directory)):
+                        continue
+                    contents.append((entry, is_directory))
+        except OSError:
+            pass
+        pointers = [TEE] * (len(contents) - 1) + [LAST]
+        return iter([(pointer, entry, is_directory) for pointer, (entry, is_directory) in zip(pointers, contents)])
+
+    if not level:
+        return
+    # iterator of the remaining entries, prefix, level and relative path of each opened folder
+    stack = [(scan(os.fspath(dir_path), ""), "", level, "")]
+    while stack:
+        iterator, prefix, level, relative_path = stack[-1]
+        item = next(iterator, None)
+        if item is None:
+            stack.pop()
+            continue
+        pointer, entry, is_directory = item
+        if is_directory:
+            yield prefix + pointer + entry.name + "/"
+            if level - 1:
+                extension = BRANCH if pointer == TEE else SPACE
+                path = f"{relative_path}{entry.name}/"
+                stack.append((scan(entry.path, path),
+                              prefix + extension, level - 1, path))
+        else:
+            yield prefix + pointer + entry.name
+
+
 def tree(dir_path: Union[str, Path], level: int = -1, limit_to_directories: bool = False,
-         length_limit: int = 1000) -> NoReturn:
+         length_limit: int = 1000, gitignore: bool = True) -> NoReturn:
     """
     Visualization of file structure from a given path.
 
@@ -31,40 +96,36 @@ def tree(dir_path: Union[str, Path], level: int = -1, limit_to_directories: bool
         just show directories
     length_limit : int
         limit of directories/files to show
+    gitignore : bool
+        skip the paths ignored by the `.gitignore` file of the directory (like `node_modules`)
+
+    See also
+    --------
+    iter_tree
     """
+    from project_automation.gitignore import GitIgnoreMatcher
+
     dir_path = Path(dir_path)
+    matcher = GitIgnoreMatcher.from_file(
+        dir_path / ".gitignore") if gitignore else None
     files = 0
     directories = 0
-
-    def inner(dir_path: Path, prefix: str = '', level: int = -1):
-        nonlocal files, directories
-        if not level:
-            return
-        if limit_to_directories:
-            contents = [d for d in dir_path.iterdir() if d.is_dir()]
-        else:
-            contents = list(dir_path.iterdir())
-        pointers = [TEE] * (len(contents) - 1) + [LAST]
-        for pointer, path in zip(pointers, contents):
-            if path.is_dir():
-                yield prefix + pointer + path.name + "/"
-                directories += 1
-                extension = BRANCH if pointer == TEE else SPACE
-                yield from inner(path, prefix=prefix+extension, level=level-1)
-            elif not limit_to_directories:
-                yield prefix + pointer + path.name
-                files += 1
     print(dir_path.name)
-    iterator = inner(dir_path, level=level)
-    for line in islice(iterator, length_limit):
+    for index, line in enumerate(iter_tree(dir_path, level, limit_to_directories, matcher)):
+        # the walk stops at the first line beyond the limit
+        if index == length_limit:
+            print(f'... length_limit, {length_limit}, reached, counted:')
+            break
         print(line)
-    if next(iterator, None):
-        print(f'... length_limit, {length_limit}, reached, counted:')
+        if line.endswith("/"):
+            directories += 1
+        else:
+            files += 1
     print(f'\n{directories} directories' +
           (f', {files} files' if files else ''))
 
 
-def execute_command(cmd: str, input: list = None, timeout: list = None):
+def execute_command(cmd: str, input: list = None, timeout: list = None, cwd: str = None):
     """
     Execute a simple command.
 
@@ -76,6 +137,8 @@ def execute_command(cmd: str, input: list = None, timeout: list = None):
         list of inputs data to communicate to the process
     timeout : list of integer
         list of timeout to wait if the command returns
+    cwd : str
+        directory where the command is executed (the current directory if None)
 
     Returns
     -------
@@ -104,7 +167,7 @@ def execute_command(cmd: str, input: list = None, timeout: list = None):
     outs, errs = [""]*input_length, [""]*input_length
     print(f"Executing `{cmd}` command ...")
     process = subprocess.Popen(
-        cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd)
     for i in range(input_length):
         c = process.communicate(input=input[i], timeout=timeout[i])
         outs[i] = c[0].decode('latin-1')
@@ -113,7 +176,7 @@ def execute_command(cmd: str, input: list = None, timeout: list = None):
     return code, outs, errs
 
 
-def execute_command2(cmd: str):
+def execute_command2(cmd: str, cwd: str = None):
     """
     Execute a simple command and make it interactivable.
 
@@ -121,6 +184,8 @@ def execute_command2(cmd: str):
     ----------
     cmd : str
         command to execute in the terminal
+    cwd : str
+        directory where the command is executed (the current directory if None)
 
     Returns
     -------
@@ -128,7 +193,7 @@ def execute_command2(cmd: str):
         the returned code of the executed command
     """
     print(f"Executing `{cmd}` command ...")
-    return os.system(cmd)
+    return subprocess.call(cmd, shell=True, cwd=cwd)
 
 
 def get_gitignore_content(languages: list) -> str:
@@ -143,15 +208,19 @@ def get_gitignore_content(languages: list) -> str:
     Returns
     -------
     all_gitignore : str
-        all content of the associated files
+        the associated files merged without their comments and their redundant patterns,
+        with one section per template in the order of the languages
+
+    See also
+    --------
+    gitignore.GitIgnoreFetcher
+    gitignore.merge_templates
     """
-    all_gitignore = ""
-    for language in languages:
-        response = requests.get(
-            f"https://raw.githubusercontent.com/github/gitignore/master/{language}.gitignore")
-        if response.status_code == 200:
-            all_gitignore += response.content.decode("utf-8")
-    return all_gitignore
+    from project_automation.gitignore import GitIgnoreFetcher, merge_templates
+
+    templates = GitIgnoreFetcher.get().fetch_all(languages)
+    return merge_templates({os.path.splitext(os.path.basename(path))[0]: content
+                            for path, content in templates.items()})
 
 
 def create_css_rule(selectors: list, properties: dict) -> str:
@@ -268,45 +337,34 @@ def read_from_json_file(filename: str) -> dict:
 
 class Parser(abc.ABC):
     """
-    Parser class allows to add a subparser in the module.
+    Parser class allows to get the project settings of a subcommand.
 
     Attributes
     ----------
     subcommand : str
         subcommand to show in the CLI
-    parser : argparse.ArgumentParser
-        subcommand parser
 
     Notes
     -----
-    If you don't inherite this class, your children classes or not available in the main program.
-    In other words, if you don't use this class, your subcommands are not detected.
+    The arguments of the subcommand are declared in the `manifest.SUBCOMMANDS` constant
+    with the import path of the children class.
+    If your subcommand is not referenced in the manifest, it is not available in the main program.
 
     See also
     --------
-    get_parser_class
+    manifest.load_parser
     """
 
-    def __init__(self, subparser: argparse._SubParsersAction, subcommand: str, subcommand_description: str = "") -> NoReturn:
+    def __init__(self, subcommand: str) -> NoReturn:
         """
         Constructor and initializer.
 
         Parameters
         ----------
-        subparser : argparse._SubParsersAction
-            subparser instance to add subcommands
         subcommand : str
             name of the subcommand
-        subcommand_description : str
-            description of the subcommand
         """
         self.subcommand = subcommand
-        self.parser = subparser.add_parser(
-            subcommand, description=subcommand_description)
-        self.parser.add_argument(
-            'path', help='path of the parent root for create the project structure')
-        self.parser.add_argument(
-            'project_name', help='name of the project')
 
     def get_result(self, result: argparse.Namespace, project_settings: dict) -> dict:
         """
@@ -370,24 +428,3 @@ def get_parent_types(klass: ClassVar) -> list:
             all_parents.extend(get_parent_types(parent_klass))
     return all_parents
 
-
-def get_parser_class(tuple_obj: tuple) -> bool:
-    """
-    Get parser class from a module.
-
-    Parameters
-    ----------
-    tuple_obj : tuple
-        tuple which contains name of the module and the associated module object
-
-    Returns
-    -------
-    parser_or_not : bool
-        True if the class is inherite of the `Parser` class, False otherwise
-
-    See also
-    --------
-    Parser, get_parent_types
-    """
-    _, klass = tuple_obj
-    return Parser in get_parent_types(klass)
@@ -0,0 +1,66 @@
+import io
+import os
+import shutil
+import stat
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from project_automation.files import ArchiveWriter
+
+
+class ArchiveWriterSymlinkTest(unittest.TestCase):
+    """
+    The symbolic links of a folder are archived as links, never followed.
+    """
+
+    def setUp(self) -> None:
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+        os.makedirs(os.path.join(self.path, "pkg"))
+        os.makedirs(os.path.join(self.path, ".bin"))
+        with open(os.path.join(self.path, "pkg", "cli.js"), "w") as file:
+            file.write("console.log('cli');\n")
+        os.symlink(os.path.join("..", "pkg", "cli.js"),
+                   os.path.join(self.path, ".bin", "tool"))
+        os.symlink("pkg", os.path.join(self.path, "lib"))
+        os.symlink("missing.txt", os.path.join(self.path, "broken"))
+
+    def write(self, format: str) -> io.BytesIO:
+        fileobj = io.BytesIO()
+        with ArchiveWriter(fileobj, format) as archive:
+            archive.add_directory(self.path, "project")
+        fileobj.seek(0)
+        return fileobj
+
+    def test_tar(self) -> None:
+        with tarfile.open(fileobj=self.write("tar.gz")) as archive:
+            members = {info.name: info for info in archive.getmembers()}
+        self.assertTrue(members["project/pkg/cli.js"].isfile())
+        self.assertTrue(members["project/.bin/tool"].issym())
+        self.assertEqual(members["project/.bin/tool"].linkname, "../pkg/cli.js")
+        self.assertTrue(members["project/lib"].issym())
+        self.assertEqual(members["project/lib"].linkname, "pkg")
+        self.assertNotIn("project/lib/cli.js", members)
+        self.assertTrue(members["project/broken"].issym())
+        self.assertEqual(members["project/broken"].linkname, "missing.txt")
+
+    def test_zip(self) -> None:
+        with zipfile.ZipFile(self.write("zip")) as archive:
+            members = {info.filename: info for info in archive.infolist()}
+            links = {name: archive.read(name).decode("utf-8")
+                     for name, info in members.items()
+                     if stat.S_ISLNK(info.external_attr >> 16)}
+        self.assertEqual(links, {
+            "project/.bin/tool": "../pkg/cli.js",
+            "project/lib": "pkg",
+            "project/broken": "missing.txt",
+        })
+        self.assertIn("project/pkg/cli.js", members)
+        self.assertNotIn("project/lib/", members)
+        self.assertNotIn("project/lib/cli.js", members)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from project_automation.commands import ProbeEngine
+from project_automation.files import ContentStore
+from project_automation.projects import (AntProject, CProject, CPPProject, FlutterProject, GolangProject,
+                                         HaskellProject, JavaProject, NodeJSProject, PHPWebsiteProject,
+                                         SimpleWebsiteProject, WebpackJSProject)
+from project_automation.projects.python import CythonProject, PythonProject
+
+
+# Project classes generated concurrently with their specific arguments
+PROJECTS = [
+    (CProject, {}),
+    (CPPProject, {}),
+    (GolangProject, {}),
+    (HaskellProject, {}),
+    (JavaProject, {"package_name": "pkg", "company_name": "acme",
+                   "executing_scripts": True}),
+    (AntProject, {"package_name": "pkg", "company_name": "acme"}),
+    (PHPWebsiteProject, {}),
+    (SimpleWebsiteProject, {}),
+    (NodeJSProject, {}),
+    (WebpackJSProject, {}),
+    (FlutterProject, {}),
+    (CythonProject, {"use_env": False}),
+    (PythonProject, {"use_env": False}),
+]
+
+# Files of the projects generated sequentially, with the beginning of their content (None to skip it)
+README = b"# NAME\n\nProject generated with `project_automation` module\n"
+GITIGNORE = b"*.o\n"
+HTML = b"<!DOCTYPE html>\n<html lang=\"en\">\n"
+EXPECTED_FILES = {
+    CProject: {"add.c": b'#include "add.h"\n', "add.h": b"#ifndef ADD_H\n",
+               "main.c": b"#include <stdio.h>\n"},
+    CPPProject: {"add.cpp": b'#include "add.h"\n', "add.h": b"#ifndef ADD_H\n",
+                 "main.cpp": b"#include <iostream>\n"},
+    GolangProject: {"main.go": b"package main\n"},
+    HaskellProject: {"main.hs": b"square :: Int -> Int\n"},
+    JavaProject: {
+        "Manifest.txt": b"Main-Class: pkg.Main\n",
+        "src/pkg/Main.java": b"package pkg;\n", "src/pkg/package-info.java": b"/**\n",
+        **{f"{script}.bat": None for script in ("compile", "doc", "install", "package", "run")},
+        **{f"{script}.sh": b"#!/bin/sh\n" for script in ("compile", "doc", "install", "package", "run")},
+    },
+    AntProject: {
+        "build.xml": b'<?xml version="1.0" ?>\n<project name="NAME" default="run"',
+        "lib/junit-platform-console-standalone-1.6.2.jar": None,
+        "src/main/java/acme/pkg/Main.java": b"package acme.pkg;\n",
+        "src/main/java/acme/pkg/package-info.java": b"/**\n",
+        "src/test/java/acme/pkg/MainTest.java": b"package acme.pkg;\n",
+    },
+    PHPWebsiteProject: {"composer.json": b"{\n", "src/index.php": HTML,
+                        "src/js/script.js": b'"use strict"\n', "src/style/style.css": None},
+    SimpleWebsiteProject: {"index.html": HTML, "js/script.js": b'"use strict"\n',
+                           "style/style.css": None},
+    NodeJSProject: {"package.json": b'{"name": "NAME"}'},
+    WebpackJSProject: {"package.json": b'{"name": "NAME"}', "src/app.js": None, "src/bro.js": None,
+                       "src/index.html": HTML, "src/main.ts": None, "src/styles/main.scss": None,
+                       "webpack.config.js": None},
+    FlutterProject: {"lib/main.dart": b"void main() {}\n"},
+    CythonProject: {"main.py": b"def main():\n", "script.pxd": b"cpdef int cython_function",
+                    "script.pyx": b"cpdef int cython_function", "setup.py": None,
+                    "tests/test_main.py": b"import unittest\n"},
+    PythonProject: {"main.py": b"def main():\n", "tests/test_main.py": b"import unittest\n"},
+}
+
+
+def fake_npm(cmd: str, input: list = None, timeout: list = None, cwd: str = None):
+    with open(os.path.join(cwd, "package.json"), "w") as file:
+        json.dump({"name": os.path.basename(cwd)}, file)
+
+
+def fake_flutter(cmd: str, cwd: str = None) -> int:
+    name = cmd.split()[-1]
+    os.makedirs(os.path.join(cwd, name, "lib"), exist_ok=True)
+    with open(os.path.join(cwd, name, "lib", "main.dart"), "w") as file:
+        file.write("void main() {}\n")
+    return 0
+
+
+def snapshot(root: str) -> dict:
+    """
+    Return the content and the permissions of each file of a project, with its name replaced.
+    """
+    name = os.path.basename(root).encode()
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            with open(path, "rb") as file:
+                data = file.read().replace(name, b"NAME")
+            files[os.path.relpath(path, root)] = (data, os.stat(path).st_mode)
+    return files
+
+
+class ConcurrentGenerationTest(unittest.TestCase):
+    """
+    Projects generated by several threads of the same process must be identical to the projects
+    generated sequentially (no shared class state, no change of the current directory).
+    """
+
+    COPIES = 4
+    THREADS = 8
+
+    def setUp(self) -> None:
+        self.parent = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.parent, ignore_errors=True)
+        self.projects = os.path.join(self.parent, "projects")
+        os.mkdir(self.projects)
+        # no network, no external program, no user cache
+        patches = [
+            mock.patch.object(ContentStore, "_instance",
+                              ContentStore(os.path.join(self.parent, ".store"))),
+            mock.patch.object(ContentStore, "fetch",
+                              lambda self, url: self.put(url.encode())),
+            mock.patch("project_automation.files.gitignore_file.get_gitignore_content",
+                       lambda languages: "*.o\n"),
+            mock.patch.object(ProbeEngine, "run", lambda self: None),
+            mock.patch("project_automation.projects.nodejs.nodejs.execute_command",
+                       fake_npm),
+            mock.patch("project_automation.projects.nodejs.webpackjs.execute_command2",
+                       lambda cmd, cwd=None: 0),
+            mock.patch("project_automation.projects.flutter.flutter.execute_command2",
+                       fake_flutter),
+            mock.patch("builtins.input", lambda *args: "y"),
+            contextlib.redirect_stdout(io.StringIO()),
+        ]
+        for patch in patches:
+            patch.__enter__()
+            self.addCleanup(patch.__exit__, None, None, None)
+
+    def generate(self, klass: type, kwargs: dict, name: str) -> dict:
+        klass(path=self.projects, name=name, allow_install=False, **kwargs).generate()
+        return snapshot(os.path.join(self.projects, name))
+
+    def check_reference(self, klass: type, files: dict) -> None:
+        expected = dict(EXPECTED_FILES[klass], **{"README.md": README, ".gitignore": GITIGNORE})
+        self.assertEqual(sorted(files), sorted(os.path.normpath(path) for path in expected))
+        for path, start in expected.items():
+            if start is not None:
+                self.assertTrue(files[os.path.normpath(path)][0].startswith(start),
+                                f"{path}: {files[os.path.normpath(path)][0][:80]!r}")
+
+    def test_concurrent_generation(self) -> None:
+        cwd = os.getcwd()
+        references = {klass: self.generate(klass, kwargs, f"reference{index}")
+                      for index, (klass, kwargs) in enumerate(PROJECTS)}
+        # the reference trees are the expected projects (not empty nor partial)
+        for klass, files in references.items():
+            with self.subTest(reference=klass.__name__):
+                self.check_reference(klass, files)
+        jobs = [(klass, kwargs, f"project{copy}x{index}")
+                for copy in range(self.COPIES) for index, (klass, kwargs) in enumerate(PROJECTS)]
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            results = list(executor.map(
+                lambda job: self.generate(*job), jobs))
+
+        self.assertEqual(os.getcwd(), cwd)
+        for (klass, _, name), result in zip(jobs, results):
+            with self.subTest(project=name, klass=klass.__name__):
+                self.assertEqual(result, references[klass])
+        # no staging folder is left next to the projects
+        self.assertEqual([name for name in os.listdir(self.projects) if name.startswith(".")], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from project_automation.commands.package_index import PackageIndexStamp
+
+
+class PackageIndexStampTest(unittest.TestCase):
+    """
+    The index of a package manager is only stamped when its refresh succeeds.
+    """
+
+    def setUp(self) -> None:
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+        self.filename = os.path.join(self.path, "package_index.json")
+
+    def refresh(self, returncodes: list) -> bool:
+        output = io.StringIO()
+        with mock.patch("project_automation.commands.package_index.execute_command2",
+                        side_effect=returncodes) as execute, contextlib.redirect_stdout(output):
+            success = PackageIndexStamp(self.filename).refresh("apt-get")
+        self.commands = [call.args[0] for call in execute.call_args_list]
+        self.output = output.getvalue()
+        return success
+
+    def test_success(self) -> None:
+        self.assertTrue(self.refresh([0]))
+        self.assertEqual(self.commands, ["sudo apt-get update"])
+        self.assertTrue(PackageIndexStamp(self.filename).is_fresh("apt-get"))
+        # the fresh index is not refreshed again
+        self.assertTrue(self.refresh([]))
+        self.assertEqual(self.commands, [])
+
+    def test_failure(self) -> None:
+        self.assertFalse(self.refresh([100]))
+        self.assertIn("sudo apt-get update", self.output)
+        self.assertFalse(os.path.exists(self.filename))
+        self.assertFalse(PackageIndexStamp(self.filename).is_fresh("apt-get"))
+        # the stale index is refreshed again next time
+        self.assertTrue(self.refresh([0]))
+        self.assertEqual(self.commands, ["sudo apt-get update"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from project_automation.files import HTMLFile, VirtualTree, XMLFile
+
+
+class XMLFileSerializationTest(unittest.TestCase):
+    """
+    The modifications of an `XMLFile` are serialized once, with or without a virtual tree.
+    """
+
+    def setUp(self) -> None:
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+        patch = mock.patch.object(XMLFile, "write_xml", autospec=True,
+                                  side_effect=XMLFile.write_xml)
+        self.write_xml = patch.start()
+        self.addCleanup(patch.stop)
+
+    def build(self) -> HTMLFile:
+        html = HTMLFile(self.path, "index")
+        html.add_meta("width=device-width", name="viewport")
+        html.add_headlink("text/css", "stylesheet", "css/style.css")
+        html.add_style({"1": (["body"], {"margin": 0})})
+        html.add_script("js/index.js")
+        return html
+
+    def read(self) -> str:
+        with open(os.path.join(self.path, "index.html")) as file:
+            return file.read()
+
+    def test_without_tree(self) -> None:
+        html = self.build()
+        self.assertEqual(self.write_xml.call_count, 0)
+        self.assertEqual(self.read(), "")
+        html.flush()
+        html.close()
+        self.assertEqual(self.write_xml.call_count, 1)
+        self.assertTrue(self.read().startswith("<!DOCTYPE html>\n<html"))
+        self.assertIn("js/index.js", self.read())
+
+    def test_with_statement(self) -> None:
+        with HTMLFile(self.path, "index") as html:
+            html.add_script("js/index.js")
+            html.add_script("js/other.js")
+        self.assertEqual(self.write_xml.call_count, 1)
+        self.assertIn("js/other.js", self.read())
+
+    def test_read(self) -> None:
+        html = self.build()
+        self.assertIn("js/index.js", html.read())
+        self.assertIn("js/index.js", html.read())
+        self.assertEqual(self.write_xml.call_count, 1)
+
+    def test_pending_files(self) -> None:
+        html = self.build()
+        # the files of the other threads are not flushed
+        thread = threading.Thread(target=XMLFile.flush_pending)
+        thread.start()
+        thread.join()
+        self.assertEqual(self.write_xml.call_count, 0)
+        XMLFile.flush_pending()
+        self.assertEqual(self.write_xml.call_count, 1)
+        self.assertIn("js/index.js", self.read())
+        self.assertFalse(html.dirty)
+
+    def test_virtual_tree(self) -> None:
+        with VirtualTree():
+            self.build()
+            self.assertEqual(self.write_xml.call_count, 0)
+        self.assertEqual(self.write_xml.call_count, 1)
+        self.assertIn("js/index.js", self.read())
+
+
+if __name__ == "__main__":
+    unittest.main()